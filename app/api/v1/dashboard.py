@@ -3,11 +3,15 @@ Dashboard API endpoints for analytics and metrics.
 """
 import logging
 from datetime import date, datetime, timedelta
-from fastapi import APIRouter, Depends, Query
+from functools import lru_cache
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import get_stale_response
 from app.core.database import get_db
-from app.services.dashboard_service import DashboardService
+from app.core.responses import PydanticResponse
+from app.services import dashboard_service
 from app.schemas.dashboard import (
     DashboardOverview, ChartsData, RecentActivitiesResponse,
     OverviewStats, DeliveryMetrics, RouteMetrics, BoxMetrics,
@@ -24,112 +28,167 @@ router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
 # Mock Data for Demo Mode (when database is unavailable)
 # ============================================================================
 
+_MOCK_OVERVIEW_STATS = OverviewStats.model_construct(
+    total_outlets=156,
+    active_outlets=142,
+    total_orders=2847,
+    pending_orders=89,
+    orders_in_transit=45,
+    delivered_orders=2680,
+    total_routes=312,
+    active_routes=8,
+    completed_routes=298,
+    total_boxes=4521
+)
+
+_MOCK_DELIVERY_METRICS = DeliveryMetrics.model_construct(
+    delivery_success_rate=94.2,
+    avg_delivery_time_minutes=18.5,
+    on_time_delivery_rate=91.8,
+    orders_delivered_today=67,
+    orders_pending_today=23
+)
+
+_MOCK_ROUTE_METRICS = RouteMetrics.model_construct(
+    avg_stops_per_route=12.4,
+    avg_route_completion=96.8,
+    avg_distance_km=45.2,
+    avg_fuel_efficiency=8.5,
+    routes_completed_today=6,
+    routes_in_progress=3
+)
+
+_MOCK_BOX_METRICS = BoxMetrics.model_construct(
+    total_weight_kg=2847.5,
+    avg_box_weight_kg=12.4,
+    avg_fill_percentage=82.3,
+    boxes_in_transit=127,
+    fragile_boxes=45,
+    refrigerated_boxes=23
+)
+
+# (id, type, action, description, age) - timestamps are relative to "now"
+_MOCK_ACTIVITIES = (
+    (1, "order", "completed", "Order #2847 delivered to Downtown Store", timedelta(minutes=5)),
+    (2, "route", "started", "Route RT-001 started with 15 stops", timedelta(minutes=12)),
+    (3, "order", "created", "High priority order #2848 from Premium Outlet", timedelta(minutes=18)),
+    (4, "order", "completed", "Order #2845 delivered to Central Market", timedelta(minutes=25)),
+    (5, "outlet", "updated", "Outlet Downtown Store contact updated", timedelta(minutes=32)),
+    (6, "route", "completed", "Route RT-002 completed all 12 stops", timedelta(minutes=45)),
+    (7, "order", "updated", "Order #2843 marked as failed - customer unavailable", timedelta(hours=1)),
+    (8, "order", "updated", "Order #2844 confirmed and ready for packing", timedelta(hours=1, minutes=15)),
+    (9, "order", "completed", "Order #2842 delivered to Eastgate Plaza", timedelta(hours=1, minutes=30)),
+    (10, "route", "started", "Route RT-003 started with 18 stops", timedelta(hours=2)),
+)
+
+
 def get_mock_overview_stats() -> OverviewStats:
     """Return mock statistics for demo."""
-    return OverviewStats(
-        total_outlets=156,
-        active_outlets=142,
-        total_orders=2847,
-        pending_orders=89,
-        orders_in_transit=45,
-        delivered_orders=2680,
-        total_routes=312,
-        active_routes=8,
-        completed_routes=298,
-        total_boxes=4521
-    )
+    return _MOCK_OVERVIEW_STATS
 
 def get_mock_delivery_metrics() -> DeliveryMetrics:
     """Return mock delivery metrics for demo."""
-    return DeliveryMetrics(
-        delivery_success_rate=94.2,
-        avg_delivery_time_minutes=18.5,
-        on_time_delivery_rate=91.8,
-        orders_delivered_today=67,
-        orders_pending_today=23
-    )
+    return _MOCK_DELIVERY_METRICS
 
 def get_mock_route_metrics() -> RouteMetrics:
     """Return mock route metrics for demo."""
-    return RouteMetrics(
-        avg_stops_per_route=12.4,
-        avg_route_completion=96.8,
-        avg_distance_km=45.2,
-        avg_fuel_efficiency=8.5,
-        routes_completed_today=6,
-        routes_in_progress=3
-    )
+    return _MOCK_ROUTE_METRICS
 
 def get_mock_box_metrics() -> BoxMetrics:
     """Return mock box metrics for demo."""
-    return BoxMetrics(
-        total_weight_kg=2847.5,
-        avg_box_weight_kg=12.4,
-        avg_fill_percentage=82.3,
-        boxes_in_transit=127,
-        fragile_boxes=45,
-        refrigerated_boxes=23
-    )
+    return _MOCK_BOX_METRICS
 
-def get_mock_charts_data() -> ChartsData:
-    """Return mock charts data for demo."""
-    today = date.today()
-    return ChartsData(
+@lru_cache(maxsize=1)
+def _build_mock_charts_data(today: date) -> ChartsData:
+    """Build mock charts data for a given day (cached until the date rolls over)."""
+    return ChartsData.model_construct(
         order_status_distribution=[
-            OrderStatusDistribution(status="delivered", count=2680, percentage=94.1),
-            OrderStatusDistribution(status="in_transit", count=45, percentage=1.6),
-            OrderStatusDistribution(status="pending", count=89, percentage=3.1),
-            OrderStatusDistribution(status="cancelled", count=33, percentage=1.2),
+            OrderStatusDistribution.model_construct(status="delivered", count=2680, percentage=94.1),
+            OrderStatusDistribution.model_construct(status="in_transit", count=45, percentage=1.6),
+            OrderStatusDistribution.model_construct(status="pending", count=89, percentage=3.1),
+            OrderStatusDistribution.model_construct(status="cancelled", count=33, percentage=1.2),
         ],
         route_status_distribution=[
-            RouteStatusDistribution(status="completed", count=298, percentage=95.5),
-            RouteStatusDistribution(status="in_progress", count=8, percentage=2.6),
-            RouteStatusDistribution(status="planned", count=6, percentage=1.9),
+            RouteStatusDistribution.model_construct(status="completed", count=298, percentage=95.5),
+            RouteStatusDistribution.model_construct(status="in_progress", count=8, percentage=2.6),
+            RouteStatusDistribution.model_construct(status="planned", count=6, percentage=1.9),
         ],
         outlet_priority_distribution=[
-            OutletPriorityDistribution(priority="high", count=34, percentage=21.8),
-            OutletPriorityDistribution(priority="medium", count=78, percentage=50.0),
-            OutletPriorityDistribution(priority="low", count=44, percentage=28.2),
+            OutletPriorityDistribution.model_construct(priority="high", count=34, percentage=21.8),
+            OutletPriorityDistribution.model_construct(priority="medium", count=78, percentage=50.0),
+            OutletPriorityDistribution.model_construct(priority="low", count=44, percentage=28.2),
         ],
         vehicle_type_distribution=[
-            VehicleTypeDistribution(vehicle_type="truck", count=156, total_capacity_kg=15600.0),
-            VehicleTypeDistribution(vehicle_type="van", count=98, total_capacity_kg=4900.0),
-            VehicleTypeDistribution(vehicle_type="motorcycle", count=58, total_capacity_kg=580.0),
+            VehicleTypeDistribution.model_construct(vehicle_type="truck", count=156, total_capacity_kg=15600.0),
+            VehicleTypeDistribution.model_construct(vehicle_type="van", count=98, total_capacity_kg=4900.0),
+            VehicleTypeDistribution.model_construct(vehicle_type="motorcycle", count=58, total_capacity_kg=580.0),
         ],
         delivery_trends=[
-            DeliveryTrend(date=str(today - timedelta(days=6)), delivered=85, pending=4, cancelled=0),
-            DeliveryTrend(date=str(today - timedelta(days=5)), delivered=97, pending=5, cancelled=0),
-            DeliveryTrend(date=str(today - timedelta(days=4)), delivered=91, pending=4, cancelled=0),
-            DeliveryTrend(date=str(today - timedelta(days=3)), delivered=112, pending=6, cancelled=0),
-            DeliveryTrend(date=str(today - timedelta(days=2)), delivered=103, pending=4, cancelled=0),
-            DeliveryTrend(date=str(today - timedelta(days=1)), delivered=119, pending=5, cancelled=0),
-            DeliveryTrend(date=str(today), delivered=64, pending=3, cancelled=0),
+            DeliveryTrend.model_construct(date=str(today - timedelta(days=6)), delivered=85, pending=4, cancelled=0),
+            DeliveryTrend.model_construct(date=str(today - timedelta(days=5)), delivered=97, pending=5, cancelled=0),
+            DeliveryTrend.model_construct(date=str(today - timedelta(days=4)), delivered=91, pending=4, cancelled=0),
+            DeliveryTrend.model_construct(date=str(today - timedelta(days=3)), delivered=112, pending=6, cancelled=0),
+            DeliveryTrend.model_construct(date=str(today - timedelta(days=2)), delivered=103, pending=4, cancelled=0),
+            DeliveryTrend.model_construct(date=str(today - timedelta(days=1)), delivered=119, pending=5, cancelled=0),
+            DeliveryTrend.model_construct(date=str(today), delivered=64, pending=3, cancelled=0),
         ],
         top_routes=[
-            RouteEfficiency(route_code="RT-001", planned_stops=15, completed_stops=15, completion_rate=100.0, distance_km=45.2),
-            RouteEfficiency(route_code="RT-002", planned_stops=12, completed_stops=12, completion_rate=98.5, distance_km=38.7),
-            RouteEfficiency(route_code="RT-003", planned_stops=18, completed_stops=17, completion_rate=97.2, distance_km=52.1),
-            RouteEfficiency(route_code="RT-004", planned_stops=10, completed_stops=10, completion_rate=96.8, distance_km=28.4),
-            RouteEfficiency(route_code="RT-005", planned_stops=14, completed_stops=13, completion_rate=95.5, distance_km=41.9),
+            RouteEfficiency.model_construct(route_code="RT-001", planned_stops=15, completed_stops=15, completion_rate=100.0, distance_km=45.2),
+            RouteEfficiency.model_construct(route_code="RT-002", planned_stops=12, completed_stops=12, completion_rate=98.5, distance_km=38.7),
+            RouteEfficiency.model_construct(route_code="RT-003", planned_stops=18, completed_stops=17, completion_rate=97.2, distance_km=52.1),
+            RouteEfficiency.model_construct(route_code="RT-004", planned_stops=10, completed_stops=10, completion_rate=96.8, distance_km=28.4),
+            RouteEfficiency.model_construct(route_code="RT-005", planned_stops=14, completed_stops=13, completion_rate=95.5, distance_km=41.9),
         ]
     )
 
+def get_mock_charts_data() -> ChartsData:
+    """Return mock charts data for demo."""
+    return _build_mock_charts_data(date.today())
+
 def get_mock_recent_activities(limit: int = 20) -> RecentActivitiesResponse:
     """Return mock recent activities for demo."""
     now = datetime.now()
     activities = [
-        RecentActivity(id=1, type="order", action="completed", description="Order #2847 delivered to Downtown Store", timestamp=now - timedelta(minutes=5)),
-        RecentActivity(id=2, type="route", action="started", description="Route RT-001 started with 15 stops", timestamp=now - timedelta(minutes=12)),
-        RecentActivity(id=3, type="order", action="created", description="High priority order #2848 from Premium Outlet", timestamp=now - timedelta(minutes=18)),
-        RecentActivity(id=4, type="order", action="completed", description="Order #2845 delivered to Central Market", timestamp=now - timedelta(minutes=25)),
-        RecentActivity(id=5, type="outlet", action="updated", description="Outlet Downtown Store contact updated", timestamp=now - timedelta(minutes=32)),
-        RecentActivity(id=6, type="route", action="completed", description="Route RT-002 completed all 12 stops", timestamp=now - timedelta(minutes=45)),
-        RecentActivity(id=7, type="order", action="updated", description="Order #2843 marked as failed - customer unavailable", timestamp=now - timedelta(hours=1)),
-        RecentActivity(id=8, type="order", action="updated", description="Order #2844 confirmed and ready for packing", timestamp=now - timedelta(hours=1, minutes=15)),
-        RecentActivity(id=9, type="order", action="completed", description="Order #2842 delivered to Eastgate Plaza", timestamp=now - timedelta(hours=1, minutes=30)),
-        RecentActivity(id=10, type="route", action="started", description="Route RT-003 started with 18 stops", timestamp=now - timedelta(hours=2)),
+        RecentActivity.model_construct(
+            id=activity_id, type=activity_type, action=action,
+            description=description, timestamp=now - age
+        )
+        for activity_id, activity_type, action, description, age in _MOCK_ACTIVITIES[:limit]
     ]
-    return RecentActivitiesResponse(activities=activities[:limit], total=len(activities))
+    return RecentActivitiesResponse.model_construct(activities=activities, total=len(_MOCK_ACTIVITIES))
+
+
+async def _fallback(request: Request, error: Exception, get_mock) -> Response:
+    """
+    Serve the last cached response for this request when the database
+    is unavailable, falling back to mock data if nothing was cached.
+    """
+    stale = await get_stale_response(request)
+    if stale is not None:
+        logger.warning(f"Database unavailable, returning stale cached data: {error}")
+        return stale
+    logger.warning(f"Database unavailable, returning mock data: {error}")
+    return PydanticResponse(get_mock(), headers={"Cache-Control": "no-store"})
+
+
+def _mock_dashboard_overview() -> DashboardOverview:
+    """Return mock dashboard overview for demo."""
+    return DashboardOverview.model_construct(
+        stats=get_mock_overview_stats(),
+        delivery_metrics=get_mock_delivery_metrics(),
+        route_metrics=get_mock_route_metrics(),
+        box_metrics=get_mock_box_metrics()
+    )
+
+
+def warm_dashboard_serializers() -> None:
+    """Serialize each mock payload once so serializer paths are warm at startup."""
+    for get_mock in (
+        _mock_dashboard_overview,
+        get_mock_charts_data,
+        get_mock_recent_activities,
+    ):
+        PydanticResponse(get_mock())
 
 
 # ============================================================================
@@ -137,7 +196,7 @@ def get_mock_recent_activities(limit: int = 20) -> RecentActivitiesResponse:
 # ============================================================================
 
 @router.get("/overview", response_model=DashboardOverview)
-async def get_dashboard_overview(db: AsyncSession = Depends(get_db)):
+async def get_dashboard_overview(request: Request, db: AsyncSession = Depends(get_db)):
     """
     Get complete dashboard overview with all metrics.
     
@@ -148,64 +207,49 @@ async def get_dashboard_overview(db: AsyncSession = Depends(get_db)):
         - Box/packing metrics
     """
     try:
-        service = DashboardService(db)
-        return await service.get_dashboard_overview()
+        return PydanticResponse(await dashboard_service.get_dashboard_overview(db))
     except Exception as e:
-        logger.warning(f"Database unavailable, returning mock data: {e}")
-        return DashboardOverview(
-            stats=get_mock_overview_stats(),
-            delivery_metrics=get_mock_delivery_metrics(),
-            route_metrics=get_mock_route_metrics(),
-            box_metrics=get_mock_box_metrics()
-        )
+        return await _fallback(request, e, _mock_dashboard_overview)
 
 
 @router.get("/stats", response_model=OverviewStats)
-async def get_overview_stats(db: AsyncSession = Depends(get_db)):
+async def get_overview_stats(request: Request, db: AsyncSession = Depends(get_db)):
     """Get high-level system statistics."""
     try:
-        service = DashboardService(db)
-        return await service.get_overview_stats()
+        return PydanticResponse(await dashboard_service.get_overview_stats(db))
     except Exception as e:
-        logger.warning(f"Database unavailable, returning mock data: {e}")
-        return get_mock_overview_stats()
+        return await _fallback(request, e, get_mock_overview_stats)
 
 
 @router.get("/delivery-metrics", response_model=DeliveryMetrics)
-async def get_delivery_metrics(db: AsyncSession = Depends(get_db)):
+async def get_delivery_metrics(request: Request, db: AsyncSession = Depends(get_db)):
     """Get delivery performance metrics."""
     try:
-        service = DashboardService(db)
-        return await service.get_delivery_metrics()
+        return PydanticResponse(await dashboard_service.get_delivery_metrics(db))
     except Exception as e:
-        logger.warning(f"Database unavailable, returning mock data: {e}")
-        return get_mock_delivery_metrics()
+        return await _fallback(request, e, get_mock_delivery_metrics)
 
 
 @router.get("/route-metrics", response_model=RouteMetrics)
-async def get_route_metrics(db: AsyncSession = Depends(get_db)):
+async def get_route_metrics(request: Request, db: AsyncSession = Depends(get_db)):
     """Get route performance metrics."""
     try:
-        service = DashboardService(db)
-        return await service.get_route_metrics()
+        return PydanticResponse(await dashboard_service.get_route_metrics(db))
     except Exception as e:
-        logger.warning(f"Database unavailable, returning mock data: {e}")
-        return get_mock_route_metrics()
+        return await _fallback(request, e, get_mock_route_metrics)
 
 
 @router.get("/box-metrics", response_model=BoxMetrics)
-async def get_box_metrics(db: AsyncSession = Depends(get_db)):
+async def get_box_metrics(request: Request, db: AsyncSession = Depends(get_db)):
     """Get box and packing metrics."""
     try:
-        service = DashboardService(db)
-        return await service.get_box_metrics()
+        return PydanticResponse(await dashboard_service.get_box_metrics(db))
     except Exception as e:
-        logger.warning(f"Database unavailable, returning mock data: {e}")
-        return get_mock_box_metrics()
+        return await _fallback(request, e, get_mock_box_metrics)
 
 
 @router.get("/charts", response_model=ChartsData)
-async def get_charts_data(db: AsyncSession = Depends(get_db)):
+async def get_charts_data(request: Request, db: AsyncSession = Depends(get_db)):
     """
     Get all chart data for visualization.
     
@@ -218,22 +262,19 @@ async def get_charts_data(db: AsyncSession = Depends(get_db)):
         - Top performing routes
     """
     try:
-        service = DashboardService(db)
-        return await service.get_charts_data()
+        return PydanticResponse(await dashboard_service.get_charts_data(db))
     except Exception as e:
-        logger.warning(f"Database unavailable, returning mock data: {e}")
-        return get_mock_charts_data()
+        return await _fallback(request, e, get_mock_charts_data)
 
 
 @router.get("/recent-activities", response_model=RecentActivitiesResponse)
 async def get_recent_activities(
+    request: Request,
     limit: int = Query(default=20, ge=1, le=100),
     db: AsyncSession = Depends(get_db)
 ):
     """Get recent system activities."""
     try:
-        service = DashboardService(db)
-        return await service.get_recent_activities(limit=limit)
+        return PydanticResponse(await dashboard_service.get_recent_activities(db, limit=limit))
     except Exception as e:
-        logger.warning(f"Database unavailable, returning mock data: {e}")
-        return get_mock_recent_activities(limit=limit)
+        return await _fallback(request, e, lambda: get_mock_recent_activities(limit=limit))
@@ -1,20 +1,32 @@
 """
 Outlet API endpoints.
 """
-from typing import Optional
+from typing import AsyncIterator, Optional, Tuple
+
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
-from app.models.outlet import OutletPriority, OutletStatus
+from app.core.responses import PydanticResponse, orjson_default
+from app.models.outlet import Outlet
 from app.schemas.outlet import (
     OutletCreate,
     OutletUpdate,
     OutletResponse,
     OutletListResponse,
     OutletNearbyQuery,
+    OutletPriorityEnum,
+    OutletStatusEnum,
+    format_delivery_window,
+)
+from app.repositories.outlet_repository import (
+    OutletRepository,
+    DuplicateCodeError,
+    PRIORITY_TO_DB,
+    STATUS_TO_DB,
 )
-from app.repositories.outlet_repository import OutletRepository
 
 router = APIRouter(prefix="/outlets", tags=["Outlets"])
 
@@ -33,7 +45,7 @@ def get_repository(session: AsyncSession = Depends(get_db)) -> OutletRepository:
 async def create_outlet(
     outlet_data: OutletCreate,
     repo: OutletRepository = Depends(get_repository)
-) -> OutletResponse:
+) -> PydanticResponse:
     """
     Create a new retail outlet with GPS coordinates and priority.
     
@@ -42,16 +54,15 @@ async def create_outlet(
     - **gps_coordinates**: Latitude and longitude
     - **priority**: Delivery priority (critical, high, medium, low, deferred)
     """
-    # Check for duplicate code
-    existing = await repo.get_by_code(outlet_data.code)
-    if existing:
+    try:
+        outlet = await repo.create(outlet_data)
+    except DuplicateCodeError as e:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
-            detail=f"Outlet with code '{outlet_data.code}' already exists"
+            detail=str(e)
         )
     
-    outlet = await repo.create(outlet_data)
-    return _to_response(outlet)
+    return PydanticResponse(_to_response(outlet), status_code=status.HTTP_201_CREATED)
 
 
 @router.get(
@@ -62,30 +73,37 @@ async def create_outlet(
 async def list_outlets(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
-    status: Optional[str] = Query(None, description="Filter by status"),
-    priority: Optional[str] = Query(None, description="Filter by priority"),
+    status: Optional[OutletStatusEnum] = Query(None, description="Filter by status"),
+    priority: Optional[OutletPriorityEnum] = Query(None, description="Filter by priority"),
     repo: OutletRepository = Depends(get_repository)
-) -> OutletListResponse:
-    """Get paginated list of outlets with optional filters."""
-    # Convert string filters to enums
-    status_enum = OutletStatus(status) if status else None
-    priority_enum = OutletPriority[priority.upper()] if priority else None
+) -> StreamingResponse:
+    """
+    Get paginated list of outlets with optional filters.
     
-    outlets, total = await repo.get_all(
-        page=page,
-        page_size=page_size,
-        status=status_enum,
-        priority=priority_enum
+    Rows are read through a server-side cursor and the body is streamed
+    one outlet at a time with orjson, instead of building an
+    OutletListResponse for the whole page first. The first batch (the
+    whole page, as page_size <= STREAM_BATCH_SIZE) is fetched before the
+    response starts, so database errors still surface as a 500.
+    """
+    rows = repo.stream_all(
+        page,
+        page_size,
+        STATUS_TO_DB[status] if status else None,
+        PRIORITY_TO_DB[priority] if priority else None
     )
+    first = await anext(rows, None)
+    if first is not None:
+        total = first[1]
+    else:
+        total = await repo.count(
+            STATUS_TO_DB[status] if status else None,
+            PRIORITY_TO_DB[priority] if priority else None
+        ) if page > 1 else 0
     
-    pages = (total + page_size - 1) // page_size
-    
-    return OutletListResponse(
-        items=[_to_response(o) for o in outlets],
-        total=total,
-        page=page,
-        page_size=page_size,
-        pages=pages
+    return StreamingResponse(
+        _stream_outlets(first, rows, total, page, page_size),
+        media_type="application/json"
     )
 
 
@@ -99,32 +117,32 @@ async def find_nearby_outlets(
     longitude: float = Query(..., ge=-180, le=180),
     radius_km: float = Query(10.0, gt=0, le=100),
     limit: int = Query(10, ge=1, le=100),
-    priority: Optional[str] = Query(None),
+    priority: Optional[OutletPriorityEnum] = Query(None),
     repo: OutletRepository = Depends(get_repository)
-):
+) -> PydanticResponse:
     """
     Find outlets within a radius of the given coordinates.
     
     Uses PostGIS spatial indexing for efficient queries.
     Returns outlets sorted by distance.
+    Rows are trusted DB data, so they are encoded as plain dicts without
+    building or re-validating OutletResponse models.
     """
-    priority_enum = OutletPriority[priority.upper()] if priority else None
-    
     results = await repo.find_nearby(
         latitude=latitude,
         longitude=longitude,
         radius_km=radius_km,
         limit=limit,
-        priority=priority_enum
+        priority=PRIORITY_TO_DB[priority] if priority else None
     )
     
-    return [
+    return PydanticResponse([
         {
-            "outlet": _to_response(outlet),
-            "distance_km": round(distance, 2)
+            "outlet": _to_dict(outlet),
+            "distance_km": distance
         }
         for outlet, distance in results
-    ]
+    ])
 
 
 @router.get(
@@ -135,7 +153,7 @@ async def find_nearby_outlets(
 async def get_outlet(
     outlet_id: int,
     repo: OutletRepository = Depends(get_repository)
-) -> OutletResponse:
+) -> PydanticResponse:
     """Get a specific outlet by its ID."""
     outlet = await repo.get_by_id(outlet_id)
     if not outlet:
@@ -143,7 +161,7 @@ async def get_outlet(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Outlet with ID {outlet_id} not found"
         )
-    return _to_response(outlet)
+    return PydanticResponse(_to_response(outlet))
 
 
 @router.get(
@@ -154,7 +172,7 @@ async def get_outlet(
 async def get_outlet_by_code(
     code: str,
     repo: OutletRepository = Depends(get_repository)
-) -> OutletResponse:
+) -> PydanticResponse:
     """Get a specific outlet by its unique code."""
     outlet = await repo.get_by_code(code)
     if not outlet:
@@ -162,7 +180,7 @@ async def get_outlet_by_code(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Outlet with code '{code}' not found"
         )
-    return _to_response(outlet)
+    return PydanticResponse(_to_response(outlet))
 
 
 @router.patch(
@@ -174,7 +192,7 @@ async def update_outlet(
     outlet_id: int,
     update_data: OutletUpdate,
     repo: OutletRepository = Depends(get_repository)
-) -> OutletResponse:
+) -> PydanticResponse:
     """Update outlet details. Only provided fields will be updated."""
     outlet = await repo.update(outlet_id, update_data)
     if not outlet:
@@ -182,7 +200,7 @@ async def update_outlet(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Outlet with ID {outlet_id} not found"
         )
-    return _to_response(outlet)
+    return PydanticResponse(_to_response(outlet))
 
 
 @router.delete(
@@ -205,7 +223,7 @@ async def delete_outlet(
 
 def _to_response(outlet) -> OutletResponse:
     """Convert Outlet model to response schema."""
-    return OutletResponse(
+    return OutletResponse.model_construct(
         id=outlet.id,
         code=outlet.code,
         name=outlet.name,
@@ -218,7 +236,60 @@ def _to_response(outlet) -> OutletResponse:
         status=outlet.status.value,
         delivery_window_start=outlet.delivery_window_start,
         delivery_window_end=outlet.delivery_window_end,
+        delivery_window_formatted=format_delivery_window(
+            outlet.delivery_window_start, outlet.delivery_window_end
+        ),
         avg_service_time=outlet.avg_service_time,
         created_at=outlet.created_at,
         updated_at=outlet.updated_at
     )
+
+
+def _to_dict(outlet) -> dict:
+    """Convert Outlet model to a plain dict matching OutletResponse."""
+    return {
+        "id": outlet.id,
+        "code": outlet.code,
+        "name": outlet.name,
+        "address": outlet.address,
+        "contact_name": outlet.contact_name,
+        "contact_phone": outlet.contact_phone,
+        "gps_lat": outlet.gps_lat,
+        "gps_long": outlet.gps_long,
+        "priority": outlet.priority.name.lower(),
+        "status": outlet.status.value,
+        "delivery_window_start": outlet.delivery_window_start,
+        "delivery_window_end": outlet.delivery_window_end,
+        "delivery_window_formatted": format_delivery_window(
+            outlet.delivery_window_start, outlet.delivery_window_end
+        ),
+        "avg_service_time": outlet.avg_service_time,
+        "created_at": outlet.created_at,
+        "updated_at": outlet.updated_at,
+    }
+
+
+async def _stream_outlets(
+    first: Optional[Tuple[Outlet, int]],
+    rest: AsyncIterator[Tuple[Outlet, int]],
+    total: int,
+    page: int,
+    page_size: int
+) -> AsyncIterator[bytes]:
+    """
+    Yield an OutletListResponse-shaped JSON body one outlet at a time,
+    starting from the already fetched first row.
+    """
+    yield b'{"items":['
+    if first is not None:
+        yield orjson.dumps(_to_dict(first[0]), default=orjson_default)
+        async for outlet, _ in rest:
+            yield b","
+            yield orjson.dumps(_to_dict(outlet), default=orjson_default)
+    yield b"],"
+    yield orjson.dumps({
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "pages": (total + page_size - 1) // page_size,
+    })[1:]
@@ -0,0 +1,211 @@
+"""
+Redis-backed HTTP response cache for read-mostly endpoints.
+
+Entries are stored as Redis hashes keyed by path + query string. Each
+entry has a freshness TTL (per path policy) and is kept for a longer
+stale window so handlers can fall back to the last good response when
+the database is unavailable.
+"""
+import logging
+import re
+import time
+from typing import Optional
+
+import orjson
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# (path pattern, fresh TTL in seconds) - first match wins
+CACHE_TTL_POLICIES: tuple[tuple[re.Pattern, int], ...] = (
+    (re.compile(r"^/api/v1/dashboard/recent-activities$"), 10),
+    (re.compile(r"^/api/v1/dashboard/[\w-]+$"), 30),
+    (re.compile(r"^/api/v1/outlets/\d+$"), 60),
+)
+
+# Methods whose success invalidates the cached entry for their path
+WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+
+def ttl_for_path(path: str) -> Optional[int]:
+    """Return the fresh TTL for a path, or None if it is not cacheable."""
+    for pattern, ttl in CACHE_TTL_POLICIES:
+        if pattern.match(path):
+            return ttl
+    return None
+
+
+def cache_key(path: str, query_string: bytes) -> str:
+    """Build the Redis key for a request."""
+    return f"cache:{path}:{query_string.decode('latin-1')}"
+
+
+class ResponseCache:
+    """Thin async wrapper around Redis for storing rendered responses."""
+
+    def __init__(self, url: str, stale_seconds: int):
+        self._redis = Redis.from_url(url)
+        self.stale_seconds = stale_seconds
+
+    async def get(self, key: str) -> Optional[dict]:
+        """Return the cached entry for a key, or None on miss/error."""
+        try:
+            entry = await self._redis.hgetall(key)
+        except RedisError as e:
+            logger.warning(f"Response cache read failed: {e}")
+            return None
+        if not entry:
+            return None
+        return {
+            "status": int(entry[b"status"]),
+            "headers": orjson.loads(entry[b"headers"]),
+            "body": entry[b"body"],
+            "generated_at": float(entry[b"generated_at"]),
+            "stale_at": float(entry[b"stale_at"]),
+        }
+
+    async def set(
+        self,
+        key: str,
+        status: int,
+        headers: list[tuple[str, str]],
+        body: bytes,
+        ttl: int
+    ) -> None:
+        """Store a rendered response, kept for the stale window."""
+        now = time.time()
+        try:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.hset(key, mapping={
+                    "status": status,
+                    "headers": orjson.dumps(headers),
+                    "body": body,
+                    "generated_at": now,
+                    "stale_at": now + ttl,
+                })
+                pipe.expire(key, ttl + self.stale_seconds)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Response cache write failed: {e}")
+
+    async def invalidate(self, key: str) -> None:
+        """Drop a cached entry."""
+        try:
+            await self._redis.delete(key)
+        except RedisError as e:
+            logger.warning(f"Response cache invalidation failed: {e}")
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+response_cache: Optional[ResponseCache] = (
+    ResponseCache(settings.REDIS_URL, settings.CACHE_STALE_SECONDS)
+    if settings.REDIS_URL else None
+)
+
+
+def _to_response(entry: dict, cache_status: str) -> Response:
+    headers = dict(entry["headers"])
+    headers["X-Cache"] = cache_status
+    if cache_status == "STALE":
+        # Never let a stale fallback be re-stored as a fresh entry
+        headers["Cache-Control"] = "no-store"
+    return Response(content=entry["body"], status_code=entry["status"], headers=headers)
+
+
+async def get_stale_response(request: Request) -> Optional[Response]:
+    """
+    Return the last cached response for this request, even if expired.
+    Used by handlers as a fallback when the database is unavailable.
+    """
+    if response_cache is None:
+        return None
+    entry = await response_cache.get(cache_key(request.url.path, request.scope["query_string"]))
+    if entry is None:
+        return None
+    return _to_response(entry, "STALE")
+
+
+class CacheMiddleware:
+    """
+    ASGI middleware serving fresh cached GET responses from Redis.
+
+    Misses are dispatched normally and successful responses are stored.
+    Responses marked `Cache-Control: no-store` (e.g. mock/stale fallbacks)
+    are never stored. Successful writes (WRITE_METHODS) to a cacheable
+    path invalidate it; other methods pass through untouched.
+    """
+
+    def __init__(self, app: ASGIApp, cache: ResponseCache):
+        self.app = app
+        self.cache = cache
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        ttl = ttl_for_path(path)
+        if ttl is None:
+            await self.app(scope, receive, send)
+            return
+
+        key = cache_key(path, scope["query_string"])
+
+        method = scope["method"]
+        if method in WRITE_METHODS:
+            status_holder = {}
+
+            async def send_and_track(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    status_holder["status"] = message["status"]
+                await send(message)
+
+            await self.app(scope, receive, send_and_track)
+            if status_holder.get("status", 500) < 400:
+                await self.cache.invalidate(key)
+            return
+        if method != "GET":
+            # HEAD, OPTIONS, ...: neither served from nor stored in the cache
+            await self.app(scope, receive, send)
+            return
+
+        entry = await self.cache.get(key)
+        if entry is not None and entry["stale_at"] > time.time():
+            await _to_response(entry, "HIT")(scope, receive, send)
+            return
+
+        start: dict = {}
+        chunks: list[bytes] = []
+
+        async def send_and_capture(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                start.update(message)
+                headers = list(message.get("headers", []))
+                if not any(name.lower() == b"x-cache" for name, _ in headers):
+                    headers.append((b"x-cache", b"MISS"))
+                message["headers"] = headers
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+            await send(message)
+
+        await self.app(scope, receive, send_and_capture)
+
+        if start.get("status") != 200:
+            return
+        headers = [
+            (name.decode("latin-1"), value.decode("latin-1"))
+            for name, value in start.get("headers", [])
+            if name.lower() not in (b"content-length", b"x-cache")
+        ]
+        if any(name.lower() == "cache-control" and "no-store" in value for name, value in headers):
+            return
+        await self.cache.set(key, 200, headers, b"".join(chunks), ttl)
@@ -1,21 +1,36 @@
 """
 Database connection and session management.
 """
+import asyncio
+from sqlalchemy import func, text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 
 from app.core.config import settings
 
 
+# Prepared statements do not survive PgBouncer transaction pooling
+_statement_cache_size = 0 if settings.DB_PGBOUNCER else 500
+
 # Async engine for PostgreSQL with PostGIS
 # Use database_url_sync property to handle Railway's postgres:// format
+# No pre-ping (saves a SELECT 1 per checkout); stale connections are
+# recycled instead. LIFO keeps the hottest connections in use.
 engine = create_async_engine(
     settings.database_url_sync,
     echo=settings.DATABASE_ECHO,
     future=True,
-    pool_size=5,
-    max_overflow=10,
-    pool_pre_ping=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_pre_ping=False,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_use_lifo=True,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    connect_args={
+        "server_settings": {"jit": "off"},
+        "statement_cache_size": _statement_cache_size,
+        "prepared_statement_cache_size": _statement_cache_size,
+    },
 )
 
 # Async session factory
@@ -33,20 +48,58 @@ class Base(DeclarativeBase):
     pass
 
 
+# Relationship loader strategy. In debug mode accidental lazy loads
+# (N+1 queries) raise instead of silently issuing SQL; eager-load with
+# selectinload() where a relationship is needed.
+RELATIONSHIP_LAZY = "raise_on_sql" if settings.DEBUG else "select"
+
+
+def utc_now_sql():
+    """
+    SQL expression for the current UTC time as a naive timestamp.
+    Used as server-side default/onupdate for created_at/updated_at.
+    """
+    return func.timezone("utc", func.now())
+
+
 async def get_db() -> AsyncSession:
-    """Dependency for getting async database sessions."""
+    """
+    Dependency for getting async database sessions.
+    
+    Does not commit: read-only requests skip the COMMIT round-trip and
+    writers (repositories) commit explicitly.
+    """
     async with async_session_maker() as session:
         try:
             yield session
-            await session.commit()
         except Exception:
             await session.rollback()
             raise
-        finally:
-            await session.close()
+
+
+# Advisory lock key serializing init_db across workers
+INIT_DB_LOCK_KEY = 72_201_001
+
+
+async def warm_pool(size: int = settings.DB_POOL_SIZE) -> None:
+    """Open `size` pooled connections up front so first requests skip connect."""
+    async def _touch() -> None:
+        async with engine.connect() as conn:
+            await conn.exec_driver_sql("SELECT 1")
+    
+    await asyncio.gather(*(_touch() for _ in range(size)))
 
 
 async def init_db() -> None:
-    """Initialize database tables."""
+    """
+    Initialize database tables (and the DDL hooked to create_all, such
+    as the activity_log triggers).
+    
+    Every gunicorn worker runs this at startup; a transaction-scoped
+    advisory lock makes them take turns, since concurrent CREATE OR
+    REPLACE on the same function or trigger fails with "tuple
+    concurrently updated".
+    """
     async with engine.begin() as conn:
+        await conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": INIT_DB_LOCK_KEY})
         await conn.run_sync(Base.metadata.create_all)
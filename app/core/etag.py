@@ -0,0 +1,97 @@
+"""
+Conditional GET support (ETag / If-None-Match) for polled endpoints.
+"""
+import hashlib
+from typing import Optional
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Polling clients revalidate after this many seconds
+ETAG_MAX_AGE = 15
+
+
+def compute_etag(body: bytes) -> str:
+    """Strong ETag for a response body."""
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+class ETagMiddleware:
+    """
+    ASGI middleware adding ETags to successful GET responses under the
+    given path prefixes and answering matching If-None-Match with 304.
+
+    Responses that already set Cache-Control (e.g. no-store fallbacks)
+    are passed through untouched.
+    """
+
+    def __init__(self, app: ASGIApp, path_prefixes: tuple[str, ...]):
+        self.app = app
+        self.path_prefixes = path_prefixes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or not scope["path"].startswith(self.path_prefixes)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        start: Optional[Message] = None
+        chunks: list[bytes] = []
+        passthrough = False
+
+        async def send_with_etag(message: Message) -> None:
+            nonlocal start, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message.get("headers", []))
+                if message["status"] != 200 or "cache-control" in headers:
+                    passthrough = True
+                    await send(message)
+                    return
+                start = message
+                return
+
+            if message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                if message.get("more_body", False):
+                    return
+
+                body = b"".join(chunks)
+                etag = compute_etag(body)
+                raw_headers = [
+                    (name, value) for name, value in start.get("headers", [])
+                    if name.lower() != b"content-length"
+                ]
+                raw_headers.append((b"etag", etag.encode("latin-1")))
+                raw_headers.append((
+                    b"cache-control",
+                    f"max-age={ETAG_MAX_AGE}, must-revalidate".encode("latin-1")
+                ))
+
+                if etag_matches(if_none_match, etag):
+                    await send({"type": "http.response.start", "status": 304, "headers": raw_headers})
+                    await send({"type": "http.response.body", "body": b""})
+                    return
+
+                raw_headers.append((b"content-length", str(len(body)).encode("latin-1")))
+                await send({"type": "http.response.start", "status": 200, "headers": raw_headers})
+                await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_with_etag)
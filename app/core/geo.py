@@ -0,0 +1,73 @@
+"""
+Fast construction and coordinate extraction for PostGIS point geometries.
+"""
+import struct
+from typing import Optional, Tuple
+
+from geoalchemy2.elements import WKBElement
+from geoalchemy2.shape import to_shape
+
+from app.core.config import settings
+
+_WKB_POINT = 1
+_EWKB_SRID_FLAG = 0x20000000
+_EWKB_TYPE_MASK = 0x0FFFFFFF
+
+# Little-endian EWKB POINT header with the SRID flag set
+_EWKB_POINT_HEADER = struct.pack("<BII", 1, _WKB_POINT | _EWKB_SRID_FLAG, settings.SRID)
+_COORDS = struct.Struct("<dd")
+
+
+def make_point(longitude: float, latitude: float) -> WKBElement:
+    """
+    Build a PostGIS POINT element (SRID settings.SRID) from coordinates.
+
+    The 25-byte EWKB record is packed directly, without building and
+    serializing a Shapely geometry.
+    """
+    return WKBElement(
+        _EWKB_POINT_HEADER + _COORDS.pack(longitude, latitude),
+        srid=settings.SRID,
+        extended=True
+    )
+
+
+def point_xy(element) -> Optional[Tuple[float, float]]:
+    """
+    Return (x, y) for a 2D point geometry element, or None.
+
+    WKB/EWKB points are fixed-size records, so the coordinates are read
+    straight out of the bytes with struct instead of building a Shapely
+    geometry. Anything else falls back to to_shape().
+    """
+    if element is None:
+        return None
+    data = getattr(element, "data", None)
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        raw = bytes(data)
+        if len(raw) >= 21:
+            order = "<" if raw[0] == 1 else ">"
+            (geom_type,) = struct.unpack_from(f"{order}I", raw, 1)
+            if geom_type & _EWKB_TYPE_MASK == _WKB_POINT:
+                offset = 9 if geom_type & _EWKB_SRID_FLAG else 5
+                if len(raw) >= offset + 16:
+                    return struct.unpack_from(f"{order}dd", raw, offset)
+    point = to_shape(element)
+    return point.x, point.y
+
+
+def cached_point_xy(obj, attr: str) -> Optional[Tuple[float, float]]:
+    """
+    point_xy() of obj.<attr>, decoded once per geometry value.
+
+    The result is memoized on the instance next to the element it came
+    from, so repeated lat/long reads skip decoding, and assigning or
+    reloading the attribute (a new element object) invalidates it.
+    """
+    element = getattr(obj, attr)
+    cache_name = f"_{attr}_xy"
+    cached = obj.__dict__.get(cache_name)
+    if cached is None or cached[0] is not element:
+        cached = (element, point_xy(element))
+        obj.__dict__[cache_name] = cached
+    return cached[1]
@@ -0,0 +1,39 @@
+"""
+Fast JSON response classes.
+"""
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from pydantic_core import to_json, to_jsonable_python
+
+
+def orjson_default(obj: Any) -> Any:
+    """
+    Encode types orjson does not handle natively.
+    Decimals become floats (display values, not money).
+    """
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, BaseModel):
+        return to_jsonable_python(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class PydanticResponse(JSONResponse):
+    """
+    JSON response that serializes Pydantic models with their compiled serializer.
+
+    Returning this directly from a handler bypasses FastAPI's
+    jsonable_encoder and response_model re-validation. Plain Python
+    content (dicts, lists) is encoded with orjson, using orjson_default
+    for Decimal and nested models; numpy arrays and scalars are
+    encoded natively.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return to_json(content)
+        return orjson.dumps(content, default=orjson_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
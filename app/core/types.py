@@ -0,0 +1,67 @@
+"""
+Compact column types for enum-valued columns.
+"""
+import enum
+from typing import Optional, Type
+
+from sqlalchemy import CheckConstraint, SmallInteger
+from sqlalchemy.types import TypeDecorator
+
+
+class SmallIntEnum(TypeDecorator):
+    """
+    Store a Python Enum as a SMALLINT code instead of a PostgreSQL ENUM.
+
+    Integer-valued enums (priorities) are stored as their value.
+    Other enums are stored as their declaration index, so new members
+    must only ever be appended at the end of the class.
+    """
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class: Type[enum.Enum]):
+        super().__init__()
+        self.enum_class = enum_class
+        members = list(enum_class)
+        if all(isinstance(m.value, int) for m in members):
+            self._to_code = {m: m.value for m in members}
+        else:
+            self._to_code = {m: i for i, m in enumerate(members)}
+        self._from_code = {code: m for m, code in self._to_code.items()}
+
+    def code(self, member: enum.Enum) -> int:
+        """Stored code for an enum member."""
+        return self._to_code[member]
+
+    def check_sql(self, column_name: str) -> str:
+        """CHECK constraint expression covering every valid code."""
+        codes = ", ".join(str(c) for c in sorted(self._from_code))
+        return f"{column_name} IN ({codes})"
+
+    def process_bind_param(self, value, dialect) -> Optional[int]:
+        if value is None:
+            return None
+        if not isinstance(value, self.enum_class):
+            value = self.enum_class(value)
+        return self._to_code[value]
+
+    def process_literal_param(self, value, dialect) -> str:
+        code = self.process_bind_param(value, dialect)
+        return "NULL" if code is None else str(code)
+
+    def process_result_value(self, value, dialect) -> Optional[enum.Enum]:
+        if value is None:
+            return None
+        return self._from_code[value]
+
+    @property
+    def python_type(self):
+        return self.enum_class
+
+    def __repr__(self) -> str:
+        return f"SmallIntEnum({self.enum_class.__name__})"
+
+
+def enum_check(column_name: str, enum_class: Type[enum.Enum], name: str) -> CheckConstraint:
+    """CHECK constraint restricting a SmallIntEnum column to known codes."""
+    return CheckConstraint(SmallIntEnum(enum_class).check_sql(column_name), name=name)
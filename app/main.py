@@ -2,16 +2,24 @@
 Farmer's Choice - Logistics Management System
 Main FastAPI Application Entry Point
 """
+import asyncio
 from contextlib import asynccontextmanager
 from pathlib import Path
+import orjson
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 
+from app.core.cache import CacheMiddleware, response_cache
 from app.core.config import settings
-from app.core.database import init_db
+from app.core.etag import ETagMiddleware
+from app.core.database import init_db, warm_pool
+from app.core.responses import PydanticResponse
 from app.api.v1 import api_router
+from app.api.v1.dashboard import warm_dashboard_serializers
+from app.services.activity_service import run_activity_pruner
+from app.services.telemetry_service import run_telemetry_reducer
 
 # Frontend build directory
 FRONTEND_DIR = Path(__file__).parent.parent / "frontend" / "dist"
@@ -21,14 +29,32 @@ FRONTEND_DIR = Path(__file__).parent.parent / "frontend" / "dist"
 async def lifespan(app: FastAPI):
     """Application lifespan handler for startup/shutdown events."""
     # Startup
+    reducer = None
+    pruner = None
     try:
         await init_db()
+        await warm_pool()
         print("✅ Database initialized successfully")
+        if settings.TELEMETRY_REDUCE_SECONDS > 0:
+            reducer = asyncio.create_task(run_telemetry_reducer(settings.TELEMETRY_REDUCE_SECONDS))
+        if settings.ACTIVITY_LOG_RETENTION_DAYS > 0:
+            pruner = asyncio.create_task(run_activity_pruner(
+                settings.ACTIVITY_PRUNE_SECONDS, settings.ACTIVITY_LOG_RETENTION_DAYS
+            ))
     except Exception as e:
         print(f"⚠️ Database connection failed: {e}")
         print("⚠️ Running without database - some endpoints will not work")
+    # Build the OpenAPI schema and run the mock dashboard payloads through
+    # their serializers so the first real request does not pay for it
+    app.openapi()
+    warm_dashboard_serializers()
     yield
-    # Shutdown (cleanup if needed)
+    # Shutdown
+    for task in (reducer, pruner):
+        if task is not None:
+            task.cancel()
+    if response_cache is not None:
+        await response_cache.close()
 
 
 app = FastAPI(
@@ -36,8 +62,15 @@ app = FastAPI(
     version=settings.APP_VERSION,
     description="Logistics Management System for production and transport to retail outlets",
     lifespan=lifespan,
+    default_response_class=PydanticResponse,
 )
 
+# Redis response cache for read-mostly endpoints. Registered before CORS
+# so it runs inside it: cached bodies never carry another request's
+# CORS headers, and preflights are answered before reaching the cache.
+if response_cache is not None:
+    app.add_middleware(CacheMiddleware, cache=response_cache)
+
 # CORS middleware - allow frontend dev server
 app.add_middleware(
     CORSMiddleware,
@@ -47,29 +80,37 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ETag / If-None-Match revalidation for polled dashboard endpoints
+app.add_middleware(ETagMiddleware, path_prefixes=("/api/v1/dashboard/",))
+
 # Include API routes
 app.include_router(api_router)
 
 
+# Static payloads are encoded once at import
+_ROOT_BYTES = orjson.dumps({
+    "message": "Welcome to Farmer's Choice Logistics API",
+    "docs": "/docs",
+    "health": "/health",
+    "api": "/api/v1"
+})
+_HEALTH_BYTES = orjson.dumps({
+    "status": "healthy",
+    "service": settings.APP_NAME,
+    "version": settings.APP_VERSION
+})
+
+
 @app.get("/", tags=["Root"])
-async def root():
+async def root() -> Response:
     """Root endpoint - redirects to docs."""
-    return {
-        "message": "Welcome to Farmer's Choice Logistics API",
-        "docs": "/docs",
-        "health": "/health",
-        "api": "/api/v1"
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 
 @app.get("/health", tags=["Health"])
-async def health_check():
+async def health_check() -> Response:
     """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "service": settings.APP_NAME,
-        "version": settings.APP_VERSION
-    }
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 
 # Serve frontend static files in production
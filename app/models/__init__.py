@@ -4,6 +4,8 @@ from app.models.order import Order, OrderStatus, OrderPriority
 from app.models.box import Box, BoxSize, BoxStatus
 from app.models.route import Route, RouteStatus, VehicleType
 from app.models.route_node import RouteNode, NodeStatus, DeliveryResult
+from app.models.telemetry_event import TelemetryEvent, TelemetryKind
+from app.models.activity_log import ActivityLog, ActivityType
 
 __all__ = [
     # Outlet
@@ -26,4 +28,10 @@ __all__ = [
     "RouteNode",
     "NodeStatus",
     "DeliveryResult",
+    # TelemetryEvent
+    "TelemetryEvent",
+    "TelemetryKind",
+    # ActivityLog
+    "ActivityLog",
+    "ActivityType",
 ]
@@ -0,0 +1,123 @@
+"""
+ActivityLog model: feed of order/route/outlet writes for the dashboard.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+from sqlalchemy import BigInteger, Integer, String, DateTime, Index, DDL, event
+from sqlalchemy.orm import Mapped, mapped_column
+import enum
+
+from app.core.database import Base, utc_now_sql
+from app.core.types import SmallIntEnum, enum_check
+from app.models.order import Order, OrderStatus
+from app.models.route import Route, RouteStatus
+
+
+class ActivityType(enum.Enum):
+    """Kind of entity an activity refers to."""
+    ORDER = "order"
+    ROUTE = "route"
+    OUTLET = "outlet"
+
+
+class ActivityLog(Base):
+    """
+    One row per insert/update of an order, route or outlet.
+    
+    Written by AFTER INSERT / AFTER UPDATE triggers (ACTIVITY_TRIGGER_STATEMENTS),
+    so every writer is captured and the recent-activity feed is a single
+    tail scan of idx_activity_log_ts instead of a merge over three tables.
+    Updates that change nothing are not logged.
+    
+    The feed is therefore a log of writes: an entity updated several times
+    appears once per write, not once with its latest state. Rows older than
+    ACTIVITY_LOG_RETENTION_DAYS are deleted by activity_service's pruner.
+    """
+    __tablename__ = "activity_log"
+    
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    entity_type: Mapped[ActivityType] = mapped_column(SmallIntEnum(ActivityType), nullable=False)
+    entity_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    action: Mapped[str] = mapped_column(String(20), nullable=False)
+    description: Mapped[str] = mapped_column(String(300), nullable=False)
+    ts: Mapped[datetime] = mapped_column(DateTime, server_default=utc_now_sql(), nullable=False)
+    
+    __table_args__ = (
+        Index("idx_activity_log_ts", ts.desc()),
+        enum_check("entity_type", ActivityType, name="check_activity_log_entity_type"),
+    )
+    
+    def __repr__(self) -> str:
+        return f"<ActivityLog(id={self.id}, {self.entity_type.value}={self.entity_id}, action='{self.action}')>"
+
+
+_type = ActivityLog.__table__.c.entity_type.type.code
+_order_status = Order.__table__.c.status.type.code
+_route_status = Route.__table__.c.status.type.code
+
+# Status actions are logged on the transition only; later updates to a
+# delivered order or running route are plain 'updated' events
+_STATUS_CHANGED = "(TG_OP = 'INSERT' OR OLD.status IS DISTINCT FROM NEW.status)"
+
+
+def _activity_trigger_sql(
+    table: str, fn: str, entity_type: ActivityType, label: str, action: str
+) -> tuple[str, ...]:
+    """Trigger function plus insert/update triggers logging rows of `table`."""
+    function = f"""
+CREATE OR REPLACE FUNCTION {fn}() RETURNS trigger AS $$
+DECLARE
+    act text := {action};
+BEGIN
+    INSERT INTO activity_log (entity_type, entity_id, action, description)
+    VALUES ({_type(entity_type)}, NEW.id, act, {label} || ' ' || act);
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql"""
+    on_insert = f"""
+CREATE OR REPLACE TRIGGER trg_{table}_activity_insert
+    AFTER INSERT ON {table}
+    FOR EACH ROW EXECUTE FUNCTION {fn}()"""
+    on_update = f"""
+CREATE OR REPLACE TRIGGER trg_{table}_activity_update
+    AFTER UPDATE ON {table}
+    FOR EACH ROW WHEN (OLD.* IS DISTINCT FROM NEW.*)
+    EXECUTE FUNCTION {fn}()"""
+    return function, on_insert, on_update
+
+
+# One statement per entry: asyncpg prepares each DDL, which rejects
+# multi-statement strings
+ACTIVITY_TRIGGER_STATEMENTS: tuple[str, ...] = (
+    *_activity_trigger_sql(
+        "orders", "log_order_activity", ActivityType.ORDER,
+        label="'Order ' || NEW.order_number",
+        action=f"""CASE
+        WHEN NEW.status = {_order_status(OrderStatus.DELIVERED)} AND {_STATUS_CHANGED} THEN 'delivered'
+        WHEN TG_OP = 'INSERT' THEN 'created'
+        ELSE 'updated'
+    END""",
+    ),
+    *_activity_trigger_sql(
+        "routes", "log_route_activity", ActivityType.ROUTE,
+        label="'Route ' || NEW.route_code",
+        action=f"""CASE
+        WHEN NEW.status = {_route_status(RouteStatus.COMPLETED)} AND {_STATUS_CHANGED} THEN 'completed'
+        WHEN NEW.status = {_route_status(RouteStatus.IN_PROGRESS)} AND {_STATUS_CHANGED} THEN 'started'
+        WHEN TG_OP = 'INSERT' THEN 'created'
+        ELSE 'updated'
+    END""",
+    ),
+    *_activity_trigger_sql(
+        "outlets", "log_outlet_activity", ActivityType.OUTLET,
+        label="'Outlet ' || NEW.name",
+        action="CASE WHEN TG_OP = 'INSERT' THEN 'created' ELSE 'updated' END",
+    ),
+)
+
+# Installed after create_all so the logged tables exist (init_db holds an
+# advisory lock around it); migration 018 carries the same SQL for
+# existing databases
+for _statement in ACTIVITY_TRIGGER_STATEMENTS:
+    event.listen(Base.metadata, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
@@ -4,16 +4,16 @@ Box model linked to Orders with weight and sequence_index for LIFO loading.
 from __future__ import annotations
 
 from datetime import datetime
-from decimal import Decimal
 from typing import TYPE_CHECKING
 from sqlalchemy import (
-    Integer, String, DateTime, Numeric, Boolean,
-    ForeignKey, Enum as SQLEnum, Index, CheckConstraint
+    Integer, String, DateTime, Float, Boolean,
+    ForeignKey, Index, CheckConstraint, Computed
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 import enum
 
-from app.core.database import Base
+from app.core.database import Base, RELATIONSHIP_LAZY, utc_now_sql
+from app.core.types import SmallIntEnum, enum_check
 
 if TYPE_CHECKING:
     from app.models.order import Order
@@ -53,6 +53,7 @@ class Box(Base):
     delivery stop's boxes are on top (loaded last).
     """
     __tablename__ = "boxes"
+    __mapper_args__ = {"eager_defaults": True}
     
     # Primary Key
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -83,36 +84,38 @@ class Box(Base):
     )
     
     # Box Dimensions (in centimeters)
+    # Physical quantities use DOUBLE PRECISION: they are only used for
+    # arithmetic, never for exact sums, so Decimal buys nothing.
     size_category: Mapped[BoxSize] = mapped_column(
-        SQLEnum(BoxSize),
+        SmallIntEnum(BoxSize),
         default=BoxSize.MEDIUM,
         nullable=False
     )
-    length_cm: Mapped[Decimal] = mapped_column(
-        Numeric(6, 2),
+    length_cm: Mapped[float] = mapped_column(
+        Float,
         nullable=False,
         default=40.0
     )
-    width_cm: Mapped[Decimal] = mapped_column(
-        Numeric(6, 2),
+    width_cm: Mapped[float] = mapped_column(
+        Float,
         nullable=False,
         default=30.0
     )
-    height_cm: Mapped[Decimal] = mapped_column(
-        Numeric(6, 2),
+    height_cm: Mapped[float] = mapped_column(
+        Float,
         nullable=False,
         default=25.0
     )
     
     # Weight
-    weight_kg: Mapped[Decimal] = mapped_column(
-        Numeric(8, 3),
+    weight_kg: Mapped[float] = mapped_column(
+        Float,
         nullable=False,
-        default=0,
+        default=0.0,
         comment="Total weight including contents in kilograms"
     )
-    max_weight_kg: Mapped[Decimal] = mapped_column(
-        Numeric(8, 3),
+    max_weight_kg: Mapped[float] = mapped_column(
+        Float,
         nullable=False,
         default=25.0,
         comment="Maximum allowed weight"
@@ -129,16 +132,32 @@ class Box(Base):
     )
     
     # Packing Efficiency
-    volume_used_cm3: Mapped[Decimal] = mapped_column(
-        Numeric(12, 2),
+    volume_used_cm3: Mapped[float] = mapped_column(
+        Float,
         nullable=False,
-        default=0,
+        default=0.0,
         comment="Volume of contents"
     )
     
+    # Generated by PostgreSQL so aggregates never need per-row Python math
+    volume_cm3: Mapped[float] = mapped_column(
+        Float,
+        Computed("length_cm * width_cm * height_cm", persisted=True),
+        comment="Box volume (generated)"
+    )
+    fill_pct: Mapped[float] = mapped_column(
+        Float,
+        Computed(
+            "CASE WHEN length_cm * width_cm * height_cm = 0 THEN 0 "
+            "ELSE 100.0 * volume_used_cm3 / (length_cm * width_cm * height_cm) END",
+            persisted=True
+        ),
+        comment="Fill percentage of box volume (generated)"
+    )
+    
     # Status
     status: Mapped[BoxStatus] = mapped_column(
-        SQLEnum(BoxStatus),
+        SmallIntEnum(BoxStatus),
         default=BoxStatus.EMPTY,
         nullable=False
     )
@@ -154,46 +173,41 @@ class Box(Base):
     delivered_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=utc_now_sql(),
         nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=utc_now_sql(),
+        onupdate=utc_now_sql(),
         nullable=False
     )
     
     # Relationships
-    order: Mapped["Order"] = relationship("Order", back_populates="boxes")
-    route: Mapped["Route"] = relationship("Route", back_populates="boxes")
+    order: Mapped["Order"] = relationship("Order", back_populates="boxes", lazy=RELATIONSHIP_LAZY)
+    route: Mapped["Route"] = relationship("Route", back_populates="boxes", lazy=RELATIONSHIP_LAZY)
     
     __table_args__ = (
         Index("idx_box_route_sequence", route_id, sequence_index),
         Index("idx_box_order_status", order_id, status),
         CheckConstraint("weight_kg <= max_weight_kg", name="check_weight_limit"),
         CheckConstraint("sequence_index >= 0", name="check_sequence_positive"),
+        enum_check("size_category", BoxSize, name="check_box_size_category"),
+        enum_check("status", BoxStatus, name="check_box_status"),
     )
     
-    @property
-    def volume_cm3(self) -> Decimal:
-        """Calculate box volume in cubic centimeters."""
-        return self.length_cm * self.width_cm * self.height_cm
-    
     @property
     def fill_percentage(self) -> float:
-        """Calculate how full the box is."""
-        if self.volume_cm3 == 0:
-            return 0.0
-        return float(self.volume_used_cm3 / self.volume_cm3 * 100)
+        """How full the box is (generated fill_pct column)."""
+        return self.fill_pct or 0.0
     
     @property
-    def remaining_capacity_cm3(self) -> Decimal:
+    def remaining_capacity_cm3(self) -> float:
         """Calculate remaining volume capacity."""
         return self.volume_cm3 - self.volume_used_cm3
     
     @property
-    def remaining_weight_kg(self) -> Decimal:
+    def remaining_weight_kg(self) -> float:
         """Calculate remaining weight capacity."""
         return self.max_weight_kg - self.weight_kg
     
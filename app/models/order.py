@@ -7,13 +7,14 @@ from datetime import datetime, date
 from decimal import Decimal
 from typing import TYPE_CHECKING
 from sqlalchemy import (
-    Integer, String, DateTime, Date, Numeric, Text,
-    ForeignKey, Enum as SQLEnum, Index
+    Integer, String, DateTime, Date, Numeric, Float, Text,
+    ForeignKey, Index
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 import enum
 
-from app.core.database import Base
+from app.core.database import Base, RELATIONSHIP_LAZY, utc_now_sql
+from app.core.types import SmallIntEnum, enum_check
 
 if TYPE_CHECKING:
     from app.models.outlet import Outlet
@@ -49,6 +50,7 @@ class Order(Base):
     Multiple orders can be packed into boxes for efficient transport.
     """
     __tablename__ = "orders"
+    __mapper_args__ = {"eager_defaults": True}
     
     # Primary Key
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -73,14 +75,14 @@ class Order(Base):
     description: Mapped[str] = mapped_column(Text, nullable=True)
     
     # Volume and Weight (for bin packing calculations)
-    total_volume_cm3: Mapped[Decimal] = mapped_column(
-        Numeric(12, 2),
+    total_volume_cm3: Mapped[float] = mapped_column(
+        Float,
         nullable=False,
         default=0,
         comment="Total volume in cubic centimeters"
     )
-    total_weight_kg: Mapped[Decimal] = mapped_column(
-        Numeric(10, 3),
+    total_weight_kg: Mapped[float] = mapped_column(
+        Float,
         nullable=False,
         default=0,
         comment="Total weight in kilograms"
@@ -98,12 +100,12 @@ class Order(Base):
     
     # Status and Priority
     status: Mapped[OrderStatus] = mapped_column(
-        SQLEnum(OrderStatus),
+        SmallIntEnum(OrderStatus),
         default=OrderStatus.PENDING,
         nullable=False
     )
     priority: Mapped[OrderPriority] = mapped_column(
-        SQLEnum(OrderPriority),
+        SmallIntEnum(OrderPriority),
         default=OrderPriority.NORMAL,
         nullable=False
     )
@@ -126,28 +128,52 @@ class Order(Base):
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=utc_now_sql(),
         nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=utc_now_sql(),
+        onupdate=utc_now_sql(),
         nullable=False
     )
     
     # Relationships
-    outlet: Mapped["Outlet"] = relationship("Outlet", back_populates="orders")
+    outlet: Mapped["Outlet"] = relationship("Outlet", back_populates="orders", lazy=RELATIONSHIP_LAZY)
     boxes: Mapped[list["Box"]] = relationship(
         "Box",
         back_populates="order",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True,  # boxes.order_id is ON DELETE CASCADE
+        lazy=RELATIONSHIP_LAZY
     )
     
     __table_args__ = (
         Index("idx_order_outlet_status", outlet_id, status),
         Index("idx_order_delivery_date", requested_delivery_date),
         Index("idx_order_priority_status", priority, status),
+        # Open orders only: a small fraction of the table
+        Index(
+            "idx_order_active",
+            outlet_id, requested_delivery_date,
+            postgresql_where=status.column.in_([
+                OrderStatus.PENDING, OrderStatus.CONFIRMED, OrderStatus.PACKING,
+                OrderStatus.PACKED, OrderStatus.IN_TRANSIT,
+            ])
+        ),
+        # Dashboard delivery trends: per-day delivered / cancelled counts
+        Index(
+            "idx_order_delivered_date",
+            actual_delivery_date,
+            postgresql_where=status.column == OrderStatus.DELIVERED
+        ),
+        Index(
+            "idx_order_cancelled_updated",
+            updated_at,
+            postgresql_where=status.column == OrderStatus.CANCELLED
+        ),
+        enum_check("status", OrderStatus, name="check_order_status"),
+        enum_check("priority", OrderPriority, name="check_order_priority"),
     )
     
     def __repr__(self) -> str:
@@ -5,15 +5,16 @@ from __future__ import annotations
 
 from datetime import datetime
 from typing import TYPE_CHECKING
-from sqlalchemy import Integer, String, DateTime, Enum as SQLEnum, Text, Index
+from sqlalchemy import Integer, SmallInteger, String, DateTime, Float, Text, Index, Computed, inspect
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from geoalchemy2 import Geometry
-from geoalchemy2.shape import to_shape, from_shape
-from shapely.geometry import Point
+from geoalchemy2 import Geometry, Geography
+from geoalchemy2.elements import WKBElement
 import enum
 
-from app.core.database import Base
+from app.core.database import Base, RELATIONSHIP_LAZY, utc_now_sql
+from app.core.types import SmallIntEnum, enum_check
 from app.core.config import settings
+from app.core.geo import cached_point_xy, make_point
 
 if TYPE_CHECKING:
     from app.models.order import Order
@@ -44,6 +45,7 @@ class Outlet(Base):
     enabling efficient spatial queries (nearest neighbor, radius search, etc.)
     """
     __tablename__ = "outlets"
+    __mapper_args__ = {"eager_defaults": True}
     
     # Primary Key
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -60,25 +62,35 @@ class Outlet(Base):
     # Geospatial - PostGIS POINT with SRID 4326 (WGS 84)
     # Stored as POINT(longitude latitude) - note: longitude comes first in PostGIS
     location: Mapped[Geometry] = mapped_column(
-        Geometry(geometry_type="POINT", srid=settings.SRID),
+        Geometry(geometry_type="POINT", srid=settings.SRID, spatial_index=False),
         nullable=False
     )
     
+    # Same point as geography, generated by PostgreSQL so radius/KNN
+    # queries in meters read a stored value instead of casting per row.
+    # Deferred: only spatial queries need it.
+    location_geog: Mapped[Geography] = mapped_column(
+        Geography(geometry_type="POINT", srid=settings.SRID, spatial_index=False),
+        Computed(f"location::geography(Point,{settings.SRID})", persisted=True),
+        nullable=True,
+        deferred=True
+    )
+    
     # Priority & Status
     priority: Mapped[OutletPriority] = mapped_column(
-        SQLEnum(OutletPriority),
+        SmallIntEnum(OutletPriority),
         default=OutletPriority.MEDIUM,
         nullable=False
     )
     status: Mapped[OutletStatus] = mapped_column(
-        SQLEnum(OutletStatus),
+        SmallIntEnum(OutletStatus),
         default=OutletStatus.ACTIVE,
         nullable=False
     )
     
-    # Delivery Window (in minutes from midnight)
-    delivery_window_start: Mapped[int] = mapped_column(Integer, default=480, nullable=False)  # 8:00 AM
-    delivery_window_end: Mapped[int] = mapped_column(Integer, default=1080, nullable=False)   # 6:00 PM
+    # Delivery Window (in minutes from midnight, 0-1440: fits SMALLINT)
+    delivery_window_start: Mapped[int] = mapped_column(SmallInteger, default=480, nullable=False)  # 8:00 AM
+    delivery_window_end: Mapped[int] = mapped_column(SmallInteger, default=1080, nullable=False)   # 6:00 PM
     
     # Average service time in minutes (for route optimization)
     avg_service_time: Mapped[int] = mapped_column(Integer, default=15, nullable=False)
@@ -86,52 +98,95 @@ class Outlet(Base):
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
         DateTime, 
-        default=datetime.utcnow, 
+        server_default=utc_now_sql(),
         nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, 
-        default=datetime.utcnow, 
-        onupdate=datetime.utcnow,
+        server_default=utc_now_sql(),
+        onupdate=utc_now_sql(),
         nullable=False
     )
     
+    # Denormalized coordinates, generated from location by PostgreSQL so
+    # they cannot drift; read as plain floats by responses and planners
+    lat: Mapped[float] = mapped_column(
+        Float,
+        Computed("ST_Y(location)", persisted=True),
+        nullable=True
+    )
+    lng: Mapped[float] = mapped_column(
+        Float,
+        Computed("ST_X(location)", persisted=True),
+        nullable=True
+    )
+    
     # Relationships (to be added as other models are created)
     # orders: Mapped[list["Order"]] = relationship("Order", back_populates="outlet")
     
     # Relationships
-    orders: Mapped[list["Order"]] = relationship("Order", back_populates="outlet")
+    orders: Mapped[list["Order"]] = relationship("Order", back_populates="outlet", lazy=RELATIONSHIP_LAZY)
     
     # Spatial index for efficient geospatial queries
     __table_args__ = (
-        Index("idx_outlet_location", location, postgresql_using="gist"),
+        # SP-GiST: smaller and faster to probe than GiST for point-only data
+        Index("idx_outlet_location", location, postgresql_using="spgist"),
+        # Radius searches and KNN run on the stored geography column
+        Index("idx_outlet_location_geog", location_geog, postgresql_using="gist"),
         Index("idx_outlet_priority_status", priority, status),
+        # Outlet list: filter by status (and priority), ordered by priority, name, id
+        Index("idx_outlet_status_priority_name_id", status, priority, name, id),
+        Index(
+            "idx_outlet_active_priority_name_id",
+            priority, name, id,
+            postgresql_where=status.column == OutletStatus.ACTIVE
+        ),
+        enum_check("priority", OutletPriority, name="check_outlet_priority"),
+        enum_check("status", OutletStatus, name="check_outlet_status"),
     )
     
+    def _stored_coords_current(self) -> bool:
+        """
+        True when the generated lat/lng columns reflect location, i.e.
+        they are loaded and location has no unflushed change.
+        """
+        return (
+            self.lat is not None
+            and self.lng is not None
+            and not inspect(self).attrs.location.history.has_changes()
+        )
+    
     @property
     def gps_lat(self) -> float:
         """Get latitude from PostGIS point."""
-        if self.location is not None:
-            point = to_shape(self.location)
-            return point.y
-        return None
+        if self._stored_coords_current():
+            return self.lat
+        xy = cached_point_xy(self, "location")
+        return xy[1] if xy else None
     
     @property
     def gps_long(self) -> float:
         """Get longitude from PostGIS point."""
-        if self.location is not None:
-            point = to_shape(self.location)
-            return point.x
-        return None
+        if self._stored_coords_current():
+            return self.lng
+        xy = cached_point_xy(self, "location")
+        return xy[0] if xy else None
+    
+    @classmethod
+    def location_geography(cls):
+        """
+        SQL expression for the location as geography (the generated
+        location_geog column, indexed by idx_outlet_location_geog).
+        """
+        return cls.location_geog
     
     @classmethod
-    def create_location(cls, latitude: float, longitude: float) -> str:
+    def create_location(cls, latitude: float, longitude: float) -> WKBElement:
         """
-        Create a PostGIS-compatible WKT point from lat/long.
+        Create a PostGIS-compatible EWKB point from lat/long.
         Note: PostGIS uses (longitude, latitude) order.
         """
-        point = Point(longitude, latitude)
-        return from_shape(point, srid=settings.SRID)
+        return make_point(longitude, latitude)
     
     def __repr__(self) -> str:
         return f"<Outlet(id={self.id}, code='{self.code}', name='{self.name}', priority={self.priority.name})>"
@@ -4,16 +4,18 @@ Route model with Driver/Vehicle assignment.
 from __future__ import annotations
 
 from datetime import datetime, date
-from decimal import Decimal
 from typing import TYPE_CHECKING
 from sqlalchemy import (
-    Integer, String, DateTime, Date, Numeric, Text,
-    ForeignKey, Enum as SQLEnum, Index
+    Integer, String, DateTime, Date, Float, Text,
+    ForeignKey, Index, Computed, LargeBinary
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 import enum
+import numpy as np
 
-from app.core.database import Base
+from app.core.database import Base, RELATIONSHIP_LAZY, utc_now_sql
+from app.core.types import SmallIntEnum, enum_check
+from app.optim.distance import quantize_distances, dequantize_distances
 
 if TYPE_CHECKING:
     from app.models.box import Box
@@ -49,6 +51,7 @@ class Route(Base):
     multiple outlets in an optimized sequence.
     """
     __tablename__ = "routes"
+    __mapper_args__ = {"eager_defaults": True}
     
     # Primary Key
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -64,10 +67,11 @@ class Route(Base):
     description: Mapped[str] = mapped_column(Text, nullable=True)
     
     # Driver Assignment
+    # driver_id/vehicle_id lookups use the (id, planned_date) composite
+    # indexes below, which lead with the id column
     driver_id: Mapped[str] = mapped_column(
         String(50),
         nullable=True,
-        index=True,
         comment="External driver system ID"
     )
     driver_name: Mapped[str] = mapped_column(String(255), nullable=True)
@@ -77,24 +81,23 @@ class Route(Base):
     vehicle_id: Mapped[str] = mapped_column(
         String(50),
         nullable=True,
-        index=True,
         comment="External vehicle/fleet system ID"
     )
     vehicle_plate: Mapped[str] = mapped_column(String(20), nullable=True)
     vehicle_type: Mapped[VehicleType] = mapped_column(
-        SQLEnum(VehicleType),
+        SmallIntEnum(VehicleType),
         default=VehicleType.VAN,
         nullable=True
     )
     
     # Vehicle Capacity
-    max_weight_kg: Mapped[Decimal] = mapped_column(
-        Numeric(10, 2),
+    max_weight_kg: Mapped[float] = mapped_column(
+        Float,
         nullable=True,
         comment="Vehicle max payload in kg"
     )
-    max_volume_cm3: Mapped[Decimal] = mapped_column(
-        Numeric(15, 2),
+    max_volume_cm3: Mapped[float] = mapped_column(
+        Float,
         nullable=True,
         comment="Vehicle cargo volume in cm³"
     )
@@ -111,15 +114,24 @@ class Route(Base):
     # Actual Times
     actual_start_time: Mapped[datetime] = mapped_column(DateTime, nullable=True)
     actual_end_time: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    actual_duration_minutes: Mapped[int] = mapped_column(
+        Integer,
+        Computed(
+            "trunc(EXTRACT(EPOCH FROM (actual_end_time - actual_start_time)) / 60)::int",
+            persisted=True
+        ),
+        nullable=True,
+        comment="Actual route duration (generated)"
+    )
     
     # Route Metrics
-    planned_distance_km: Mapped[Decimal] = mapped_column(
-        Numeric(10, 2),
+    planned_distance_km: Mapped[float] = mapped_column(
+        Float,
         nullable=True,
         comment="Planned total distance"
     )
-    actual_distance_km: Mapped[Decimal] = mapped_column(
-        Numeric(10, 2),
+    actual_distance_km: Mapped[float] = mapped_column(
+        Float,
         nullable=True,
         comment="Actual GPS-tracked distance"
     )
@@ -134,31 +146,63 @@ class Route(Base):
         nullable=False
     )
     
+    # Generated by PostgreSQL so responses and aggregates read stored values
+    completion_pct: Mapped[float] = mapped_column(
+        Float,
+        Computed(
+            "CASE WHEN planned_stops = 0 THEN 0 "
+            "ELSE 100.0 * completed_stops / planned_stops END",
+            persisted=True
+        ),
+        comment="Completed stops as a percentage of planned (generated)"
+    )
+    
     # Load Summary
     total_boxes: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
-    total_weight_kg: Mapped[Decimal] = mapped_column(
-        Numeric(10, 2),
+    total_weight_kg: Mapped[float] = mapped_column(
+        Float,
         default=0,
         nullable=False
     )
     
+    # Planning cache: stop-to-stop distance matrix as row-major uint16 in
+    # units of distance_matrix_scale_m metres. Deferred so route queries
+    # never load it unless asked.
+    distance_matrix: Mapped[bytes] = mapped_column(
+        LargeBinary,
+        nullable=True,
+        deferred=True,
+        comment="Quantized uint16 distance matrix"
+    )
+    distance_matrix_scale_m: Mapped[int] = mapped_column(Integer, nullable=True)
+    
     # Fuel Tracking
-    fuel_start_liters: Mapped[Decimal] = mapped_column(
-        Numeric(8, 2),
+    fuel_start_liters: Mapped[float] = mapped_column(
+        Float,
         nullable=True
     )
-    fuel_end_liters: Mapped[Decimal] = mapped_column(
-        Numeric(8, 2),
+    fuel_end_liters: Mapped[float] = mapped_column(
+        Float,
         nullable=True
     )
-    fuel_consumed_liters: Mapped[Decimal] = mapped_column(
-        Numeric(8, 2),
+    fuel_consumed_liters: Mapped[float] = mapped_column(
+        Float,
         nullable=True
     )
+    fuel_efficiency: Mapped[float] = mapped_column(
+        Float,
+        Computed(
+            "CASE WHEN fuel_consumed_liters > 0 AND actual_distance_km > 0 "
+            "THEN actual_distance_km / fuel_consumed_liters END",
+            persisted=True
+        ),
+        nullable=True,
+        comment="Actual km per litre (generated)"
+    )
     
     # Status
     status: Mapped[RouteStatus] = mapped_column(
-        SQLEnum(RouteStatus),
+        SmallIntEnum(RouteStatus),
         default=RouteStatus.DRAFT,
         nullable=False
     )
@@ -166,13 +210,13 @@ class Route(Base):
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=utc_now_sql(),
         nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=utc_now_sql(),
+        onupdate=utc_now_sql(),
         nullable=False
     )
     
@@ -180,43 +224,79 @@ class Route(Base):
     boxes: Mapped[list["Box"]] = relationship(
         "Box",
         back_populates="route",
-        order_by="Box.sequence_index"
+        order_by="Box.sequence_index",
+        lazy=RELATIONSHIP_LAZY
     )
     route_nodes: Mapped[list["RouteNode"]] = relationship(
         "RouteNode",
         back_populates="route",
         cascade="all, delete-orphan",
-        order_by="RouteNode.sequence_order"
+        passive_deletes=True,  # route_nodes.route_id is ON DELETE CASCADE
+        order_by="RouteNode.sequence_order",
+        lazy=RELATIONSHIP_LAZY
     )
     
     __table_args__ = (
         Index("idx_route_date_status", planned_date, status),
         Index("idx_route_driver_date", driver_id, planned_date),
         Index("idx_route_vehicle_date", vehicle_id, planned_date),
+        # Routes not yet finished
+        Index(
+            "idx_route_live_date",
+            planned_date,
+            postgresql_where=status.column.in_([
+                RouteStatus.PLANNED, RouteStatus.ASSIGNED, RouteStatus.IN_PROGRESS,
+            ])
+        ),
+        enum_check("vehicle_type", VehicleType, name="check_route_vehicle_type"),
+        enum_check("status", RouteStatus, name="check_route_status"),
     )
     
     @property
     def fuel_efficiency_km_per_liter(self) -> float | None:
-        """Calculate fuel efficiency."""
-        if self.fuel_consumed_liters and self.actual_distance_km:
-            if self.fuel_consumed_liters > 0:
-                return float(self.actual_distance_km / self.fuel_consumed_liters)
-        return None
+        """Fuel efficiency in km/L (generated fuel_efficiency column)."""
+        return self.fuel_efficiency
     
     @property
     def duration_minutes(self) -> int | None:
-        """Calculate actual route duration in minutes."""
-        if self.actual_start_time and self.actual_end_time:
-            delta = self.actual_end_time - self.actual_start_time
-            return int(delta.total_seconds() / 60)
-        return None
+        """Actual route duration in minutes (generated column)."""
+        return self.actual_duration_minutes
+    
+    def set_distance_matrix(self, distances_km: np.ndarray) -> None:
+        """Store a square float distance matrix (km) quantized to uint16."""
+        distances_km = np.asarray(distances_km)
+        if distances_km.ndim != 2 or distances_km.shape[0] != distances_km.shape[1]:
+            raise ValueError(f"distance matrix must be square, got shape {distances_km.shape}")
+        quantized, scale_m = quantize_distances(distances_km)
+        self.distance_matrix = quantized.tobytes()
+        self.distance_matrix_scale_m = scale_m
+    
+    def get_distance_matrix(self) -> np.ndarray | None:
+        """
+        Get the cached quantized uint16 matrix (read by solver kernels).
+        
+        distance_matrix is deferred: load it first with
+        RouteRepository.with_distance_matrix(), undefer(Route.distance_matrix)
+        or `await session.refresh(route, ["distance_matrix"])`, since an
+        implicit lazy load fails under AsyncSession.
+        """
+        if self.distance_matrix is None:
+            return None
+        quantized = np.frombuffer(self.distance_matrix, dtype=np.uint16)
+        n = int(round(quantized.size ** 0.5))
+        return quantized.reshape(n, n)
+    
+    def get_distance_matrix_km(self) -> np.ndarray | None:
+        """Get the cached distance matrix converted back to kilometres."""
+        quantized = self.get_distance_matrix()
+        if quantized is None:
+            return None
+        return dequantize_distances(quantized, self.distance_matrix_scale_m)
     
     @property
     def completion_percentage(self) -> float:
-        """Calculate route completion percentage."""
-        if self.planned_stops == 0:
-            return 0.0
-        return (self.completed_stops / self.planned_stops) * 100
+        """Route completion percentage (generated completion_pct column)."""
+        return self.completion_pct or 0.0
     
     def __repr__(self) -> str:
         return f"<Route(id={self.id}, code='{self.route_code}', driver='{self.driver_id}', status={self.status.value})>"
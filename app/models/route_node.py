@@ -1,24 +1,22 @@
 """
 RouteNode model for telemetry logs with arrival/departure timestamps.
-Designed for TimescaleDB hypertable for efficient time-series queries.
 """
 from __future__ import annotations
 
 from datetime import datetime
-from decimal import Decimal
 from typing import TYPE_CHECKING
 from sqlalchemy import (
-    Integer, String, DateTime, Numeric, Text, Boolean,
-    ForeignKey, Enum as SQLEnum, Index, UniqueConstraint
+    Integer, String, DateTime, Float, Text, Boolean,
+    ForeignKey, Index, UniqueConstraint, Computed
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from geoalchemy2 import Geometry
-from geoalchemy2.shape import to_shape, from_shape
-from shapely.geometry import Point
 import enum
 
-from app.core.database import Base
+from app.core.database import Base, RELATIONSHIP_LAZY, utc_now_sql
+from app.core.types import SmallIntEnum, enum_check
 from app.core.config import settings
+from app.core.geo import cached_point_xy, make_point
 
 if TYPE_CHECKING:
     from app.models.route import Route
@@ -57,10 +55,11 @@ class RouteNode(Base):
     - Delivery status and outcome
     - Real-time telemetry data
     
-    Designed as a TimescaleDB hypertable partitioned by arrival_time
-    for efficient time-series queries and automatic data retention.
+    Time-range scans on arrival_time use a BRIN index; dashboards read
+    hourly rollups from the route_node_hourly_deliveries materialized view.
     """
     __tablename__ = "route_nodes"
+    __mapper_args__ = {"eager_defaults": True}
     
     # Primary Key
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -112,8 +111,7 @@ class RouteNode(Base):
     arrival_time: Mapped[datetime] = mapped_column(
         DateTime,
         nullable=True,
-        index=True,
-        comment="Actual arrival timestamp - TimescaleDB partition key"
+        comment="Actual arrival timestamp"
     )
     departure_time: Mapped[datetime] = mapped_column(
         DateTime,
@@ -121,37 +119,51 @@ class RouteNode(Base):
         comment="Actual departure timestamp"
     )
     
-    # Service Time (derived from arrival/departure)
+    # Service time and delay, generated by PostgreSQL from the timestamps
+    # (whole minutes, truncated) so reads and SLA queries need no Python math
     service_time_minutes: Mapped[int] = mapped_column(
         Integer,
+        Computed(
+            "trunc(EXTRACT(EPOCH FROM (departure_time - arrival_time)) / 60)::int",
+            persisted=True
+        ),
         nullable=True,
-        comment="Calculated time spent at stop"
+        comment="Time spent at stop (generated)"
+    )
+    delay_minutes: Mapped[int] = mapped_column(
+        Integer,
+        Computed(
+            "trunc(EXTRACT(EPOCH FROM (arrival_time - planned_arrival_time)) / 60)::int",
+            persisted=True
+        ),
+        nullable=True,
+        comment="Arrival delay versus ETA (generated)"
     )
     
     # Distance & Fuel Telemetry
-    distance_from_previous_km: Mapped[Decimal] = mapped_column(
-        Numeric(8, 2),
+    distance_from_previous_km: Mapped[float] = mapped_column(
+        Float,
         nullable=True,
         comment="Distance from previous stop"
     )
-    cumulative_distance_km: Mapped[Decimal] = mapped_column(
-        Numeric(10, 2),
+    cumulative_distance_km: Mapped[float] = mapped_column(
+        Float,
         nullable=True,
         comment="Total distance from route start"
     )
-    fuel_consumed_liters: Mapped[Decimal] = mapped_column(
-        Numeric(6, 2),
+    fuel_consumed_liters: Mapped[float] = mapped_column(
+        Float,
         nullable=True,
         comment="Fuel used since previous stop"
     )
     
     # Odometer Readings
-    odometer_arrival_km: Mapped[Decimal] = mapped_column(
-        Numeric(10, 2),
+    odometer_arrival_km: Mapped[float] = mapped_column(
+        Float,
         nullable=True
     )
-    odometer_departure_km: Mapped[Decimal] = mapped_column(
-        Numeric(10, 2),
+    odometer_departure_km: Mapped[float] = mapped_column(
+        Float,
         nullable=True
     )
     
@@ -161,12 +173,12 @@ class RouteNode(Base):
     
     # Status
     status: Mapped[NodeStatus] = mapped_column(
-        SQLEnum(NodeStatus),
+        SmallIntEnum(NodeStatus),
         default=NodeStatus.PENDING,
         nullable=False
     )
     delivery_result: Mapped[DeliveryResult] = mapped_column(
-        SQLEnum(DeliveryResult),
+        SmallIntEnum(DeliveryResult),
         nullable=True
     )
     
@@ -182,8 +194,8 @@ class RouteNode(Base):
         nullable=True,
         comment="Whether arrival GPS was within outlet geofence"
     )
-    geofence_distance_meters: Mapped[Decimal] = mapped_column(
-        Numeric(8, 2),
+    geofence_distance_meters: Mapped[float] = mapped_column(
+        Float,
         nullable=True,
         comment="Distance from outlet center at arrival"
     )
@@ -191,69 +203,89 @@ class RouteNode(Base):
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=utc_now_sql(),
         nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=utc_now_sql(),
+        onupdate=utc_now_sql(),
         nullable=False
     )
     
     # Relationships
-    route: Mapped["Route"] = relationship("Route", back_populates="route_nodes")
-    outlet: Mapped["Outlet"] = relationship("Outlet")
+    route: Mapped["Route"] = relationship("Route", back_populates="route_nodes", lazy=RELATIONSHIP_LAZY)
+    outlet: Mapped["Outlet"] = relationship("Outlet", lazy=RELATIONSHIP_LAZY)
     
     __table_args__ = (
         # Composite indexes for common queries
         Index("idx_route_node_route_sequence", route_id, sequence_order),
-        Index("idx_route_node_arrival_time", arrival_time),
+        # Telemetry is appended in arrival order, so a BRIN index is a
+        # fraction of the size of a B-tree for time-range scans
+        Index(
+            "idx_route_node_arrival_time_brin",
+            arrival_time,
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32}
+        ),
         Index("idx_route_node_outlet_time", outlet_id, arrival_time),
         Index("idx_route_node_status", status),
+        # Dashboard average service time reads this index only
+        Index(
+            "idx_route_node_completed_service",
+            service_time_minutes,
+            postgresql_where=status.column == NodeStatus.COMPLETED
+        ),
+        # Stops still to be worked
+        Index(
+            "idx_route_node_live",
+            route_id, sequence_order,
+            postgresql_where=status.column.notin_([
+                NodeStatus.COMPLETED, NodeStatus.SKIPPED, NodeStatus.FAILED,
+            ])
+        ),
+        # Late arrivals for SLA monitoring
+        Index(
+            "idx_route_node_late_arrivals",
+            outlet_id, arrival_time,
+            postgresql_where=delay_minutes > 15
+        ),
         
         # Spatial index for arrival location
         Index("idx_route_node_arrival_location", arrival_location, postgresql_using="gist"),
         
         # Unique constraint: one stop per outlet per route
         UniqueConstraint("route_id", "outlet_id", name="uq_route_outlet"),
+        enum_check("status", NodeStatus, name="check_route_node_status"),
+        enum_check("delivery_result", DeliveryResult, name="check_route_node_delivery_result"),
     )
     
     @classmethod
     def create_point(cls, latitude: float, longitude: float):
         """Create a PostGIS point from coordinates."""
-        point = Point(longitude, latitude)
-        return from_shape(point, srid=settings.SRID)
+        return make_point(longitude, latitude)
     
     @property
     def arrival_lat(self) -> float | None:
         """Get arrival latitude."""
-        if self.arrival_location:
-            return to_shape(self.arrival_location).y
-        return None
+        xy = cached_point_xy(self, "arrival_location")
+        return xy[1] if xy else None
     
     @property
     def arrival_long(self) -> float | None:
         """Get arrival longitude."""
-        if self.arrival_location:
-            return to_shape(self.arrival_location).x
-        return None
+        xy = cached_point_xy(self, "arrival_location")
+        return xy[0] if xy else None
     
     @property
     def calculated_service_time(self) -> int | None:
-        """Calculate service time from timestamps."""
-        if self.arrival_time and self.departure_time:
-            delta = self.departure_time - self.arrival_time
-            return int(delta.total_seconds() / 60)
-        return None
+        """Service time in minutes (generated service_time_minutes column)."""
+        return self.service_time_minutes
     
     @property
     def arrival_delay_minutes(self) -> int | None:
-        """Calculate delay from planned arrival."""
-        if self.planned_arrival_time and self.arrival_time:
-            delta = self.arrival_time - self.planned_arrival_time
-            return int(delta.total_seconds() / 60)
-        return None
+        """Delay from planned arrival (generated delay_minutes column)."""
+        return self.delay_minutes
     
     @property
     def is_on_time(self) -> bool | None:
@@ -283,11 +315,6 @@ class RouteNode(Base):
         """Record driver departure from this stop."""
         self.departure_time = timestamp or datetime.utcnow()
         self.departure_location = self.create_point(latitude, longitude)
-        
-        # Calculate service time
-        if self.arrival_time:
-            delta = self.departure_time - self.arrival_time
-            self.service_time_minutes = int(delta.total_seconds() / 60)
     
     def __repr__(self) -> str:
         return f"<RouteNode(id={self.id}, route={self.route_id}, outlet={self.outlet_id}, seq={self.sequence_order}, status={self.status.value})>"
@@ -0,0 +1,46 @@
+"""
+TelemetryEvent model: append-only buffer of driver arrival/departure pings.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+from sqlalchemy import BigInteger, Integer, DateTime, Float
+from sqlalchemy.orm import Mapped, mapped_column
+import enum
+
+from app.core.database import Base
+from app.core.types import SmallIntEnum, enum_check
+
+
+class TelemetryKind(enum.Enum):
+    """Kind of telemetry ping."""
+    ARRIVAL = "arrival"
+    DEPARTURE = "departure"
+
+
+class TelemetryEvent(Base):
+    """
+    Raw driver ping waiting to be reduced into route_nodes.
+    
+    Pings are only ever appended (one multi-row INSERT per batch) and
+    periodically folded into route_nodes with a single set-based UPDATE,
+    instead of one ORM UPDATE per ping. The table is UNLOGGED: it is a
+    short-lived buffer, so skipping WAL is worth losing unreduced pings
+    on a crash. No foreign key or secondary index, to keep appends cheap.
+    """
+    __tablename__ = "telemetry_events"
+    
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    route_node_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    kind: Mapped[TelemetryKind] = mapped_column(SmallIntEnum(TelemetryKind), nullable=False)
+    ts: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    lng: Mapped[float] = mapped_column(Float, nullable=False)
+    lat: Mapped[float] = mapped_column(Float, nullable=False)
+    
+    __table_args__ = (
+        enum_check("kind", TelemetryKind, name="check_telemetry_event_kind"),
+        {"prefixes": ["UNLOGGED"]},
+    )
+    
+    def __repr__(self) -> str:
+        return f"<TelemetryEvent(id={self.id}, node={self.route_node_id}, kind={self.kind.value}, ts={self.ts})>"
@@ -0,0 +1,4 @@
+# Numeric kernels for route planning
+from app.optim.distance import pairwise_haversine, quantize_distances, dequantize_distances
+
+__all__ = ["pairwise_haversine", "quantize_distances", "dequantize_distances"]
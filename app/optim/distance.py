@@ -0,0 +1,63 @@
+"""
+Vectorized great-circle distance matrices for route planning.
+"""
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0088
+
+# Rows per block: keeps each block's float64 temporaries within cache
+# for large N instead of materializing several NxN intermediates
+_BLOCK_ROWS = 256
+
+
+def pairwise_haversine(lat, lng, block_rows: int = _BLOCK_ROWS) -> np.ndarray:
+    """
+    NxN haversine distance matrix in kilometres, as float32.
+
+    `lat` and `lng` are 1-D sequences of degrees (e.g. the lat/lng
+    columns from OutletRepository.get_coordinates). Work is done in
+    NumPy over contiguous arrays, one block of rows at a time.
+    """
+    lat_r = np.radians(np.ascontiguousarray(lat, dtype=np.float64))
+    lng_r = np.radians(np.ascontiguousarray(lng, dtype=np.float64))
+    if lat_r.shape != lng_r.shape or lat_r.ndim != 1:
+        raise ValueError("lat and lng must be 1-D arrays of the same length")
+    
+    n = lat_r.shape[0]
+    cos_lat = np.cos(lat_r)
+    out = np.empty((n, n), dtype=np.float32)
+    
+    for start in range(0, n, block_rows):
+        stop = min(start + block_rows, n)
+        dlat = lat_r[None, :] - lat_r[start:stop, None]
+        dlng = lng_r[None, :] - lng_r[start:stop, None]
+        a = (
+            np.sin(dlat * 0.5) ** 2
+            + cos_lat[start:stop, None] * cos_lat[None, :] * np.sin(dlng * 0.5) ** 2
+        )
+        np.clip(a, 0.0, 1.0, out=a)
+        out[start:stop] = 2.0 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+    
+    return out
+
+
+def quantize_distances(distances_km: np.ndarray) -> tuple[np.ndarray, int]:
+    """
+    Quantize a distance matrix (km) to uint16 for solver kernels.
+
+    Returns (matrix, scale_m): each cell holds distance / scale_m metres,
+    rounded. scale_m is 1 (metre resolution, up to ~65 km) and grows only
+    when the longest leg does not fit, so a matrix is a quarter of float64
+    size and more of it stays in cache while solvers iterate.
+    """
+    metres = np.asarray(distances_km, dtype=np.float64) * 1000.0
+    longest = float(metres.max()) if metres.size else 0.0
+    scale_m = max(1, int(np.ceil(longest / np.iinfo(np.uint16).max)))
+    quantized = np.rint(metres / scale_m)
+    np.clip(quantized, 0, np.iinfo(np.uint16).max, out=quantized)
+    return quantized.astype(np.uint16), scale_m
+
+
+def dequantize_distances(quantized: np.ndarray, scale_m: int) -> np.ndarray:
+    """Convert a quantized uint16 matrix back to float32 kilometres."""
+    return quantized.astype(np.float32) * np.float32(scale_m / 1000.0)
@@ -1,4 +1,15 @@
 # Repositories
-from app.repositories.outlet_repository import OutletRepository
+from app.repositories.outlet_repository import OutletRepository, DuplicateCodeError
+from app.repositories.order_repository import OrderRepository
+from app.repositories.route_repository import RouteRepository
+from app.repositories.route_node_repository import RouteNodeRepository
+from app.repositories.telemetry_repository import TelemetryRepository
 
-__all__ = ["OutletRepository"]
+__all__ = [
+    "OutletRepository",
+    "DuplicateCodeError",
+    "OrderRepository",
+    "RouteRepository",
+    "RouteNodeRepository",
+    "TelemetryRepository",
+]
@@ -0,0 +1,38 @@
+"""
+Repository for Order data access.
+"""
+from typing import Any, Dict, List
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.order import Order
+
+
+class OrderRepository:
+    """
+    Data access layer for Order entities.
+    Provides bulk ingestion for order imports.
+    """
+    
+    def __init__(self, session: AsyncSession):
+        self.session = session
+    
+    async def bulk_create(self, rows: List[Dict[str, Any]]) -> List[int]:
+        """
+        Insert many orders in one batched statement.
+        Returns the new ids, in the same order as `rows`.
+        
+        Rows are plain column dicts (all with the same keys). They bypass
+        the ORM unit of work; SQLAlchemy batches them into multi-row
+        INSERT ... VALUES ... RETURNING id statements (insertmanyvalues).
+        """
+        if not rows:
+            return []
+        
+        result = await self.session.execute(
+            insert(Order).returning(Order.id, sort_by_parameter_order=True),
+            rows
+        )
+        ids = list(result.scalars().all())
+        await self.session.commit()
+        return ids
@@ -1,14 +1,137 @@
 """
 Repository for Outlet data access with PostGIS spatial queries.
 """
-from typing import Optional, List, Tuple
-from sqlalchemy import select, func, and_
-from sqlalchemy.ext.asyncio import AsyncSession
-from geoalchemy2.functions import ST_DWithin, ST_Distance, ST_MakePoint, ST_SetSRID
+import asyncio
+import math
+from typing import AsyncIterator, Optional, List, Tuple
+from sqlalchemy import select, update, delete, func, cast, lambda_stmt, literal, text, Float, Integer, Numeric, String
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from geoalchemy2.functions import ST_DWithin, ST_Distance, ST_Expand, ST_GeogFromText, ST_GeomFromEWKT
 
 from app.models.outlet import Outlet, OutletPriority, OutletStatus
-from app.schemas.outlet import OutletCreate, OutletUpdate, OutletPriorityEnum
+from app.schemas.outlet import OutletCreate, OutletUpdate, OutletPriorityEnum, OutletStatusEnum
 from app.core.config import settings
+from app.core.database import async_session_maker
+from app.optim.distance import EARTH_RADIUS_KM
+
+
+# API enum -> database enum, built once and shared with the outlet
+# router. The API enums are str-valued, so plain strings like "high"
+# look up the same entries.
+PRIORITY_TO_DB = {e: OutletPriority[e.name] for e in OutletPriorityEnum}
+STATUS_TO_DB = {e: OutletStatus[e.name] for e in OutletStatusEnum}
+
+_priority_code = Outlet.__table__.c.priority.type.code
+_status_code = Outlet.__table__.c.status.type.code
+
+# Columns COPYed by create_many(); the point is sent as lng/lat floats
+# and built server-side
+_COPY_COLUMNS = (
+    "code", "name", "address", "contact_name", "contact_phone",
+    "lng", "lat", "priority",
+    "delivery_window_start", "delivery_window_end", "avg_service_time",
+)
+
+_CREATE_COPY_STAGING = text("""
+    CREATE TEMP TABLE outlet_staging (
+        code text NOT NULL,
+        name text NOT NULL,
+        address text,
+        contact_name text,
+        contact_phone text,
+        lng double precision NOT NULL,
+        lat double precision NOT NULL,
+        priority smallint NOT NULL,
+        delivery_window_start integer NOT NULL,
+        delivery_window_end integer NOT NULL,
+        avg_service_time integer NOT NULL
+    ) ON COMMIT DROP
+""")
+
+_INSERT_FROM_COPY_STAGING = text(f"""
+    INSERT INTO outlets (
+        code, name, address, contact_name, contact_phone,
+        location, priority, status,
+        delivery_window_start, delivery_window_end, avg_service_time
+    )
+    SELECT
+        code, name, address, contact_name, contact_phone,
+        ST_SetSRID(ST_MakePoint(lng, lat), {settings.SRID}),
+        priority, {_status_code(OutletStatus.ACTIVE)},
+        delivery_window_start, delivery_window_end, avg_service_time
+    FROM outlet_staging
+    ON CONFLICT (code) DO NOTHING
+""")
+
+
+class DuplicateCodeError(Exception):
+    """Raised when an outlet with the same unique code already exists."""
+    
+    def __init__(self, code: str):
+        self.code = code
+        super().__init__(f"Outlet with code '{code}' already exists")
+
+
+def _id_table(ids: List[int], with_ordinality: bool = False):
+    """
+    unnest(:ids) AS ids(id): a list of ids bound as one array parameter.
+    Joining against it keeps the statement text (and its cached plan)
+    the same for any number of ids, unlike an expanding IN list.
+    
+    with_ordinality adds an "ord" column holding each id's 1-based
+    position in the (de-duplicated) input list.
+    """
+    unnest = func.unnest(literal(list(dict.fromkeys(ids)), ARRAY(Integer)))
+    if with_ordinality:
+        table = unnest.table_valued("id", with_ordinality="ord")
+    else:
+        table = unnest.table_valued("id")
+    return table.render_derived(name="ids")
+
+
+def _point_ewkt(latitude: float, longitude: float):
+    """
+    'SRID=4326;POINT(lng lat)' as a single bound parameter, parsed once
+    server-side by ST_GeogFromText / ST_GeomFromEWKT instead of a
+    ST_MakePoint + ST_SetSRID + cast chain.
+    """
+    return literal(f"SRID={settings.SRID};POINT({longitude!r} {latitude!r})", String)
+
+
+# Rows fetched per server-side cursor round-trip when streaming
+STREAM_BATCH_SIZE = 200
+
+# find_nearby adds a geometry bbox (&&) prefilter from this radius up;
+# below it the ST_DWithin index probe is already tight enough
+BBOX_PREFILTER_MIN_KM = 5.0
+
+# Slack over the spherical extent, covering the spheroid ST_DWithin measures on
+_BBOX_SLACK = 1.1
+
+
+def _bbox_half_widths(latitude: float, longitude: float, radius_km: float) -> Optional[Tuple[float, float]]:
+    """
+    (deg_lng, deg_lat) half-widths of a plain-degree box around the point
+    that contains every location within radius_km of it.
+
+    Returns None when no such box exists: the circle reaches a pole (every
+    longitude is in range) or crosses the ±180° meridian (a degree box
+    does not wrap), so the caller must rely on ST_DWithin alone.
+    """
+    angle = radius_km / EARTH_RADIUS_KM
+    deg_lat = math.degrees(angle) * _BBOX_SLACK
+    if abs(latitude) + deg_lat >= 90:
+        return None
+    # Longitude half-width of a spherical cap: asin(sin(r/R) / cos(lat))
+    ratio = math.sin(angle) / math.cos(math.radians(latitude))
+    if angle >= math.pi / 2 or ratio >= 1:
+        return None
+    deg_lng = math.degrees(math.asin(ratio)) * _BBOX_SLACK
+    if abs(longitude) + deg_lng > 180:
+        return None
+    return deg_lng, deg_lat
 
 
 class OutletRepository:
@@ -21,9 +144,14 @@ class OutletRepository:
         self.session = session
     
     async def create(self, outlet_data: OutletCreate) -> Outlet:
-        """Create a new outlet."""
+        """
+        Create a new outlet.
+        
+        Uses a single INSERT ... ON CONFLICT (code) DO NOTHING RETURNING
+        round-trip; raises DuplicateCodeError if the code is taken.
+        """
         # Convert priority enum from API to database enum
-        db_priority = OutletPriority[outlet_data.priority.name]
+        db_priority = PRIORITY_TO_DB[outlet_data.priority]
         
         # Create PostGIS point from coordinates
         location = Outlet.create_location(
@@ -31,35 +159,84 @@ class OutletRepository:
             longitude=outlet_data.gps_coordinates.longitude
         )
         
-        outlet = Outlet(
-            code=outlet_data.code,
-            name=outlet_data.name,
-            address=outlet_data.address,
-            contact_name=outlet_data.contact_name,
-            contact_phone=outlet_data.contact_phone,
-            location=location,
-            priority=db_priority,
-            delivery_window_start=outlet_data.delivery_window.start_minutes,
-            delivery_window_end=outlet_data.delivery_window.end_minutes,
-            avg_service_time=outlet_data.avg_service_time,
+        stmt = (
+            insert(Outlet)
+            .values(
+                code=outlet_data.code,
+                name=outlet_data.name,
+                address=outlet_data.address,
+                contact_name=outlet_data.contact_name,
+                contact_phone=outlet_data.contact_phone,
+                location=location,
+                priority=db_priority,
+                delivery_window_start=outlet_data.delivery_window.start_minutes,
+                delivery_window_end=outlet_data.delivery_window.end_minutes,
+                avg_service_time=outlet_data.avg_service_time,
+            )
+            .on_conflict_do_nothing(index_elements=[Outlet.code])
+            .returning(Outlet)
         )
         
-        self.session.add(outlet)
-        await self.session.flush()
-        await self.session.refresh(outlet)
+        result = await self.session.execute(stmt)
+        outlet = result.scalar_one_or_none()
+        if outlet is None:
+            raise DuplicateCodeError(outlet_data.code)
+        await self.session.commit()
         return outlet
     
+    async def create_many(self, outlets: List[OutletCreate]) -> int:
+        """
+        Bulk-create outlets with COPY. Returns the number of rows inserted.
+        
+        Rows are COPYed in binary form into a temporary staging table,
+        then moved into outlets with one INSERT ... SELECT that builds the
+        locations. Outlets whose code already exists (in the table or
+        earlier in the batch) are skipped rather than failing the import.
+        """
+        records = [
+            (
+                outlet.code,
+                outlet.name,
+                outlet.address,
+                outlet.contact_name,
+                outlet.contact_phone,
+                outlet.gps_coordinates.longitude,
+                outlet.gps_coordinates.latitude,
+                _priority_code(PRIORITY_TO_DB[outlet.priority]),
+                outlet.delivery_window.start_minutes,
+                outlet.delivery_window.end_minutes,
+                outlet.avg_service_time,
+            )
+            for outlet in outlets
+        ]
+        if not records:
+            return 0
+        
+        conn = await self.session.connection()
+        await conn.execute(_CREATE_COPY_STAGING)
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            "outlet_staging", records=records, columns=_COPY_COLUMNS
+        )
+        result = await conn.execute(_INSERT_FROM_COPY_STAGING)
+        await self.session.commit()
+        return result.rowcount
+    
+    # Hot lookups are built as lambda statements: the statement and its
+    # cache key are constructed once per code path, and later calls only
+    # extract the new bound values from the lambda closures.
+    
     async def get_by_id(self, outlet_id: int) -> Optional[Outlet]:
         """Get outlet by ID."""
         result = await self.session.execute(
-            select(Outlet).where(Outlet.id == outlet_id)
+            lambda_stmt(lambda: select(Outlet).where(Outlet.id == outlet_id))
         )
         return result.scalar_one_or_none()
     
     async def get_by_code(self, code: str) -> Optional[Outlet]:
         """Get outlet by unique code."""
         result = await self.session.execute(
-            select(Outlet).where(Outlet.code == code)
+            lambda_stmt(lambda: select(Outlet).where(Outlet.code == code))
         )
         return result.scalar_one_or_none()
     
@@ -73,83 +250,166 @@ class OutletRepository:
         """
         Get paginated list of outlets with optional filters.
         Returns (outlets, total_count).
+        
+        The total is computed with COUNT(*) OVER () in the same statement,
+        so rows and count come back in a single round-trip. Only a page
+        past the end (no rows to carry the total) falls back to a
+        separate COUNT.
         """
-        # Base query
-        query = select(Outlet)
-        count_query = select(func.count(Outlet.id))
+        query = self._page_query(page, page_size, status, priority)
+        result = await self.session.execute(query)
+        rows = result.all()
         
-        # Apply filters
-        filters = []
-        if status:
-            filters.append(Outlet.status == status)
-        if priority:
-            filters.append(Outlet.priority == priority)
+        if rows:
+            total = rows[0].total
+        elif page > 1:
+            total = await self.count(status, priority)
+        else:
+            total = 0
+        return [row.Outlet for row in rows], total
+    
+    async def stream_all(
+        self,
+        page: int = 1,
+        page_size: int = 20,
+        status: Optional[OutletStatus] = None,
+        priority: Optional[OutletPriority] = None
+    ) -> AsyncIterator[Tuple[Outlet, int]]:
+        """
+        Stream a page of outlets as (outlet, total_count) pairs.
         
-        if filters:
-            query = query.where(and_(*filters))
-            count_query = count_query.where(and_(*filters))
+        Same query as get_all, read through a server-side cursor in
+        batches of STREAM_BATCH_SIZE so callers can start responding
+        before the whole page is fetched. Yields nothing for an empty
+        page; use count() for the total then.
+        """
+        query = self._page_query(page, page_size, status, priority)
+        result = await self.session.stream(
+            query, execution_options={"yield_per": STREAM_BATCH_SIZE}
+        )
+        async for row in result:
+            yield row.Outlet, row.total
+    
+    @classmethod
+    async def get_pages(
+        cls,
+        pages: List[int],
+        page_size: int = 20,
+        status: Optional[OutletStatus] = None,
+        priority: Optional[OutletPriority] = None,
+        session_maker: async_sessionmaker = async_session_maker
+    ) -> List[Tuple[List[Outlet], int]]:
+        """
+        Fetch several pages concurrently, one (outlets, total) per page.
         
-        # Get total count
-        total_result = await self.session.execute(count_query)
-        total = total_result.scalar()
+        Each page runs in its own session (and pooled connection), since an
+        AsyncSession cannot run queries concurrently, so wall time is the
+        slowest page rather than the sum.
+        """
+        async def fetch(page: int) -> Tuple[List[Outlet], int]:
+            async with session_maker() as session:
+                return await cls(session).get_all(page, page_size, status, priority)
         
-        # Apply pagination and ordering
-        query = query.order_by(Outlet.priority, Outlet.name)
-        query = query.offset((page - 1) * page_size).limit(page_size)
+        return list(await asyncio.gather(*(fetch(page) for page in pages)))
+    
+    async def count(
+        self,
+        status: Optional[OutletStatus] = None,
+        priority: Optional[OutletPriority] = None
+    ) -> int:
+        """Count outlets matching the list filters."""
+        query = select(func.count()).select_from(Outlet)
+        if status:
+            query = query.where(Outlet.status == status)
+        if priority:
+            query = query.where(Outlet.priority == priority)
+        return (await self.session.execute(query)).scalar_one()
+    
+    @staticmethod
+    def _page_query(
+        page: int,
+        page_size: int,
+        status: Optional[OutletStatus],
+        priority: Optional[OutletPriority]
+    ):
+        """Outlet list page with COUNT(*) OVER () as "total"."""
+        query = lambda_stmt(lambda: select(Outlet, func.count().over().label("total")))
         
-        result = await self.session.execute(query)
-        outlets = result.scalars().all()
+        # Apply filters
+        if status:
+            query += lambda q: q.where(Outlet.status == status)
+        if priority:
+            query += lambda q: q.where(Outlet.priority == priority)
         
-        return list(outlets), total
+        # Apply pagination and ordering (id keeps pages stable)
+        offset = (page - 1) * page_size
+        query += lambda q: (
+            q.order_by(Outlet.priority, Outlet.name, Outlet.id)
+            .offset(offset)
+            .limit(page_size)
+        )
+        return query
     
     async def update(self, outlet_id: int, update_data: OutletUpdate) -> Optional[Outlet]:
-        """Update an existing outlet."""
-        outlet = await self.get_by_id(outlet_id)
-        if not outlet:
-            return None
+        """
+        Update an existing outlet.
         
+        A single UPDATE ... RETURNING filters, applies the changes and
+        reads the row back; returns None if the outlet does not exist.
+        """
         update_dict = update_data.model_dump(exclude_unset=True)
+        values = {}
         
         # Handle GPS coordinates update
-        if "gps_coordinates" in update_dict and update_dict["gps_coordinates"]:
-            coords = update_dict.pop("gps_coordinates")
-            outlet.location = Outlet.create_location(
+        coords = update_dict.pop("gps_coordinates", None)
+        if coords:
+            values["location"] = Outlet.create_location(
                 latitude=coords["latitude"],
                 longitude=coords["longitude"]
             )
         
         # Handle priority conversion
-        if "priority" in update_dict and update_dict["priority"]:
-            outlet.priority = OutletPriority[update_dict.pop("priority").upper()]
+        priority = update_dict.pop("priority", None)
+        if priority:
+            values["priority"] = PRIORITY_TO_DB[priority]
         
         # Handle status conversion
-        if "status" in update_dict and update_dict["status"]:
-            outlet.status = OutletStatus(update_dict.pop("status"))
+        status = update_dict.pop("status", None)
+        if status:
+            values["status"] = STATUS_TO_DB[status]
         
         # Handle delivery window
-        if "delivery_window" in update_dict and update_dict["delivery_window"]:
-            window = update_dict.pop("delivery_window")
-            outlet.delivery_window_start = window["start_minutes"]
-            outlet.delivery_window_end = window["end_minutes"]
+        window = update_dict.pop("delivery_window", None)
+        if window:
+            values["delivery_window_start"] = window["start_minutes"]
+            values["delivery_window_end"] = window["end_minutes"]
         
         # Apply remaining updates
         for field, value in update_dict.items():
             if value is not None:
-                setattr(outlet, field, value)
+                values[field] = value
+        
+        if not values:
+            return await self.get_by_id(outlet_id)
         
-        await self.session.flush()
-        await self.session.refresh(outlet)
+        result = await self.session.execute(
+            update(Outlet)
+            .where(Outlet.id == outlet_id)
+            .values(**values)
+            .returning(Outlet)
+        )
+        outlet = result.scalar_one_or_none()
+        await self.session.commit()
         return outlet
     
     async def delete(self, outlet_id: int) -> bool:
-        """Delete an outlet. Returns True if deleted."""
-        outlet = await self.get_by_id(outlet_id)
-        if not outlet:
-            return False
-        
-        await self.session.delete(outlet)
-        await self.session.flush()
-        return True
+        """Delete an outlet with a single DELETE ... RETURNING. Returns True if deleted."""
+        result = await self.session.execute(
+            delete(Outlet).where(Outlet.id == outlet_id).returning(Outlet.id)
+        )
+        deleted = result.scalar_one_or_none() is not None
+        await self.session.commit()
+        return deleted
     
     async def find_nearby(
         self,
@@ -162,42 +422,82 @@ class OutletRepository:
     ) -> List[Tuple[Outlet, float]]:
         """
         Find outlets within a given radius using PostGIS spatial query.
-        Returns list of (outlet, distance_km) tuples ordered by distance.
+        Returns list of (outlet, distance_km) tuples ordered by distance,
+        with distance_km already rounded to 2 decimal places.
+        
+        Uses ST_DWithin for efficient spatial index utilization and the
+        <-> KNN operator for nearest-first ordering. Filtering, distance
+        calculation and sorting all happen server-side in a single
+        round-trip, on the stored location_geog column (GiST index
+        idx_outlet_location_geog) so no per-row geography cast is needed.
         
-        Uses ST_DWithin for efficient spatial index utilization.
+        For radii of BBOX_PREFILTER_MIN_KM and up, candidates are first cut
+        down with a cheap && box test on the geometry column (index
+        idx_outlet_location), leaving ST_DWithin as the exact refinement.
+        The box is skipped when the circle reaches a pole or crosses the
+        antimeridian, where a degree box would drop real matches.
         """
         # Convert radius to meters (PostGIS geography uses meters)
         radius_meters = radius_km * 1000
         
         # Create reference point
-        ref_point = ST_SetSRID(ST_MakePoint(longitude, latitude), settings.SRID)
+        ewkt = _point_ewkt(latitude, longitude)
+        ref_point = ST_GeogFromText(ewkt)
+        location = Outlet.location_geography()
         
-        # Build query with distance calculation
-        distance_expr = ST_Distance(
-            func.cast(Outlet.location, func.geography),
-            func.cast(ref_point, func.geography)
-        )
+        # Build query with distance calculation (km, rounded to 2 places server-side)
+        distance_km = cast(
+            func.round(cast(ST_Distance(location, ref_point) / 1000, Numeric), 2),
+            Float
+        ).label("distance_km")
         
         query = (
-            select(Outlet, (distance_expr / 1000).label("distance_km"))
-            .where(
-                ST_DWithin(
-                    func.cast(Outlet.location, func.geography),
-                    func.cast(ref_point, func.geography),
-                    radius_meters
-                )
-            )
+            select(Outlet, distance_km)
+            .where(ST_DWithin(location, ref_point, radius_meters))
             .where(Outlet.status == status)
         )
         
+        half_widths = (
+            _bbox_half_widths(latitude, longitude, radius_km)
+            if radius_km >= BBOX_PREFILTER_MIN_KM else None
+        )
+        if half_widths is not None:
+            deg_lng, deg_lat = half_widths
+            query = query.where(
+                Outlet.location.op("&&")(ST_Expand(ST_GeomFromEWKT(ewkt), deg_lng, deg_lat))
+            )
+        
         if priority:
             query = query.where(Outlet.priority == priority)
         
-        query = query.order_by(distance_expr).limit(limit)
+        # KNN ordering (<->) walks the geography GiST index nearest-first
+        # instead of sorting every matching row by ST_Distance
+        query = query.order_by(location.distance_centroid(ref_point)).limit(limit)
         
         result = await self.session.execute(query)
         return [(row.Outlet, row.distance_km) for row in result.all()]
     
+    async def nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        k: int = 5
+    ) -> List[Outlet]:
+        """
+        Get the k outlets nearest to a point, with no radius limit.
+        
+        ORDER BY location_geog <-> point is a KNN scan served by the
+        idx_outlet_location_geog GiST index, so only ~k index entries are
+        visited instead of computing ST_Distance for every outlet.
+        """
+        ref_point = ST_GeogFromText(_point_ewkt(latitude, longitude))
+        result = await self.session.execute(
+            select(Outlet)
+            .order_by(Outlet.location_geography().distance_centroid(ref_point))
+            .limit(k)
+        )
+        return list(result.scalars().all())
+    
     async def get_by_priority_order(
         self,
         outlet_ids: List[int]
@@ -209,9 +509,51 @@ class OutletRepository:
         if not outlet_ids:
             return []
         
+        ids = _id_table(outlet_ids)
         result = await self.session.execute(
             select(Outlet)
-            .where(Outlet.id.in_(outlet_ids))
+            .join(ids, Outlet.id == ids.c.id)
             .order_by(Outlet.priority, Outlet.name)
         )
         return list(result.scalars().all())
+    
+    async def get_in_order(
+        self,
+        outlet_ids: List[int]
+    ) -> List[Outlet]:
+        """
+        Get outlets in the order their ids were given (e.g. a planned
+        stop sequence). Ordering uses the unnest ordinality, so no
+        per-row array_position() search is needed. Unknown ids are skipped.
+        """
+        if not outlet_ids:
+            return []
+        
+        ids = _id_table(outlet_ids, with_ordinality=True)
+        result = await self.session.execute(
+            select(Outlet)
+            .join(ids, Outlet.id == ids.c.id)
+            .order_by(ids.c.ord)
+        )
+        return list(result.scalars().all())
+    
+    async def get_coordinates(
+        self,
+        outlet_ids: Optional[List[int]] = None
+    ) -> List[Tuple[int, float, float]]:
+        """
+        Get (id, longitude, latitude) tuples for outlets.
+        
+        Reads the stored lng/lat columns, so bulk consumers (route planning,
+        distance math) get plain floats without loading or decoding
+        geometries.
+        """
+        query = select(Outlet.id, Outlet.lng, Outlet.lat)
+        if outlet_ids is not None:
+            if not outlet_ids:
+                return []
+            ids = _id_table(outlet_ids)
+            query = query.join(ids, Outlet.id == ids.c.id)
+        
+        result = await self.session.execute(query.order_by(Outlet.id))
+        return [tuple(row) for row in result.all()]
@@ -0,0 +1,217 @@
+"""
+Repository for RouteNode telemetry data access.
+"""
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+from sqlalchemy import column, select, table, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from geoalchemy2.functions import ST_MakePoint, ST_SetSRID
+
+from app.models.route_node import RouteNode, NodeStatus
+from app.core.config import settings
+
+# Columns accepted by copy_from(); coordinates are plain floats and are
+# turned into geometries server-side
+_COPY_COLUMNS = (
+    "route_id", "outlet_id", "sequence_order", "status",
+    "planned_arrival_time", "arrival_time", "departure_time",
+    "arrival_lng", "arrival_lat", "departure_lng", "departure_lat",
+    "boxes_delivered", "boxes_returned",
+)
+
+_CREATE_COPY_STAGING = text("""
+    CREATE TEMP TABLE route_node_staging (
+        route_id integer NOT NULL,
+        outlet_id integer NOT NULL,
+        sequence_order integer NOT NULL,
+        status smallint NOT NULL,
+        planned_arrival_time timestamp,
+        arrival_time timestamp,
+        departure_time timestamp,
+        arrival_lng double precision,
+        arrival_lat double precision,
+        departure_lng double precision,
+        departure_lat double precision,
+        boxes_delivered integer NOT NULL,
+        boxes_returned integer NOT NULL
+    ) ON COMMIT DROP
+""")
+
+_INSERT_FROM_COPY_STAGING = text(f"""
+    INSERT INTO route_nodes (
+        route_id, outlet_id, sequence_order, status,
+        planned_arrival_time, arrival_time, departure_time,
+        arrival_location, departure_location,
+        boxes_delivered, boxes_returned,
+        signature_captured, photo_captured
+    )
+    SELECT
+        route_id, outlet_id, sequence_order, status,
+        planned_arrival_time, arrival_time, departure_time,
+        ST_SetSRID(ST_MakePoint(arrival_lng, arrival_lat), {settings.SRID}),
+        ST_SetSRID(ST_MakePoint(departure_lng, departure_lat), {settings.SRID}),
+        boxes_delivered, boxes_returned,
+        false, false
+    FROM route_node_staging
+    ON CONFLICT ON CONSTRAINT uq_route_outlet DO NOTHING
+""")
+
+# Materialized view created by scripts/migrations/009
+route_node_hourly_deliveries = table(
+    "route_node_hourly_deliveries",
+    column("bucket"),
+    column("outlet_id"),
+    column("stops"),
+    column("boxes_delivered"),
+    column("boxes_returned"),
+)
+
+
+def _insert_new_stops():
+    """INSERT into route_nodes that skips rows colliding with uq_route_outlet."""
+    return insert(RouteNode).on_conflict_do_nothing(constraint="uq_route_outlet")
+
+
+class RouteNodeRepository:
+    """
+    Data access layer for RouteNode entities.
+    Provides bulk ingestion for route planning and telemetry bursts.
+    """
+    
+    def __init__(self, session: AsyncSession):
+        self.session = session
+    
+    async def bulk_create(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Insert many route nodes in one batched statement.
+        
+        Rows are plain column dicts (all with the same keys). Location
+        columns take values from RouteNode.create_point; GeoAlchemy2 binds
+        them with their SRID, so no geometry is inserted empty.
+        
+        Rows for a (route_id, outlet_id) stop that already exists (e.g.
+        retransmitted batches) are skipped instead of failing the batch.
+        """
+        if not rows:
+            return
+        
+        await self.session.execute(_insert_new_stops(), rows)
+        await self.session.commit()
+    
+    async def create_many(self, rows: List[Dict[str, Any]]) -> List[Optional[int]]:
+        """
+        Insert many route nodes and return their ids in one round-trip
+        per batch, aligned with `rows`.
+        
+        Use this instead of add_all() + flush() when callers need the ids
+        (e.g. to link boxes to stops); it avoids per-object refreshes.
+        Duplicate stops (same route_id and outlet_id as an existing row or
+        an earlier row in the batch) are skipped and get None.
+        """
+        if not rows:
+            return []
+        
+        result = await self.session.execute(
+            _insert_new_stops().returning(RouteNode.id, RouteNode.route_id, RouteNode.outlet_id),
+            rows
+        )
+        inserted = {(route_id, outlet_id): id_ for id_, route_id, outlet_id in result.all()}
+        await self.session.commit()
+        return [
+            inserted.pop((row["route_id"], row["outlet_id"]), None)
+            for row in rows
+        ]
+    
+    async def copy_from(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """
+        Ingest a large batch of route nodes with COPY. Returns the number
+        of rows inserted.
+        
+        Rows are dicts keyed by _COPY_COLUMNS (route_id, outlet_id and
+        sequence_order are required; coordinates are lng/lat floats).
+        They are COPYed in binary form into a temporary staging table,
+        then moved into route_nodes with one INSERT ... SELECT that builds
+        the geometries and skips stops that already exist. Much faster
+        than batched INSERTs for telemetry bursts; there is no per-row
+        parameter binding.
+        """
+        status_type = RouteNode.__table__.c.status.type
+        records = [
+            (
+                row["route_id"],
+                row["outlet_id"],
+                row["sequence_order"],
+                status_type.code(row.get("status") or NodeStatus.PENDING),
+                row.get("planned_arrival_time"),
+                row.get("arrival_time"),
+                row.get("departure_time"),
+                row.get("arrival_lng"),
+                row.get("arrival_lat"),
+                row.get("departure_lng"),
+                row.get("departure_lat"),
+                row.get("boxes_delivered", 0),
+                row.get("boxes_returned", 0),
+            )
+            for row in rows
+        ]
+        if not records:
+            return 0
+        
+        conn = await self.session.connection()
+        await conn.execute(_CREATE_COPY_STAGING)
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            "route_node_staging", records=records, columns=_COPY_COLUMNS
+        )
+        result = await conn.execute(_INSERT_FROM_COPY_STAGING)
+        await self.session.commit()
+        return result.rowcount
+    
+    async def nearest_arrivals(
+        self,
+        latitude: float,
+        longitude: float,
+        k: int = 5
+    ) -> List[RouteNode]:
+        """
+        Get the k route nodes whose actual arrival GPS is nearest a point.
+        
+        ORDER BY arrival_location <-> point is a KNN scan served by the
+        idx_route_node_arrival_location GiST index. Ordering is planar
+        (SRID units), which is fine for ranking nearby stops.
+        """
+        ref_point = ST_SetSRID(ST_MakePoint(longitude, latitude), settings.SRID)
+        result = await self.session.execute(
+            select(RouteNode)
+            .where(RouteNode.arrival_location.isnot(None))
+            .order_by(RouteNode.arrival_location.distance_centroid(ref_point))
+            .limit(k)
+        )
+        return list(result.scalars().all())
+    
+    async def refresh_hourly_deliveries(self) -> None:
+        """
+        Refresh the hourly delivered-box rollup.
+        CONCURRENTLY keeps the view readable while it is rebuilt.
+        """
+        await self.session.execute(
+            text("REFRESH MATERIALIZED VIEW CONCURRENTLY route_node_hourly_deliveries")
+        )
+        await self.session.commit()
+    
+    async def hourly_deliveries(
+        self,
+        since: datetime,
+        outlet_id: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get pre-aggregated hourly delivery counts since a timestamp,
+        optionally for a single outlet, oldest bucket first.
+        """
+        view = route_node_hourly_deliveries
+        query = select(view).where(view.c.bucket >= since)
+        if outlet_id is not None:
+            query = query.where(view.c.outlet_id == outlet_id)
+        result = await self.session.execute(query.order_by(view.c.bucket, view.c.outlet_id))
+        return [dict(row) for row in result.mappings()]
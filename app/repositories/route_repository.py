@@ -0,0 +1,50 @@
+"""
+Repository for Route data access.
+"""
+from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload, undefer
+
+from app.models.route import Route
+from app.models.route_node import RouteNode
+
+
+class RouteRepository:
+    """
+    Data access layer for Route entities.
+    
+    Relationships are loaded with selectinload (one extra IN query per
+    collection) rather than joinedload, which would repeat every route
+    column once per stop and per box.
+    """
+    
+    def __init__(self, session: AsyncSession):
+        self.session = session
+    
+    async def with_stops(self, route_id: int) -> Optional[Route]:
+        """
+        Get a route with its stops (and each stop's outlet) and boxes
+        loaded, so views can iterate them without per-row queries.
+        """
+        result = await self.session.execute(
+            select(Route)
+            .where(Route.id == route_id)
+            .options(
+                selectinload(Route.route_nodes).selectinload(RouteNode.outlet),
+                selectinload(Route.boxes),
+            )
+        )
+        return result.scalar_one_or_none()
+    
+    async def with_distance_matrix(self, route_id: int) -> Optional[Route]:
+        """
+        Get a route with its deferred distance_matrix loaded, so
+        get_distance_matrix() does not lazy-load under AsyncSession.
+        """
+        result = await self.session.execute(
+            select(Route)
+            .where(Route.id == route_id)
+            .options(undefer(Route.distance_matrix))
+        )
+        return result.scalar_one_or_none()
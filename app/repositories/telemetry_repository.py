@@ -0,0 +1,140 @@
+"""
+Repository for buffered driver telemetry.
+"""
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.route_node import RouteNode, NodeStatus
+from app.models.telemetry_event import TelemetryEvent, TelemetryKind
+from app.core.config import settings
+
+_kind = TelemetryEvent.__table__.c.kind.type.code
+_status = RouteNode.__table__.c.status.type.code
+
+# Advisory lock key held by whichever worker is reducing
+REDUCE_LOCK_KEY = 72_201_002
+_TRY_REDUCE_LOCK = text("SELECT pg_try_advisory_xact_lock(:key)")
+
+# Drains the buffer and folds the latest arrival/departure ping per node
+# into route_nodes in one statement. DELETE ... RETURNING only sees rows
+# committed before the statement started, so concurrent appends are left
+# for the next run. Stops already past ARRIVED keep their status.
+_REDUCE_TELEMETRY = text(f"""
+    WITH batch AS (
+        DELETE FROM telemetry_events
+        RETURNING route_node_id, kind, ts, lng, lat
+    ),
+    arrivals AS (
+        SELECT DISTINCT ON (route_node_id) route_node_id, ts, lng, lat
+        FROM batch
+        WHERE kind = {_kind(TelemetryKind.ARRIVAL)}
+        ORDER BY route_node_id, ts DESC
+    ),
+    departures AS (
+        SELECT DISTINCT ON (route_node_id) route_node_id, ts, lng, lat
+        FROM batch
+        WHERE kind = {_kind(TelemetryKind.DEPARTURE)}
+        ORDER BY route_node_id, ts DESC
+    ),
+    ev AS (
+        SELECT
+            route_node_id,
+            a.ts AS arrival_time, a.lng AS arrival_lng, a.lat AS arrival_lat,
+            d.ts AS departure_time, d.lng AS departure_lng, d.lat AS departure_lat
+        FROM arrivals a
+        FULL JOIN departures d USING (route_node_id)
+    )
+    UPDATE route_nodes AS rn SET
+        arrival_time = COALESCE(ev.arrival_time, rn.arrival_time),
+        arrival_location = COALESCE(
+            ST_SetSRID(ST_MakePoint(ev.arrival_lng, ev.arrival_lat), {settings.SRID}),
+            rn.arrival_location
+        ),
+        departure_time = COALESCE(ev.departure_time, rn.departure_time),
+        departure_location = COALESCE(
+            ST_SetSRID(ST_MakePoint(ev.departure_lng, ev.departure_lat), {settings.SRID}),
+            rn.departure_location
+        ),
+        status = CASE
+            WHEN ev.arrival_time IS NOT NULL
+                AND rn.status IN ({_status(NodeStatus.PENDING)}, {_status(NodeStatus.EN_ROUTE)})
+            THEN {_status(NodeStatus.ARRIVED)}
+            ELSE rn.status
+        END,
+        updated_at = timezone('utc', now())
+    FROM ev
+    WHERE rn.id = ev.route_node_id
+""")
+
+
+class TelemetryRepository:
+    """
+    Data access layer for driver telemetry.
+    
+    Pings are appended to the telemetry_events buffer and folded into
+    route_nodes in batches by reduce(), rather than one UPDATE per ping.
+    """
+    
+    def __init__(self, session: AsyncSession):
+        self.session = session
+    
+    async def append(self, events: List[Dict[str, Any]]) -> None:
+        """
+        Buffer many pings in one batched INSERT.
+        Events are dicts with route_node_id, kind, ts, lng and lat.
+        """
+        if not events:
+            return
+        
+        await self.session.execute(insert(TelemetryEvent), events)
+        await self.session.commit()
+    
+    async def record_arrival(
+        self,
+        route_node_id: int,
+        latitude: float,
+        longitude: float,
+        timestamp: Optional[datetime] = None
+    ) -> None:
+        """Buffer a driver arrival ping for a stop."""
+        await self.append([{
+            "route_node_id": route_node_id,
+            "kind": TelemetryKind.ARRIVAL,
+            "ts": timestamp or datetime.utcnow(),
+            "lng": longitude,
+            "lat": latitude,
+        }])
+    
+    async def record_departure(
+        self,
+        route_node_id: int,
+        latitude: float,
+        longitude: float,
+        timestamp: Optional[datetime] = None
+    ) -> None:
+        """Buffer a driver departure ping for a stop."""
+        await self.append([{
+            "route_node_id": route_node_id,
+            "kind": TelemetryKind.DEPARTURE,
+            "ts": timestamp or datetime.utcnow(),
+            "lng": longitude,
+            "lat": latitude,
+        }])
+    
+    async def reduce(self) -> int:
+        """
+        Fold buffered pings into route_nodes.
+        Returns the number of route nodes updated.
+        
+        Skipped (returns 0) while another worker holds the reduce lock,
+        so enabled workers never drain the buffer concurrently.
+        """
+        locked = await self.session.scalar(_TRY_REDUCE_LOCK, {"key": REDUCE_LOCK_KEY})
+        if not locked:
+            await self.session.rollback()
+            return 0
+        result = await self.session.execute(_REDUCE_TELEMETRY)
+        await self.session.commit()
+        return result.rowcount
@@ -2,9 +2,8 @@
 Pydantic schemas for Box validation and serialization.
 """
 from datetime import datetime
-from decimal import Decimal
 from typing import Optional, List
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+from pydantic import BaseModel, Field, ConfigDict, model_validator
 from enum import Enum
 
 
@@ -29,14 +28,13 @@ class BoxStatusEnum(str, Enum):
 
 
 class BoxDimensions(BaseModel):
-    """Box dimension specification."""
-    length_cm: Decimal = Field(..., gt=0, le=200)
-    width_cm: Decimal = Field(..., gt=0, le=200)
-    height_cm: Decimal = Field(..., gt=0, le=200)
-    
-    @property
-    def volume_cm3(self) -> Decimal:
-        return self.length_cm * self.width_cm * self.height_cm
+    """
+    Box dimension specification.
+    Volume is not computed here; boxes.volume_cm3 is generated by the DB.
+    """
+    length_cm: float = Field(..., gt=0, le=200)
+    width_cm: float = Field(..., gt=0, le=200)
+    height_cm: float = Field(..., gt=0, le=200)
 
 
 class BoxBase(BaseModel):
@@ -45,8 +43,8 @@ class BoxBase(BaseModel):
     order_id: int = Field(..., gt=0)
     size_category: BoxSizeEnum = Field(default=BoxSizeEnum.MEDIUM)
     dimensions: Optional[BoxDimensions] = None
-    weight_kg: Decimal = Field(default=Decimal("0"), ge=0)
-    max_weight_kg: Decimal = Field(default=Decimal("25.0"), gt=0)
+    weight_kg: float = Field(default=0.0, ge=0)
+    max_weight_kg: float = Field(default=25.0, gt=0)
     is_fragile: bool = Field(default=False)
     requires_refrigeration: bool = Field(default=False)
     is_stackable: bool = Field(default=True)
@@ -55,19 +53,17 @@ class BoxBase(BaseModel):
 class BoxCreate(BoxBase):
     """Schema for creating a new box."""
     
-    @field_validator("weight_kg")
-    @classmethod
-    def validate_weight(cls, v, info):
-        max_weight = info.data.get("max_weight_kg", Decimal("25.0"))
-        if v > max_weight:
-            raise ValueError(f"Weight {v} exceeds maximum {max_weight}")
-        return v
+    @model_validator(mode="after")
+    def validate_weight(self) -> "BoxCreate":
+        if self.weight_kg > self.max_weight_kg:
+            raise ValueError(f"Weight {self.weight_kg} exceeds maximum {self.max_weight_kg}")
+        return self
 
 
 class BoxUpdate(BaseModel):
     """Schema for updating a box."""
-    weight_kg: Optional[Decimal] = Field(default=None, ge=0)
-    volume_used_cm3: Optional[Decimal] = Field(default=None, ge=0)
+    weight_kg: Optional[float] = Field(default=None, ge=0)
+    volume_used_cm3: Optional[float] = Field(default=None, ge=0)
     status: Optional[BoxStatusEnum] = None
     sequence_index: Optional[int] = Field(default=None, ge=0)
     route_id: Optional[int] = Field(default=None, gt=0)
@@ -77,20 +73,25 @@ class BoxUpdate(BaseModel):
 
 
 class BoxResponse(BaseModel):
-    """Schema for box API response."""
-    model_config = ConfigDict(from_attributes=True)
+    """
+    Schema for box API response.
+    volume_cm3 and fill_percentage come from the generated DB columns.
+    """
+    model_config = ConfigDict(from_attributes=True, frozen=True)
     
     id: int
     barcode: str
     order_id: int
     route_id: Optional[int]
     size_category: str
-    length_cm: Decimal
-    width_cm: Decimal
-    height_cm: Decimal
-    weight_kg: Decimal
-    max_weight_kg: Decimal
-    volume_used_cm3: Decimal
+    length_cm: float
+    width_cm: float
+    height_cm: float
+    weight_kg: float
+    max_weight_kg: float
+    volume_used_cm3: float
+    volume_cm3: float
+    fill_percentage: float
     sequence_index: Optional[int]
     status: str
     is_fragile: bool
@@ -101,17 +102,6 @@ class BoxResponse(BaseModel):
     delivered_at: Optional[datetime]
     created_at: datetime
     updated_at: datetime
-    
-    @property
-    def volume_cm3(self) -> Decimal:
-        return self.length_cm * self.width_cm * self.height_cm
-    
-    @property
-    def fill_percentage(self) -> float:
-        vol = self.length_cm * self.width_cm * self.height_cm
-        if vol == 0:
-            return 0.0
-        return float(self.volume_used_cm3 / vol * 100)
 
 
 class BoxListResponse(BaseModel):
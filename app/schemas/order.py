@@ -34,8 +34,8 @@ class OrderBase(BaseModel):
     order_number: str = Field(..., min_length=1, max_length=50)
     outlet_id: int = Field(..., gt=0)
     description: Optional[str] = None
-    total_volume_cm3: Decimal = Field(default=Decimal("0"), ge=0)
-    total_weight_kg: Decimal = Field(default=Decimal("0"), ge=0)
+    total_volume_cm3: float = Field(default=0.0, ge=0)
+    total_weight_kg: float = Field(default=0.0, ge=0)
     item_count: int = Field(default=1, ge=1)
     order_value: Optional[Decimal] = Field(default=None, ge=0)
     priority: OrderPriorityEnum = Field(default=OrderPriorityEnum.NORMAL)
@@ -50,8 +50,8 @@ class OrderCreate(OrderBase):
 class OrderUpdate(BaseModel):
     """Schema for updating an order."""
     description: Optional[str] = None
-    total_volume_cm3: Optional[Decimal] = Field(default=None, ge=0)
-    total_weight_kg: Optional[Decimal] = Field(default=None, ge=0)
+    total_volume_cm3: Optional[float] = Field(default=None, ge=0)
+    total_weight_kg: Optional[float] = Field(default=None, ge=0)
     item_count: Optional[int] = Field(default=None, ge=1)
     order_value: Optional[Decimal] = Field(default=None, ge=0)
     priority: Optional[OrderPriorityEnum] = None
@@ -68,8 +68,8 @@ class OrderResponse(BaseModel):
     order_number: str
     outlet_id: int
     description: Optional[str]
-    total_volume_cm3: Decimal
-    total_weight_kg: Decimal
+    total_volume_cm3: float
+    total_weight_kg: float
     item_count: int
     order_value: Optional[Decimal]
     status: str
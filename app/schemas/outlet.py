@@ -2,8 +2,8 @@
 Pydantic schemas for Outlet validation and serialization.
 """
 from datetime import datetime
-from typing import Optional, List
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from typing import Dict, Optional, List
+from pydantic import BaseModel, Field, model_validator, ConfigDict
 from enum import Enum
 
 
@@ -39,11 +39,15 @@ class GPSCoordinates(BaseModel):
         description="Longitude in decimal degrees (-180 to 180)"
     )
     
-    @field_validator("latitude", "longitude")
-    @classmethod
-    def validate_precision(cls, v: float) -> float:
-        """Ensure reasonable precision (6 decimal places ≈ 0.1m accuracy)."""
-        return round(v, 6)
+    @model_validator(mode="after")
+    def validate_precision(self) -> "GPSCoordinates":
+        """
+        Ensure reasonable precision (6 decimal places ≈ 0.1m accuracy).
+        Both fields are rounded in one validator call per record.
+        """
+        self.latitude = round(self.latitude, 6)
+        self.longitude = round(self.longitude, 6)
+        return self
 
 
 class DeliveryWindow(BaseModel):
@@ -61,14 +65,12 @@ class DeliveryWindow(BaseModel):
         description="End time in minutes from midnight"
     )
     
-    @field_validator("end_minutes")
-    @classmethod
-    def validate_window(cls, v: int, info) -> int:
+    @model_validator(mode="after")
+    def validate_window(self) -> "DeliveryWindow":
         """Ensure end time is after start time."""
-        start = info.data.get("start_minutes", 0)
-        if v <= start:
+        if self.end_minutes <= self.start_minutes:
             raise ValueError("Delivery window end must be after start")
-        return v
+        return self
     
     @property
     def start_time(self) -> str:
@@ -148,9 +150,18 @@ class OutletUpdate(BaseModel):
     delivery_window: Optional[DeliveryWindow] = None
 
 
+# "HH:MM" for every window minute 0..1440 (end of day is "24:00"), built once
+_HHMM = tuple(f"{h:02d}:{m:02d}" for h, m in (divmod(t, 60) for t in range(1441)))
+
+
+def format_delivery_window(start_minutes: int, end_minutes: int) -> Dict[str, str]:
+    """Delivery window as {"start": "HH:MM", "end": "HH:MM"}."""
+    return {"start": _HHMM[start_minutes], "end": _HHMM[end_minutes]}
+
+
 class OutletResponse(BaseModel):
     """Schema for outlet API responses."""
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
     
     id: int
     code: str
@@ -164,19 +175,10 @@ class OutletResponse(BaseModel):
     status: str
     delivery_window_start: int
     delivery_window_end: int
+    delivery_window_formatted: Dict[str, str]
     avg_service_time: int
     created_at: datetime
     updated_at: datetime
-    
-    @property
-    def delivery_window_formatted(self) -> dict:
-        """Return formatted delivery window."""
-        start_h, start_m = divmod(self.delivery_window_start, 60)
-        end_h, end_m = divmod(self.delivery_window_end, 60)
-        return {
-            "start": f"{start_h:02d}:{start_m:02d}",
-            "end": f"{end_h:02d}:{end_m:02d}"
-        }
 
 
 class OutletListResponse(BaseModel):
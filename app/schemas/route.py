@@ -2,11 +2,12 @@
 Pydantic schemas for Route validation and serialization.
 """
 from datetime import datetime, date
-from decimal import Decimal
 from typing import Optional, List
 from pydantic import BaseModel, Field, ConfigDict
 from enum import Enum
 
+from app.schemas.trusted import TrustedResponse
+
 
 class RouteStatusEnum(str, Enum):
     """Route status for API."""
@@ -41,8 +42,8 @@ class VehicleAssignment(BaseModel):
     vehicle_id: str = Field(..., max_length=50)
     vehicle_plate: Optional[str] = Field(default=None, max_length=20)
     vehicle_type: VehicleTypeEnum = Field(default=VehicleTypeEnum.VAN)
-    max_weight_kg: Optional[Decimal] = Field(default=None, gt=0)
-    max_volume_cm3: Optional[Decimal] = Field(default=None, gt=0)
+    max_weight_kg: Optional[float] = Field(default=None, gt=0)
+    max_volume_cm3: Optional[float] = Field(default=None, gt=0)
 
 
 class RouteBase(BaseModel):
@@ -53,7 +54,7 @@ class RouteBase(BaseModel):
     planned_date: date
     planned_start_time: Optional[datetime] = None
     planned_end_time: Optional[datetime] = None
-    planned_distance_km: Optional[Decimal] = Field(default=None, ge=0)
+    planned_distance_km: Optional[float] = Field(default=None, ge=0)
 
 
 class RouteCreate(RouteBase):
@@ -71,11 +72,11 @@ class RouteUpdate(BaseModel):
     planned_end_time: Optional[datetime] = None
     actual_start_time: Optional[datetime] = None
     actual_end_time: Optional[datetime] = None
-    planned_distance_km: Optional[Decimal] = Field(default=None, ge=0)
-    actual_distance_km: Optional[Decimal] = Field(default=None, ge=0)
-    fuel_start_liters: Optional[Decimal] = Field(default=None, ge=0)
-    fuel_end_liters: Optional[Decimal] = Field(default=None, ge=0)
-    fuel_consumed_liters: Optional[Decimal] = Field(default=None, ge=0)
+    planned_distance_km: Optional[float] = Field(default=None, ge=0)
+    actual_distance_km: Optional[float] = Field(default=None, ge=0)
+    fuel_start_liters: Optional[float] = Field(default=None, ge=0)
+    fuel_end_liters: Optional[float] = Field(default=None, ge=0)
+    fuel_consumed_liters: Optional[float] = Field(default=None, ge=0)
 
 
 class RouteAssignmentUpdate(BaseModel):
@@ -84,7 +85,7 @@ class RouteAssignmentUpdate(BaseModel):
     vehicle: Optional[VehicleAssignment] = None
 
 
-class RouteResponse(BaseModel):
+class RouteResponse(TrustedResponse):
     """Schema for route API response."""
     model_config = ConfigDict(from_attributes=True)
     
@@ -98,38 +99,27 @@ class RouteResponse(BaseModel):
     vehicle_id: Optional[str]
     vehicle_plate: Optional[str]
     vehicle_type: Optional[str]
-    max_weight_kg: Optional[Decimal]
-    max_volume_cm3: Optional[Decimal]
+    max_weight_kg: Optional[float]
+    max_volume_cm3: Optional[float]
     planned_date: date
     planned_start_time: Optional[datetime]
     planned_end_time: Optional[datetime]
     actual_start_time: Optional[datetime]
     actual_end_time: Optional[datetime]
-    planned_distance_km: Optional[Decimal]
-    actual_distance_km: Optional[Decimal]
+    planned_distance_km: Optional[float]
+    actual_distance_km: Optional[float]
     planned_stops: int
     completed_stops: int
     total_boxes: int
-    total_weight_kg: Decimal
-    fuel_start_liters: Optional[Decimal]
-    fuel_end_liters: Optional[Decimal]
-    fuel_consumed_liters: Optional[Decimal]
+    total_weight_kg: float
+    fuel_start_liters: Optional[float]
+    fuel_end_liters: Optional[float]
+    fuel_consumed_liters: Optional[float]
+    completion_percentage: float
+    fuel_efficiency: Optional[float]
     status: str
     created_at: datetime
     updated_at: datetime
-    
-    @property
-    def completion_percentage(self) -> float:
-        if self.planned_stops == 0:
-            return 0.0
-        return (self.completed_stops / self.planned_stops) * 100
-    
-    @property
-    def fuel_efficiency(self) -> Optional[float]:
-        if self.fuel_consumed_liters and self.actual_distance_km:
-            if self.fuel_consumed_liters > 0:
-                return float(self.actual_distance_km / self.fuel_consumed_liters)
-        return None
 
 
 class RouteListResponse(BaseModel):
@@ -144,7 +134,7 @@ class RouteListResponse(BaseModel):
 class RouteMetrics(BaseModel):
     """Route performance metrics."""
     route_id: int
-    total_distance_km: Decimal
+    total_distance_km: float
     total_duration_minutes: int
     avg_service_time_minutes: float
     fuel_efficiency_km_per_liter: Optional[float]
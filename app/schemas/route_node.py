@@ -2,12 +2,12 @@
 Pydantic schemas for RouteNode (telemetry) validation and serialization.
 """
 from datetime import datetime
-from decimal import Decimal
 from typing import Optional, List
 from pydantic import BaseModel, Field, ConfigDict, field_validator
 from enum import Enum
 
 from app.schemas.outlet import GPSCoordinates
+from app.schemas.trusted import TrustedResponse
 
 
 class NodeStatusEnum(str, Enum):
@@ -63,14 +63,14 @@ class ArrivalRecord(BaseModel):
     """Schema for recording driver arrival."""
     coordinates: GPSCoordinates
     timestamp: Optional[datetime] = None
-    odometer_km: Optional[Decimal] = Field(default=None, ge=0)
+    odometer_km: Optional[float] = Field(default=None, ge=0)
 
 
 class DepartureRecord(BaseModel):
     """Schema for recording driver departure."""
     coordinates: GPSCoordinates
     timestamp: Optional[datetime] = None
-    odometer_km: Optional[Decimal] = Field(default=None, ge=0)
+    odometer_km: Optional[float] = Field(default=None, ge=0)
     boxes_delivered: int = Field(default=0, ge=0)
     boxes_returned: int = Field(default=0, ge=0)
     delivery_result: DeliveryResultEnum
@@ -82,11 +82,11 @@ class DepartureRecord(BaseModel):
 
 class FuelRecord(BaseModel):
     """Schema for fuel consumption at a node."""
-    fuel_consumed_liters: Decimal = Field(..., ge=0)
-    distance_from_previous_km: Optional[Decimal] = Field(default=None, ge=0)
+    fuel_consumed_liters: float = Field(..., ge=0)
+    distance_from_previous_km: Optional[float] = Field(default=None, ge=0)
 
 
-class RouteNodeResponse(BaseModel):
+class RouteNodeResponse(TrustedResponse):
     """Schema for route node API response."""
     model_config = ConfigDict(from_attributes=True)
     
@@ -100,11 +100,11 @@ class RouteNodeResponse(BaseModel):
     service_time_minutes: Optional[int]
     arrival_lat: Optional[float]
     arrival_long: Optional[float]
-    distance_from_previous_km: Optional[Decimal]
-    cumulative_distance_km: Optional[Decimal]
-    fuel_consumed_liters: Optional[Decimal]
-    odometer_arrival_km: Optional[Decimal]
-    odometer_departure_km: Optional[Decimal]
+    distance_from_previous_km: Optional[float]
+    cumulative_distance_km: Optional[float]
+    fuel_consumed_liters: Optional[float]
+    odometer_arrival_km: Optional[float]
+    odometer_departure_km: Optional[float]
     boxes_delivered: int
     boxes_returned: int
     status: str
@@ -114,7 +114,7 @@ class RouteNodeResponse(BaseModel):
     signature_captured: bool
     photo_captured: bool
     is_within_geofence: Optional[bool]
-    geofence_distance_meters: Optional[Decimal]
+    geofence_distance_meters: Optional[float]
     created_at: datetime
     updated_at: datetime
 
@@ -134,8 +134,8 @@ class TelemetrySummary(BaseModel):
     skipped_stops: int
     total_service_time_minutes: int
     avg_service_time_minutes: float
-    total_distance_km: Decimal
-    total_fuel_liters: Decimal
+    total_distance_km: float
+    total_fuel_liters: float
     fuel_efficiency_km_per_liter: Optional[float]
     on_time_count: int
     late_count: int
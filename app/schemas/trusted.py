@@ -0,0 +1,37 @@
+"""
+Base schema for responses built from trusted ORM rows.
+"""
+import enum
+from typing import Any, ClassVar, Tuple
+
+from pydantic import BaseModel
+
+
+class TrustedResponse(BaseModel):
+    """
+    Response schema that can be filled from an ORM row without validation.
+
+    from_orm_trusted() copies each declared field straight off the object
+    via model_construct, skipping the per-field validation that
+    model_validate(from_attributes=True) would run on data the database
+    already guarantees. Enum members are unwrapped to their values, as
+    response fields carry the API string. Subclasses must not rely on
+    custom validators, since none run on this path.
+    """
+    _trusted_fields: ClassVar[Tuple[str, ...]] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._trusted_fields = tuple(cls.model_fields)
+
+    @classmethod
+    def from_orm_trusted(cls, obj: Any):
+        """Build the response from a trusted ORM object."""
+        values = {}
+        for name in cls._trusted_fields:
+            value = getattr(obj, name)
+            if isinstance(value, enum.Enum):
+                value = value.value
+            values[name] = value
+        return cls.model_construct(**values)
@@ -1,6 +1,6 @@
 """
-Dashboard services module.
+Services module.
 """
-from app.services.dashboard_service import DashboardService
+from app.services import activity_service, dashboard_service, telemetry_service
 
-__all__ = ["DashboardService"]
+__all__ = ["activity_service", "dashboard_service", "telemetry_service"]
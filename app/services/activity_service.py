@@ -0,0 +1,51 @@
+"""
+Background retention for the dashboard activity log.
+"""
+import asyncio
+import logging
+
+from sqlalchemy import text
+
+from app.core.database import async_session_maker
+
+logger = logging.getLogger(__name__)
+
+# Advisory lock key held by whichever worker is pruning
+PRUNE_LOCK_KEY = 72_201_003
+_TRY_PRUNE_LOCK = text("SELECT pg_try_advisory_xact_lock(:key)")
+
+# Range delete on idx_activity_log_ts
+_PRUNE_ACTIVITY_LOG = text("""
+    DELETE FROM activity_log
+    WHERE ts < timezone('utc', now()) - make_interval(days => :days)
+""")
+
+
+async def prune_activity_log(retention_days: int) -> int:
+    """
+    Delete activity_log rows older than `retention_days`.
+    Returns the number of rows deleted; 0 when another worker is
+    already pruning.
+    """
+    async with async_session_maker() as session:
+        locked = await session.scalar(_TRY_PRUNE_LOCK, {"key": PRUNE_LOCK_KEY})
+        if not locked:
+            await session.rollback()
+            return 0
+        result = await session.execute(_PRUNE_ACTIVITY_LOG, {"days": retention_days})
+        await session.commit()
+        return result.rowcount
+
+
+async def run_activity_pruner(interval_seconds: float, retention_days: int) -> None:
+    """
+    Trim activity_log to the last `retention_days` days every
+    `interval_seconds` until cancelled. Failures are logged and retried
+    on the next tick.
+    """
+    while True:
+        try:
+            await prune_activity_log(retention_days)
+        except Exception as e:
+            logger.warning(f"Activity log pruning failed: {e}")
+        await asyncio.sleep(interval_seconds)
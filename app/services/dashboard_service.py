@@ -1,17 +1,20 @@
 """
 Dashboard service for computing analytics and metrics.
 """
+import asyncio
+import time
 from datetime import datetime, date, timedelta
-from decimal import Decimal
 from typing import Optional
-from sqlalchemy import select, func, case, and_, or_
+from sqlalchemy import select, func, and_, or_, cast, true, bindparam, literal, union_all, Date, DateTime, Float, Integer, Numeric
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.database import async_session_maker
 from app.models.outlet import Outlet, OutletStatus, OutletPriority
 from app.models.order import Order, OrderStatus, OrderPriority
 from app.models.route import Route, RouteStatus, VehicleType
 from app.models.box import Box, BoxStatus
 from app.models.route_node import RouteNode, NodeStatus, DeliveryResult
+from app.models.activity_log import ActivityLog
 from app.schemas.dashboard import (
     OverviewStats, DeliveryMetrics, RouteMetrics, BoxMetrics,
     DashboardOverview, ChartsData, OrderStatusDistribution,
@@ -21,496 +24,522 @@ from app.schemas.dashboard import (
 )
 
 
-class DashboardService:
-    """Service for computing dashboard analytics."""
+# Status groups used by the dashboard aggregates
+PENDING_ORDER_STATUSES = (
+    OrderStatus.PENDING, OrderStatus.CONFIRMED, OrderStatus.PACKING, OrderStatus.PACKED,
+)
+COMPLETED_ORDER_STATUSES = (OrderStatus.DELIVERED, OrderStatus.PARTIAL)
+# Orders still expected on their requested date
+DUE_ORDER_STATUSES = (OrderStatus.PENDING, OrderStatus.CONFIRMED, OrderStatus.IN_TRANSIT)
+LOADED_OR_TRANSIT_BOX_STATUSES = (BoxStatus.LOADED, BoxStatus.IN_TRANSIT)
+TOP_ROUTE_STATUSES = (RouteStatus.COMPLETED, RouteStatus.IN_PROGRESS)
+
+# Seconds the unified metrics row is reused across endpoint calls
+UNIFIED_METRICS_TTL = 10
+
+_unified_metrics_memo: dict = {"expires_at": 0.0, "today": None, "row": None}
+
+# Seconds a built ChartsData is reused in-process (the Redis response
+# cache covers multi-instance deploys when REDIS_URL is set)
+CHARTS_DATA_TTL = 15
+
+_charts_data_memo: dict = {"expires_at": 0.0, "today": None, "data": None}
+
+
+def _percent(part, whole):
+    """
+    100 * part / whole rounded to 2 places, as a float; 0 when whole is 0
+    (NULLIF turns the zero denominator into NULL, COALESCE into 0).
+    """
+    return cast(
+        func.round(func.coalesce(100 * cast(part, Numeric) / func.nullif(whole, 0), 0), 2),
+        Float
+    )
+
+
+def _build_unified_metrics_query():
+    """
+    Build a single statement returning every overview/delivery/route/box
+    aggregate as one row: one CTE per table, cross-joined.
     
-    def __init__(self, db: AsyncSession):
-        self.db = db
+    The current date is bound at execution time as :today.
+    """
+    today = bindparam("today", type_=Date)
     
-    async def get_overview_stats(self) -> OverviewStats:
-        """Get high-level system statistics."""
-        # Outlet counts
-        total_outlets = await self.db.scalar(select(func.count(Outlet.id)))
-        active_outlets = await self.db.scalar(
-            select(func.count(Outlet.id)).where(Outlet.status == OutletStatus.ACTIVE)
-        )
-        
-        # Order counts
-        total_orders = await self.db.scalar(select(func.count(Order.id)))
-        pending_orders = await self.db.scalar(
-            select(func.count(Order.id)).where(
-                Order.status.in_([OrderStatus.PENDING, OrderStatus.CONFIRMED, OrderStatus.PACKING, OrderStatus.PACKED])
-            )
-        )
-        orders_in_transit = await self.db.scalar(
-            select(func.count(Order.id)).where(Order.status == OrderStatus.IN_TRANSIT)
-        )
-        delivered_orders = await self.db.scalar(
-            select(func.count(Order.id)).where(Order.status == OrderStatus.DELIVERED)
-        )
-        
-        # Route counts
-        total_routes = await self.db.scalar(select(func.count(Route.id)))
-        active_routes = await self.db.scalar(
-            select(func.count(Route.id)).where(Route.status == RouteStatus.IN_PROGRESS)
-        )
-        completed_routes = await self.db.scalar(
-            select(func.count(Route.id)).where(Route.status == RouteStatus.COMPLETED)
-        )
-        
-        # Box counts
-        total_boxes = await self.db.scalar(select(func.count(Box.id)))
-        
-        return OverviewStats(
-            total_outlets=total_outlets or 0,
-            active_outlets=active_outlets or 0,
-            total_orders=total_orders or 0,
-            pending_orders=pending_orders or 0,
-            orders_in_transit=orders_in_transit or 0,
-            delivered_orders=delivered_orders or 0,
-            total_routes=total_routes or 0,
-            active_routes=active_routes or 0,
-            completed_routes=completed_routes or 0,
-            total_boxes=total_boxes or 0
-        )
+    outlets = select(
+        func.count().label("total_outlets"),
+        func.count().filter(Outlet.status == OutletStatus.ACTIVE).label("active_outlets"),
+    ).cte("outlet_stats")
     
-    async def get_delivery_metrics(self) -> DeliveryMetrics:
-        """Get delivery performance metrics."""
-        today = date.today()
-        
-        # Total delivered vs total orders (excluding cancelled)
-        total_completed = await self.db.scalar(
-            select(func.count(Order.id)).where(
-                Order.status.in_([OrderStatus.DELIVERED, OrderStatus.PARTIAL])
-            )
-        ) or 0
-        
-        total_non_cancelled = await self.db.scalar(
-            select(func.count(Order.id)).where(
-                Order.status != OrderStatus.CANCELLED
-            )
-        ) or 1  # Avoid division by zero
-        
-        delivery_success_rate = (total_completed / total_non_cancelled) * 100
-        
-        # Average delivery time from route nodes
-        avg_service_time = await self.db.scalar(
-            select(func.avg(RouteNode.service_time_minutes)).where(
-                RouteNode.status == NodeStatus.COMPLETED
-            )
-        )
-        
-        # On-time delivery rate
-        on_time_count = await self.db.scalar(
-            select(func.count(Order.id)).where(
-                and_(
-                    Order.status == OrderStatus.DELIVERED,
-                    Order.actual_delivery_date <= Order.requested_delivery_date
-                )
+    orders = select(
+        func.count().label("total_orders"),
+        func.count().filter(
+            Order.status.in_(PENDING_ORDER_STATUSES)
+        ).label("pending_orders"),
+        func.count().filter(Order.status == OrderStatus.IN_TRANSIT).label("orders_in_transit"),
+        func.count().filter(Order.status == OrderStatus.DELIVERED).label("delivered_orders"),
+        func.count().filter(
+            Order.status.in_(COMPLETED_ORDER_STATUSES)
+        ).label("completed_orders"),
+        func.count().filter(Order.status != OrderStatus.CANCELLED).label("non_cancelled_orders"),
+        func.count().filter(
+            and_(
+                Order.status == OrderStatus.DELIVERED,
+                Order.actual_delivery_date <= Order.requested_delivery_date
             )
-        ) or 0
-        
-        total_with_deadline = await self.db.scalar(
-            select(func.count(Order.id)).where(
-                and_(
-                    Order.status == OrderStatus.DELIVERED,
-                    Order.requested_delivery_date.isnot(None)
-                )
+        ).label("on_time_orders"),
+        func.count().filter(
+            and_(
+                Order.status == OrderStatus.DELIVERED,
+                Order.requested_delivery_date.isnot(None)
             )
-        ) or 1
-        
-        on_time_rate = (on_time_count / total_with_deadline) * 100
-        
-        # Today's orders
-        orders_delivered_today = await self.db.scalar(
-            select(func.count(Order.id)).where(
-                and_(
-                    Order.status == OrderStatus.DELIVERED,
-                    Order.actual_delivery_date == today
-                )
+        ).label("delivered_with_deadline"),
+        func.count().filter(
+            and_(
+                Order.status == OrderStatus.DELIVERED,
+                Order.actual_delivery_date == today
             )
-        ) or 0
-        
-        orders_pending_today = await self.db.scalar(
-            select(func.count(Order.id)).where(
-                and_(
-                    Order.status.in_([OrderStatus.PENDING, OrderStatus.CONFIRMED, OrderStatus.IN_TRANSIT]),
-                    Order.requested_delivery_date == today
-                )
+        ).label("orders_delivered_today"),
+        func.count().filter(
+            and_(
+                Order.status.in_(DUE_ORDER_STATUSES),
+                Order.requested_delivery_date == today
             )
-        ) or 0
-        
-        return DeliveryMetrics(
-            delivery_success_rate=round(delivery_success_rate, 2),
-            avg_delivery_time_minutes=float(avg_service_time) if avg_service_time else None,
-            on_time_delivery_rate=round(on_time_rate, 2),
-            orders_delivered_today=orders_delivered_today,
-            orders_pending_today=orders_pending_today
-        )
+        ).label("orders_pending_today"),
+    ).cte("order_stats")
     
-    async def get_route_metrics(self) -> RouteMetrics:
-        """Get route performance metrics."""
-        today = date.today()
-        
-        # Average stops per route
-        avg_stops = await self.db.scalar(
-            select(func.avg(Route.planned_stops)).where(Route.planned_stops > 0)
-        ) or 0
-        
-        # Average completion percentage
-        completed_routes = await self.db.execute(
-            select(Route.completed_stops, Route.planned_stops).where(
-                and_(Route.planned_stops > 0, Route.status != RouteStatus.DRAFT)
-            )
-        )
-        routes_data = completed_routes.all()
-        
-        if routes_data:
-            total_completion = sum(
-                (r[0] / r[1] * 100) for r in routes_data if r[1] > 0
-            )
-            avg_completion = total_completion / len(routes_data)
-        else:
-            avg_completion = 0
-        
-        # Average distance
-        avg_distance = await self.db.scalar(
-            select(func.avg(Route.actual_distance_km)).where(
-                Route.actual_distance_km.isnot(None)
-            )
-        )
-        
-        # Average fuel efficiency
-        fuel_data = await self.db.execute(
-            select(Route.actual_distance_km, Route.fuel_consumed_liters).where(
-                and_(
-                    Route.actual_distance_km.isnot(None),
-                    Route.fuel_consumed_liters.isnot(None),
-                    Route.fuel_consumed_liters > 0
-                )
-            )
-        )
-        fuel_routes = fuel_data.all()
-        
-        if fuel_routes:
-            total_efficiency = sum(
-                float(r[0] / r[1]) for r in fuel_routes
-            )
-            avg_fuel_efficiency = total_efficiency / len(fuel_routes)
-        else:
-            avg_fuel_efficiency = None
-        
-        # Routes in progress
-        routes_in_progress = await self.db.scalar(
-            select(func.count(Route.id)).where(Route.status == RouteStatus.IN_PROGRESS)
-        ) or 0
-        
-        # Routes completed today
-        routes_completed_today = await self.db.scalar(
-            select(func.count(Route.id)).where(
-                and_(
-                    Route.status == RouteStatus.COMPLETED,
-                    Route.planned_date == today
-                )
-            )
-        ) or 0
-        
-        return RouteMetrics(
-            avg_stops_per_route=round(float(avg_stops), 2),
-            avg_route_completion=round(avg_completion, 2),
-            avg_distance_km=round(float(avg_distance), 2) if avg_distance else None,
-            avg_fuel_efficiency=round(avg_fuel_efficiency, 2) if avg_fuel_efficiency else None,
-            routes_in_progress=routes_in_progress,
-            routes_completed_today=routes_completed_today
-        )
+    nodes = select(
+        func.avg(RouteNode.service_time_minutes).filter(
+            RouteNode.status == NodeStatus.COMPLETED
+        ).label("avg_service_time"),
+    ).cte("node_stats")
     
-    async def get_box_metrics(self) -> BoxMetrics:
-        """Get box and packing metrics."""
-        # Total weight in transit
-        total_weight = await self.db.scalar(
-            select(func.sum(Box.weight_kg)).where(
-                Box.status.in_([BoxStatus.LOADED, BoxStatus.IN_TRANSIT])
-            )
-        ) or Decimal(0)
-        
-        # Average box weight
-        avg_weight = await self.db.scalar(
-            select(func.avg(Box.weight_kg)).where(Box.weight_kg > 0)
-        ) or Decimal(0)
-        
-        # Average fill percentage (volume_used / volume)
-        box_data = await self.db.execute(
-            select(Box.volume_used_cm3, Box.length_cm, Box.width_cm, Box.height_cm).where(
-                Box.volume_used_cm3 > 0
-            )
-        )
-        boxes = box_data.all()
-        
-        if boxes:
-            total_fill = sum(
-                float(b[0] / (b[1] * b[2] * b[3]) * 100) for b in boxes
+    routes = select(
+        func.count().label("total_routes"),
+        func.count().filter(Route.status == RouteStatus.IN_PROGRESS).label("active_routes"),
+        func.count().filter(Route.status == RouteStatus.COMPLETED).label("completed_routes"),
+        func.count().filter(
+            and_(
+                Route.status == RouteStatus.COMPLETED,
+                Route.planned_date == today
             )
-            avg_fill = total_fill / len(boxes)
-        else:
-            avg_fill = 0
-        
-        # Boxes in transit
-        boxes_in_transit = await self.db.scalar(
-            select(func.count(Box.id)).where(
-                Box.status.in_([BoxStatus.LOADED, BoxStatus.IN_TRANSIT])
-            )
-        ) or 0
-        
-        # Fragile boxes
-        fragile_boxes = await self.db.scalar(
-            select(func.count(Box.id)).where(Box.is_fragile == True)
-        ) or 0
-        
-        # Refrigerated boxes
-        refrigerated_boxes = await self.db.scalar(
-            select(func.count(Box.id)).where(Box.requires_refrigeration == True)
-        ) or 0
-        
-        return BoxMetrics(
-            total_weight_kg=round(float(total_weight), 2),
-            avg_box_weight_kg=round(float(avg_weight), 2),
-            avg_fill_percentage=round(avg_fill, 2),
-            boxes_in_transit=boxes_in_transit,
-            fragile_boxes=fragile_boxes,
-            refrigerated_boxes=refrigerated_boxes
-        )
+        ).label("routes_completed_today"),
+        func.avg(Route.planned_stops).filter(Route.planned_stops > 0).label("avg_stops"),
+        func.avg(Route.completion_pct).filter(
+            and_(Route.planned_stops > 0, Route.status != RouteStatus.DRAFT)
+        ).label("avg_completion"),
+        func.avg(Route.actual_distance_km).filter(
+            Route.actual_distance_km.isnot(None)
+        ).label("avg_distance"),
+        func.avg(Route.fuel_efficiency).label("avg_fuel_efficiency"),
+    ).cte("route_stats")
     
-    async def get_dashboard_overview(self) -> DashboardOverview:
-        """Get complete dashboard overview."""
-        stats = await self.get_overview_stats()
-        delivery_metrics = await self.get_delivery_metrics()
-        route_metrics = await self.get_route_metrics()
-        box_metrics = await self.get_box_metrics()
-        
-        return DashboardOverview(
-            stats=stats,
-            delivery_metrics=delivery_metrics,
-            route_metrics=route_metrics,
-            box_metrics=box_metrics,
-            generated_at=datetime.utcnow()
-        )
+    boxes = select(
+        func.count().label("total_boxes"),
+        func.sum(Box.weight_kg).filter(
+            Box.status.in_(LOADED_OR_TRANSIT_BOX_STATUSES)
+        ).label("total_weight_in_transit"),
+        func.avg(Box.weight_kg).filter(Box.weight_kg > 0).label("avg_box_weight"),
+        func.avg(Box.fill_pct).filter(Box.volume_used_cm3 > 0).label("avg_fill"),
+        func.count().filter(
+            Box.status.in_(LOADED_OR_TRANSIT_BOX_STATUSES)
+        ).label("boxes_in_transit"),
+        func.count().filter(Box.is_fragile == True).label("fragile_boxes"),
+        func.count().filter(Box.requires_refrigeration == True).label("refrigerated_boxes"),
+    ).cte("box_stats")
     
-    async def get_order_status_distribution(self) -> list[OrderStatusDistribution]:
-        """Get order distribution by status."""
-        result = await self.db.execute(
-            select(Order.status, func.count(Order.id)).group_by(Order.status)
-        )
-        data = result.all()
-        
-        total = sum(d[1] for d in data) or 1
-        
-        return [
-            OrderStatusDistribution(
-                status=d[0].value,
-                count=d[1],
-                percentage=round((d[1] / total) * 100, 2)
-            )
-            for d in data
-        ]
+    return select(
+        *outlets.c, *orders.c, *nodes.c, *routes.c, *boxes.c,
+        _percent(
+            orders.c.completed_orders, orders.c.non_cancelled_orders
+        ).label("delivery_success_rate"),
+        _percent(
+            orders.c.on_time_orders, orders.c.delivered_with_deadline
+        ).label("on_time_rate"),
+    ).select_from(
+        outlets
+        .join(orders, true())
+        .join(nodes, true())
+        .join(routes, true())
+        .join(boxes, true())
+    )
+
+
+# Fixed-shape statements are built once at import; only parameters vary
+_UNIFIED_METRICS_STMT = _build_unified_metrics_query()
+
+
+def _distribution_query(column):
+    """(value, count, percentage of all rows) per distinct column value."""
+    return select(
+        column,
+        func.count(),
+        _percent(func.count(), func.sum(func.count()).over())
+    ).group_by(column)
+
+
+_ORDER_STATUS_DIST_STMT = _distribution_query(Order.status)
+_ROUTE_STATUS_DIST_STMT = _distribution_query(Route.status)
+_OUTLET_PRIORITY_DIST_STMT = _distribution_query(Outlet.priority)
+_VEHICLE_TYPE_DIST_STMT = select(
+    Route.vehicle_type,
+    func.count(Route.id),
+    func.sum(Route.max_weight_kg)
+).where(
+    Route.vehicle_type.isnot(None)
+).group_by(Route.vehicle_type)
+
+
+def _build_delivery_trends_query():
+    """
+    Build one statement returning (kind, day, count) for delivered,
+    pending and cancelled orders over [:start, :end], grouped by day.
+    """
+    start = bindparam("start", type_=Date)
+    end = bindparam("end", type_=Date)
     
-    async def get_route_status_distribution(self) -> list[RouteStatusDistribution]:
-        """Get route distribution by status."""
-        result = await self.db.execute(
-            select(Route.status, func.count(Route.id)).group_by(Route.status)
-        )
-        data = result.all()
-        
-        total = sum(d[1] for d in data) or 1
-        
-        return [
-            RouteStatusDistribution(
-                status=d[0].value,
-                count=d[1],
-                percentage=round((d[1] / total) * 100, 2)
-            )
-            for d in data
-        ]
+    delivered = select(
+        literal("delivered").label("kind"),
+        Order.actual_delivery_date.label("day"),
+        func.count().label("count")
+    ).where(
+        Order.status == OrderStatus.DELIVERED,
+        Order.actual_delivery_date.between(start, end)
+    ).group_by(Order.actual_delivery_date)
     
-    async def get_outlet_priority_distribution(self) -> list[OutletPriorityDistribution]:
-        """Get outlet distribution by priority."""
-        result = await self.db.execute(
-            select(Outlet.priority, func.count(Outlet.id)).group_by(Outlet.priority)
-        )
-        data = result.all()
-        
-        total = sum(d[1] for d in data) or 1
-        
-        return [
-            OutletPriorityDistribution(
-                priority=d[0].name,
-                count=d[1],
-                percentage=round((d[1] / total) * 100, 2)
-            )
-            for d in data
-        ]
+    pending = select(
+        literal("pending"),
+        Order.requested_delivery_date,
+        func.count()
+    ).where(
+        Order.status.in_(DUE_ORDER_STATUSES),
+        Order.requested_delivery_date.between(start, end)
+    ).group_by(Order.requested_delivery_date)
     
-    async def get_vehicle_type_distribution(self) -> list[VehicleTypeDistribution]:
-        """Get routes distribution by vehicle type."""
-        result = await self.db.execute(
-            select(
-                Route.vehicle_type,
-                func.count(Route.id),
-                func.sum(Route.max_weight_kg)
-            ).where(
-                Route.vehicle_type.isnot(None)
-            ).group_by(Route.vehicle_type)
-        )
-        data = result.all()
-        
-        return [
-            VehicleTypeDistribution(
-                vehicle_type=d[0].value if d[0] else "unknown",
-                count=d[1],
-                total_capacity_kg=float(d[2] or 0)
-            )
-            for d in data
-        ]
+    # Range on the raw timestamp so an updated_at index stays usable
+    cancelled_day = cast(Order.updated_at, Date)
+    cancelled = select(
+        literal("cancelled"),
+        cancelled_day,
+        func.count()
+    ).where(
+        Order.status == OrderStatus.CANCELLED,
+        Order.updated_at >= cast(start, DateTime),
+        Order.updated_at < cast(end + 1, DateTime)
+    ).group_by(cancelled_day)
+    
+    return union_all(delivered, pending, cancelled)
+
+
+_DELIVERY_TRENDS_STMT = _build_delivery_trends_query()
+_RECENT_ACTIVITIES_STMT = select(
+    ActivityLog.entity_type,
+    ActivityLog.entity_id,
+    ActivityLog.action,
+    ActivityLog.description,
+    ActivityLog.ts
+).order_by(ActivityLog.ts.desc()).limit(bindparam("limit", type_=Integer))
+_TOP_ROUTES_STMT = select(
+    Route.route_code,
+    Route.planned_stops,
+    Route.completed_stops,
+    Route.completion_pct,
+    Route.actual_distance_km
+).where(
+    Route.status.in_(TOP_ROUTE_STATUSES)
+).order_by(
+    Route.planned_date.desc(), Route.id.desc()
+).limit(bindparam("limit", type_=Integer))
+
+
+async def _get_unified_metrics(db: AsyncSession, today: Optional[date] = None) -> dict:
+    """
+    Fetch all summary aggregates in one round-trip.
+    
+    The row is memoized for UNIFIED_METRICS_TTL seconds so the four
+    metric endpoints and /overview share a single query. The memo is
+    only reused for the same `today`, so it never straddles midnight.
+    """
+    today = today or date.today()
+    now = time.monotonic()
+    if (
+        _unified_metrics_memo["row"] is not None
+        and _unified_metrics_memo["today"] == today
+        and _unified_metrics_memo["expires_at"] > now
+    ):
+        return _unified_metrics_memo["row"]
+    
+    result = await db.execute(_UNIFIED_METRICS_STMT, {"today": today})
+    row = dict(result.one()._mapping)
+    
+    _unified_metrics_memo["row"] = row
+    _unified_metrics_memo["today"] = today
+    _unified_metrics_memo["expires_at"] = now + UNIFIED_METRICS_TTL
+    return row
+
+
+def _build_overview_stats(row: dict) -> OverviewStats:
+    return OverviewStats.model_construct(
+        total_outlets=row["total_outlets"] or 0,
+        active_outlets=row["active_outlets"] or 0,
+        total_orders=row["total_orders"] or 0,
+        pending_orders=row["pending_orders"] or 0,
+        orders_in_transit=row["orders_in_transit"] or 0,
+        delivered_orders=row["delivered_orders"] or 0,
+        total_routes=row["total_routes"] or 0,
+        active_routes=row["active_routes"] or 0,
+        completed_routes=row["completed_routes"] or 0,
+        total_boxes=row["total_boxes"] or 0
+    )
+
+
+def _build_delivery_metrics(row: dict) -> DeliveryMetrics:
+    avg_service_time = row["avg_service_time"]
+    
+    return DeliveryMetrics.model_construct(
+        delivery_success_rate=row["delivery_success_rate"],
+        avg_delivery_time_minutes=float(avg_service_time) if avg_service_time else None,
+        on_time_delivery_rate=row["on_time_rate"],
+        orders_delivered_today=row["orders_delivered_today"],
+        orders_pending_today=row["orders_pending_today"]
+    )
+
+
+def _build_route_metrics(row: dict) -> RouteMetrics:
+    avg_distance = row["avg_distance"]
+    avg_fuel_efficiency = row["avg_fuel_efficiency"]
+    
+    return RouteMetrics.model_construct(
+        avg_stops_per_route=round(float(row["avg_stops"] or 0), 2),
+        avg_route_completion=round(row["avg_completion"] or 0.0, 2),
+        avg_distance_km=round(avg_distance, 2) if avg_distance else None,
+        avg_fuel_efficiency=round(avg_fuel_efficiency, 2) if avg_fuel_efficiency else None,
+        routes_in_progress=row["active_routes"] or 0,
+        routes_completed_today=row["routes_completed_today"] or 0
+    )
+
+
+def _build_box_metrics(row: dict) -> BoxMetrics:
+    return BoxMetrics.model_construct(
+        total_weight_kg=round(row["total_weight_in_transit"] or 0.0, 2),
+        avg_box_weight_kg=round(row["avg_box_weight"] or 0.0, 2),
+        avg_fill_percentage=round(row["avg_fill"] or 0.0, 2),
+        boxes_in_transit=row["boxes_in_transit"] or 0,
+        fragile_boxes=row["fragile_boxes"] or 0,
+        refrigerated_boxes=row["refrigerated_boxes"] or 0
+    )
+
+
+async def get_overview_stats(db: AsyncSession, today: Optional[date] = None) -> OverviewStats:
+    """Get high-level system statistics."""
+    return _build_overview_stats(await _get_unified_metrics(db, today))
+
+
+async def get_delivery_metrics(db: AsyncSession, today: Optional[date] = None) -> DeliveryMetrics:
+    """Get delivery performance metrics."""
+    return _build_delivery_metrics(await _get_unified_metrics(db, today))
+
+
+async def get_route_metrics(db: AsyncSession, today: Optional[date] = None) -> RouteMetrics:
+    """Get route performance metrics."""
+    return _build_route_metrics(await _get_unified_metrics(db, today))
+
+
+async def get_box_metrics(db: AsyncSession, today: Optional[date] = None) -> BoxMetrics:
+    """Get box and packing metrics."""
+    return _build_box_metrics(await _get_unified_metrics(db, today))
+
+
+async def get_dashboard_overview(db: AsyncSession) -> DashboardOverview:
+    """Get complete dashboard overview (single aggregate query)."""
+    row = await _get_unified_metrics(db)
     
-    async def get_delivery_trends(self, days: int = 7) -> list[DeliveryTrend]:
-        """Get delivery trends for the past N days."""
-        trends = []
-        today = date.today()
-        
-        for i in range(days - 1, -1, -1):
-            day = today - timedelta(days=i)
-            
-            delivered = await self.db.scalar(
-                select(func.count(Order.id)).where(
-                    and_(
-                        Order.status == OrderStatus.DELIVERED,
-                        Order.actual_delivery_date == day
-                    )
-                )
-            ) or 0
-            
-            pending = await self.db.scalar(
-                select(func.count(Order.id)).where(
-                    and_(
-                        Order.status.in_([OrderStatus.PENDING, OrderStatus.CONFIRMED, OrderStatus.IN_TRANSIT]),
-                        Order.requested_delivery_date == day
-                    )
-                )
-            ) or 0
-            
-            cancelled = await self.db.scalar(
-                select(func.count(Order.id)).where(
-                    and_(
-                        Order.status == OrderStatus.CANCELLED,
-                        func.date(Order.updated_at) == day
-                    )
-                )
-            ) or 0
-            
-            trends.append(DeliveryTrend(
-                date=day.isoformat(),
-                delivered=delivered,
-                pending=pending,
-                cancelled=cancelled
-            ))
-        
-        return trends
+    return DashboardOverview.model_construct(
+        stats=_build_overview_stats(row),
+        delivery_metrics=_build_delivery_metrics(row),
+        route_metrics=_build_route_metrics(row),
+        box_metrics=_build_box_metrics(row),
+        generated_at=datetime.utcnow()
+    )
+
+
+async def get_order_status_distribution(db: AsyncSession) -> list[OrderStatusDistribution]:
+    """Get order distribution by status."""
+    result = await db.execute(_ORDER_STATUS_DIST_STMT)
     
-    async def get_top_routes(self, limit: int = 10) -> list[RouteEfficiency]:
-        """Get top performing routes."""
-        result = await self.db.execute(
-            select(Route).where(
-                Route.status.in_([RouteStatus.COMPLETED, RouteStatus.IN_PROGRESS])
-            ).order_by(Route.planned_date.desc()).limit(limit)
+    return [
+        OrderStatusDistribution.model_construct(
+            status=value.value,
+            count=count,
+            percentage=percentage
         )
-        routes = result.scalars().all()
-        
-        return [
-            RouteEfficiency(
-                route_code=r.route_code,
-                planned_stops=r.planned_stops,
-                completed_stops=r.completed_stops,
-                completion_rate=round(r.completion_percentage, 2),
-                distance_km=float(r.actual_distance_km) if r.actual_distance_km else None
-            )
-            for r in routes
-        ]
+        for value, count, percentage in result.all()
+    ]
+
+
+async def get_route_status_distribution(db: AsyncSession) -> list[RouteStatusDistribution]:
+    """Get route distribution by status."""
+    result = await db.execute(_ROUTE_STATUS_DIST_STMT)
     
-    async def get_charts_data(self) -> ChartsData:
-        """Get all chart data for visualization."""
-        order_dist = await self.get_order_status_distribution()
-        route_dist = await self.get_route_status_distribution()
-        outlet_dist = await self.get_outlet_priority_distribution()
-        vehicle_dist = await self.get_vehicle_type_distribution()
-        trends = await self.get_delivery_trends()
-        top_routes = await self.get_top_routes()
-        
-        return ChartsData(
-            order_status_distribution=order_dist,
-            route_status_distribution=route_dist,
-            outlet_priority_distribution=outlet_dist,
-            vehicle_type_distribution=vehicle_dist,
-            delivery_trends=trends,
-            top_routes=top_routes,
-            generated_at=datetime.utcnow()
+    return [
+        RouteStatusDistribution.model_construct(
+            status=value.value,
+            count=count,
+            percentage=percentage
         )
+        for value, count, percentage in result.all()
+    ]
+
+
+async def get_outlet_priority_distribution(db: AsyncSession) -> list[OutletPriorityDistribution]:
+    """Get outlet distribution by priority."""
+    result = await db.execute(_OUTLET_PRIORITY_DIST_STMT)
     
-    async def get_recent_activities(self, limit: int = 20) -> RecentActivitiesResponse:
-        """Get recent system activities."""
-        activities = []
-        
-        # Recent orders
-        recent_orders = await self.db.execute(
-            select(Order).order_by(Order.updated_at.desc()).limit(limit // 3)
+    return [
+        OutletPriorityDistribution.model_construct(
+            priority=value.name,
+            count=count,
+            percentage=percentage
         )
-        for order in recent_orders.scalars().all():
-            action = "created" if order.created_at == order.updated_at else "updated"
-            if order.status == OrderStatus.DELIVERED:
-                action = "delivered"
-            activities.append(RecentActivity(
-                id=order.id,
-                type="order",
-                action=action,
-                description=f"Order {order.order_number} {action}",
-                timestamp=order.updated_at
-            ))
-        
-        # Recent routes
-        recent_routes = await self.db.execute(
-            select(Route).order_by(Route.updated_at.desc()).limit(limit // 3)
+        for value, count, percentage in result.all()
+    ]
+
+
+async def get_vehicle_type_distribution(db: AsyncSession) -> list[VehicleTypeDistribution]:
+    """Get routes distribution by vehicle type."""
+    result = await db.execute(_VEHICLE_TYPE_DIST_STMT)
+    data = result.all()
+    
+    return [
+        VehicleTypeDistribution.model_construct(
+            vehicle_type=d[0].value if d[0] else "unknown",
+            count=d[1],
+            total_capacity_kg=d[2] or 0.0
         )
-        for route in recent_routes.scalars().all():
-            action = "created" if route.created_at == route.updated_at else "updated"
-            if route.status == RouteStatus.COMPLETED:
-                action = "completed"
-            elif route.status == RouteStatus.IN_PROGRESS:
-                action = "started"
-            activities.append(RecentActivity(
-                id=route.id,
-                type="route",
-                action=action,
-                description=f"Route {route.route_code} {action}",
-                timestamp=route.updated_at
-            ))
-        
-        # Recent outlets
-        recent_outlets = await self.db.execute(
-            select(Outlet).order_by(Outlet.updated_at.desc()).limit(limit // 3)
+        for d in data
+    ]
+
+
+async def get_delivery_trends(
+    db: AsyncSession,
+    days: int = 7,
+    today: Optional[date] = None
+) -> list[DeliveryTrend]:
+    """
+    Get delivery trends for the past N days.
+    All days are counted in one grouped query; days without orders are 0.
+    """
+    today = today or date.today()
+    start = today - timedelta(days=days - 1)
+    
+    result = await db.execute(_DELIVERY_TRENDS_STMT, {"start": start, "end": today})
+    counts = {(kind, day): count for kind, day, count in result.all()}
+    
+    trends = []
+    for i in range(days - 1, -1, -1):
+        day = today - timedelta(days=i)
+        trends.append(DeliveryTrend.model_construct(
+            date=day.isoformat(),
+            delivered=counts.get(("delivered", day), 0),
+            pending=counts.get(("pending", day), 0),
+            cancelled=counts.get(("cancelled", day), 0)
+        ))
+    
+    return trends
+
+
+async def get_top_routes(db: AsyncSession, limit: int = 10) -> list[RouteEfficiency]:
+    """
+    Get top performing routes.
+    Selects only the columns the chart needs instead of whole Route rows.
+    """
+    result = await db.execute(_TOP_ROUTES_STMT, {"limit": limit})
+    
+    return [
+        RouteEfficiency.model_construct(
+            route_code=route_code,
+            planned_stops=planned_stops,
+            completed_stops=completed_stops,
+            completion_rate=round(completion_pct or 0.0, 2),
+            distance_km=distance_km or None
         )
-        for outlet in recent_outlets.scalars().all():
-            action = "created" if outlet.created_at == outlet.updated_at else "updated"
-            activities.append(RecentActivity(
-                id=outlet.id,
-                type="outlet",
-                action=action,
-                description=f"Outlet {outlet.name} {action}",
-                timestamp=outlet.updated_at
-            ))
-        
-        # Sort by timestamp
-        activities.sort(key=lambda x: x.timestamp, reverse=True)
-        activities = activities[:limit]
-        
-        return RecentActivitiesResponse(
-            activities=activities,
-            total=len(activities)
+        for route_code, planned_stops, completed_stops, completion_pct, distance_km in result.all()
+    ]
+
+
+async def _in_own_session(query_fn):
+    """Run query_fn(session) on a fresh session so it can run concurrently."""
+    async with async_session_maker() as session:
+        return await query_fn(session)
+
+
+async def get_charts_data(db: AsyncSession) -> ChartsData:
+    """
+    Get all chart data for visualization.
+    
+    The six chart queries run concurrently; an AsyncSession cannot run
+    statements in parallel, so all but the first get their own session.
+    The date is read once and shared by every sub-query; the result is
+    memoized for CHARTS_DATA_TTL seconds.
+    """
+    today = date.today()
+    now = time.monotonic()
+    if (
+        _charts_data_memo["data"] is not None
+        and _charts_data_memo["today"] == today
+        and _charts_data_memo["expires_at"] > now
+    ):
+        return _charts_data_memo["data"]
+    
+    (
+        order_dist, route_dist, outlet_dist, vehicle_dist, trends, top_routes
+    ) = await asyncio.gather(
+        get_order_status_distribution(db),
+        _in_own_session(get_route_status_distribution),
+        _in_own_session(get_outlet_priority_distribution),
+        _in_own_session(get_vehicle_type_distribution),
+        _in_own_session(lambda session: get_delivery_trends(session, today=today)),
+        _in_own_session(get_top_routes),
+    )
+    
+    data = ChartsData.model_construct(
+        order_status_distribution=order_dist,
+        route_status_distribution=route_dist,
+        outlet_priority_distribution=outlet_dist,
+        vehicle_type_distribution=vehicle_dist,
+        delivery_trends=trends,
+        top_routes=top_routes,
+        generated_at=datetime.utcnow()
+    )
+    
+    _charts_data_memo["data"] = data
+    _charts_data_memo["today"] = today
+    _charts_data_memo["expires_at"] = now + CHARTS_DATA_TTL
+    return data
+
+
+async def get_recent_activities(db: AsyncSession, limit: int = 20) -> RecentActivitiesResponse:
+    """
+    Get recent system activities.
+    Reads the tail of activity_log, which triggers on orders, routes
+    and outlets keep up to date; one index scan of idx_activity_log_ts.
+    Each write is its own entry, newest first across all entity types,
+    so a busy entity can fill the feed with several of its own updates.
+    """
+    result = await db.execute(_RECENT_ACTIVITIES_STMT, {"limit": limit})
+    
+    activities = [
+        RecentActivity.model_construct(
+            id=entity_id,
+            type=entity_type.value,
+            action=action,
+            description=description,
+            timestamp=ts
         )
+        for entity_type, entity_id, action, description, ts in result.all()
+    ]
+    
+    return RecentActivitiesResponse.model_construct(
+        activities=activities,
+        total=len(activities)
+    )
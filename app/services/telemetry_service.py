@@ -0,0 +1,25 @@
+"""
+Background reduction of buffered driver telemetry into route nodes.
+"""
+import asyncio
+import logging
+
+from app.core.database import async_session_maker
+from app.repositories.telemetry_repository import TelemetryRepository
+
+logger = logging.getLogger(__name__)
+
+
+async def run_telemetry_reducer(interval_seconds: float) -> None:
+    """
+    Fold the telemetry_events buffer into route_nodes every
+    `interval_seconds` until cancelled. Failures are logged and retried
+    on the next tick.
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            async with async_session_maker() as session:
+                await TelemetryRepository(session).reduce()
+        except Exception as e:
+            logger.warning(f"Telemetry reduction failed: {e}")
@@ -11,7 +11,20 @@ Note: The 'js' module only exists in Cloudflare Workers runtime.
 VS Code will show import errors locally - this is expected.
 """
 from typing import TYPE_CHECKING, Any
-import json
+
+# orjson is used when the Pyodide build ships it; stdlib json otherwise
+try:
+    import orjson
+    
+    def dumps(data: Any) -> str:
+        # Response.new needs a JS string: Python bytes would cross the
+        # FFI as a proxy, so decode here (a single C-level UTF-8 pass)
+        return orjson.dumps(data).decode("utf-8")
+except ImportError:
+    import json
+    
+    def dumps(data: Any) -> str:
+        return json.dumps(data)
 
 # Cloudflare Workers runtime provides the 'js' module
 # This try/except allows the file to be parsed locally without errors
@@ -25,35 +38,62 @@ if TYPE_CHECKING:
         @staticmethod
         def new() -> "Headers": ...
         def set(self, key: str, value: str) -> None: ...
+    
+    class console:
+        @staticmethod
+        def error(*args: Any) -> None: ...
 else:
     try:
-        from js import Response, Headers  # type: ignore[import-not-found]
+        from js import Response, Headers, console  # type: ignore[import-not-found]
     except ImportError:
         # Stubs for local testing (won't actually work)
         Response = None  # type: ignore
         Headers = None  # type: ignore
+        console = None  # type: ignore
+
+
+# Every route is read-only
+CORS_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "GET, OPTIONS",
+    "Access-Control-Allow-Headers": "Content-Type, Authorization",
+}
+
+# Seconds browsers may cache a preflight. Firefox caps this at 86400 and
+# Chromium at 7200, so a larger value would buy nothing
+PREFLIGHT_MAX_AGE = 86400
+
+
+def build_headers(values: dict):
+    """Create a JS Headers object from a dict."""
+    headers = Headers.new()
+    for key, value in values.items():
+        headers.set(key, value)
+    return headers
+
+
+# Built once: each set() is a Python -> JS call, and Response.new copies
+# its init headers, so one object can back every response
+if Headers is not None:
+    JSON_HEADERS = build_headers({"Content-Type": "application/json", **CORS_HEADERS})
+    PREFLIGHT_HEADERS = build_headers({**CORS_HEADERS, "Access-Control-Max-Age": str(PREFLIGHT_MAX_AGE)})
+else:
+    JSON_HEADERS = PREFLIGHT_HEADERS = None
 
 
 def create_json_response(data: dict, status: int = 200):
     """Create a JSON response with proper headers."""
-    headers = Headers.new()
-    headers.set("Content-Type", "application/json")
-    headers.set("Access-Control-Allow-Origin", "*")
-    headers.set("Access-Control-Allow-Methods", "GET, POST, PUT, DELETE, OPTIONS")
-    headers.set("Access-Control-Allow-Headers", "Content-Type, Authorization")
-    
-    body = json.dumps(data)
-    return Response.new(body, status=status, headers=headers)
+    return json_body_response(dumps(data), status=status)
+
+
+def json_body_response(body: str, status: int = 200):
+    """Create a JSON response from an already serialized body."""
+    return Response.new(body, status=status, headers=JSON_HEADERS)
 
 
 def handle_cors_preflight() -> Response:
     """Handle CORS preflight requests."""
-    headers = Headers.new()
-    headers.set("Access-Control-Allow-Origin", "*")
-    headers.set("Access-Control-Allow-Methods", "GET, POST, PUT, DELETE, OPTIONS")
-    headers.set("Access-Control-Allow-Headers", "Content-Type, Authorization")
-    headers.set("Access-Control-Max-Age", "86400")
-    return Response.new("", status=204, headers=headers)
+    return Response.new("", status=204, headers=PREFLIGHT_HEADERS)
 
 
 # Route handlers
@@ -118,6 +158,56 @@ ROUTES = {
     "/env": handle_env,
 }
 
+# Bodies of the constant endpoints, serialized once at import
+STATIC_BODIES = {
+    "/": dumps(handle_root(None)),
+    "/health": dumps(handle_health(None)),
+    "/api/v1/status": dumps(handle_api_status(None)),
+}
+
+# Handler failures are logged, not echoed back to the client
+INTERNAL_ERROR_BODY = dumps({"error": "Internal Server Error"})
+
+# 404 body with the path spliced in as an escaped JSON string
+_PATH_PLACEHOLDER = "__path__"
+_NOT_FOUND_TEMPLATE = dumps(handle_not_found(_PATH_PLACEHOLDER))
+
+
+def not_found_body(path: str) -> str:
+    """Serialized 404 body for a path."""
+    return _NOT_FOUND_TEMPLATE.replace(_PATH_PLACEHOLDER, dumps(path)[1:-1])
+
+
+# Normalized path per request URL, kept for the life of the isolate.
+# Query strings make the key space unbounded, so it is reset when full
+PATH_CACHE_SIZE = 256
+PATH_CACHE: dict = {}
+
+
+def request_path(url: str) -> str:
+    """
+    Normalized path of an absolute request URL.
+    Plain find() slicing instead of urlparse; query and fragment are
+    dropped and a trailing slash is removed (except for root).
+    """
+    scheme_end = url.find("://")
+    authority = scheme_end + 3 if scheme_end >= 0 else 0
+    
+    end = len(url)
+    for separator in ("?", "#"):
+        index = url.find(separator, authority, end)
+        if index >= 0:
+            end = index
+    
+    start = url.find("/", authority, end)
+    if start < 0:
+        return "/"
+    
+    path = url[start:end]
+    if path != "/" and path.endswith("/"):
+        path = path.rstrip("/") or "/"
+    return path
+
 
 async def on_fetch(request, env):
     """
@@ -128,22 +218,18 @@ async def on_fetch(request, env):
     if request.method == "OPTIONS":
         return handle_cors_preflight()
     
-    # Parse URL path
     url = request.url
-    # Extract path from URL
-    try:
-        from urllib.parse import urlparse
-        parsed = urlparse(url)
-        path = parsed.path or "/"
-    except:
-        # Fallback: manual path extraction
-        path = "/" + url.split("//", 1)[-1].split("/", 1)[-1].split("?")[0]
-        if not path.startswith("/"):
-            path = "/" + path
+    path = PATH_CACHE.get(url)
+    if path is None:
+        path = request_path(url)
+        if len(PATH_CACHE) >= PATH_CACHE_SIZE:
+            PATH_CACHE.clear()
+        PATH_CACHE[url] = path
     
-    # Remove trailing slash (except for root)
-    if path != "/" and path.endswith("/"):
-        path = path.rstrip("/")
+    # Constant endpoints skip the handler and serialization
+    body = STATIC_BODIES.get(path)
+    if body is not None:
+        return json_body_response(body, status=200)
     
     # Route the request
     handler = ROUTES.get(path)
@@ -153,9 +239,7 @@ async def on_fetch(request, env):
             data = handler(env)
             return create_json_response(data, status=200)
         except Exception as e:
-            return create_json_response(
-                {"error": "Internal Server Error", "details": str(e)},
-                status=500
-            )
+            console.error(f"{path}: {e!r}")
+            return json_body_response(INTERNAL_ERROR_BODY, status=500)
     else:
-        return create_json_response(handle_not_found(path), status=404)
+        return json_body_response(not_found_body(path), status=404)
@@ -0,0 +1,9 @@
+-- ============================================
+-- Geography expression index for outlet radius search
+-- ============================================
+-- OutletRepository.find_nearby filters with ST_DWithin on
+-- location::geography; the plain geometry GiST index cannot serve that
+-- expression. New databases get this index from create_all.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_outlet_location_geog
+    ON outlets USING GIST ((location::geography(GEOMETRY, 4326)));
@@ -0,0 +1,14 @@
+-- ============================================
+-- Indexes for the paginated outlet list
+-- ============================================
+-- OutletRepository.get_all filters on status/priority and orders by
+-- (priority, name, id). These let the page be read in index order
+-- instead of sorting the whole table. The partial index covers the
+-- common "active only" listing. New databases get them from create_all.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_outlet_status_priority_name_id
+    ON outlets (status, priority, name, id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_outlet_active_priority_name_id
+    ON outlets (priority, name, id)
+    WHERE status = 'ACTIVE';
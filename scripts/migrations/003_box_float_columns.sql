@@ -0,0 +1,14 @@
+-- ============================================
+-- Box physical quantities: NUMERIC -> DOUBLE PRECISION
+-- ============================================
+-- Dimensions, weights and used volume are only used for arithmetic
+-- (volume, fill percentage, remaining capacity, dashboard averages),
+-- never for exact sums.
+
+ALTER TABLE boxes
+    ALTER COLUMN length_cm TYPE double precision USING length_cm::double precision,
+    ALTER COLUMN width_cm TYPE double precision USING width_cm::double precision,
+    ALTER COLUMN height_cm TYPE double precision USING height_cm::double precision,
+    ALTER COLUMN weight_kg TYPE double precision USING weight_kg::double precision,
+    ALTER COLUMN max_weight_kg TYPE double precision USING max_weight_kg::double precision,
+    ALTER COLUMN volume_used_cm3 TYPE double precision USING volume_used_cm3::double precision;
@@ -0,0 +1,13 @@
+-- ============================================
+-- Generated volume / fill percentage columns on boxes
+-- ============================================
+-- Lets the dashboard box metrics aggregate AVG(fill_pct) directly.
+
+ALTER TABLE boxes
+    ADD COLUMN IF NOT EXISTS volume_cm3 double precision
+        GENERATED ALWAYS AS (length_cm * width_cm * height_cm) STORED,
+    ADD COLUMN IF NOT EXISTS fill_pct double precision
+        GENERATED ALWAYS AS (
+            CASE WHEN length_cm * width_cm * height_cm = 0 THEN 0
+            ELSE 100.0 * volume_used_cm3 / (length_cm * width_cm * height_cm) END
+        ) STORED;
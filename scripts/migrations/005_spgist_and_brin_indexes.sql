@@ -0,0 +1,17 @@
+-- ============================================
+-- Smaller spatial / time indexes
+-- ============================================
+-- outlets.location: one SP-GiST index replaces the two identical GiST
+-- indexes (the explicit one and GeoAlchemy2's automatic one).
+-- route_nodes.arrival_time: BRIN replaces the two B-tree indexes.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_outlet_location_spgist
+    ON outlets USING SPGIST (location);
+DROP INDEX CONCURRENTLY IF EXISTS idx_outlet_location;
+DROP INDEX CONCURRENTLY IF EXISTS idx_outlets_location;
+ALTER INDEX idx_outlet_location_spgist RENAME TO idx_outlet_location;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_route_node_arrival_time_brin
+    ON route_nodes USING BRIN (arrival_time) WITH (pages_per_range = 32);
+DROP INDEX CONCURRENTLY IF EXISTS idx_route_node_arrival_time;
+DROP INDEX CONCURRENTLY IF EXISTS ix_route_nodes_arrival_time;
@@ -0,0 +1,22 @@
+-- ============================================
+-- Volumes, weights and distances: NUMERIC -> DOUBLE PRECISION
+-- ============================================
+-- Monetary (orders.order_value) and fuel columns stay NUMERIC.
+
+ALTER TABLE orders
+    ALTER COLUMN total_volume_cm3 TYPE double precision USING total_volume_cm3::double precision,
+    ALTER COLUMN total_weight_kg TYPE double precision USING total_weight_kg::double precision;
+
+ALTER TABLE routes
+    ALTER COLUMN max_weight_kg TYPE double precision USING max_weight_kg::double precision,
+    ALTER COLUMN max_volume_cm3 TYPE double precision USING max_volume_cm3::double precision,
+    ALTER COLUMN planned_distance_km TYPE double precision USING planned_distance_km::double precision,
+    ALTER COLUMN actual_distance_km TYPE double precision USING actual_distance_km::double precision,
+    ALTER COLUMN total_weight_kg TYPE double precision USING total_weight_kg::double precision;
+
+ALTER TABLE route_nodes
+    ALTER COLUMN distance_from_previous_km TYPE double precision USING distance_from_previous_km::double precision,
+    ALTER COLUMN cumulative_distance_km TYPE double precision USING cumulative_distance_km::double precision,
+    ALTER COLUMN odometer_arrival_km TYPE double precision USING odometer_arrival_km::double precision,
+    ALTER COLUMN odometer_departure_km TYPE double precision USING odometer_departure_km::double precision,
+    ALTER COLUMN geofence_distance_meters TYPE double precision USING geofence_distance_meters::double precision;
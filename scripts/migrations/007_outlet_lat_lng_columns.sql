@@ -0,0 +1,10 @@
+-- ============================================
+-- Stored lat/lng columns on outlets
+-- ============================================
+-- Generated from location, so they stay in sync without a trigger.
+
+ALTER TABLE outlets
+    ADD COLUMN IF NOT EXISTS lat double precision
+        GENERATED ALWAYS AS (ST_Y(location)) STORED,
+    ADD COLUMN IF NOT EXISTS lng double precision
+        GENERATED ALWAYS AS (ST_X(location)) STORED;
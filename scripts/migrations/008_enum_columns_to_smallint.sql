@@ -0,0 +1,145 @@
+-- ============================================
+-- Enum columns as SMALLINT codes
+-- ============================================
+-- Replaces the PostgreSQL ENUM types with SMALLINT + CHECK. Codes come
+-- from app.core.types.SmallIntEnum: priorities keep their numeric value,
+-- other enums use declaration order. ENUM columns stored member names.
+
+BEGIN;
+
+-- Predicate compares against the old enum label; recreated below
+DROP INDEX IF EXISTS idx_outlet_active_priority_name_id;
+
+ALTER TABLE outlets
+    ALTER COLUMN priority TYPE smallint USING (
+        CASE priority::text
+            WHEN 'CRITICAL' THEN 1
+            WHEN 'HIGH' THEN 2
+            WHEN 'MEDIUM' THEN 3
+            WHEN 'LOW' THEN 4
+            WHEN 'DEFERRED' THEN 5
+        END
+    ),
+    ALTER COLUMN status TYPE smallint USING (
+        CASE status::text
+            WHEN 'ACTIVE' THEN 0
+            WHEN 'INACTIVE' THEN 1
+            WHEN 'SUSPENDED' THEN 2
+            WHEN 'PENDING' THEN 3
+        END
+    );
+
+ALTER TABLE outlets ADD CONSTRAINT check_outlet_priority CHECK (priority IN (1, 2, 3, 4, 5));
+ALTER TABLE outlets ADD CONSTRAINT check_outlet_status CHECK (status IN (0, 1, 2, 3));
+
+ALTER TABLE orders
+    ALTER COLUMN status TYPE smallint USING (
+        CASE status::text
+            WHEN 'PENDING' THEN 0
+            WHEN 'CONFIRMED' THEN 1
+            WHEN 'PACKING' THEN 2
+            WHEN 'PACKED' THEN 3
+            WHEN 'IN_TRANSIT' THEN 4
+            WHEN 'DELIVERED' THEN 5
+            WHEN 'PARTIAL' THEN 6
+            WHEN 'CANCELLED' THEN 7
+            WHEN 'RETURNED' THEN 8
+        END
+    ),
+    ALTER COLUMN priority TYPE smallint USING (
+        CASE priority::text
+            WHEN 'URGENT' THEN 1
+            WHEN 'HIGH' THEN 2
+            WHEN 'NORMAL' THEN 3
+            WHEN 'LOW' THEN 4
+        END
+    );
+
+ALTER TABLE orders ADD CONSTRAINT check_order_priority CHECK (priority IN (1, 2, 3, 4));
+ALTER TABLE orders ADD CONSTRAINT check_order_status CHECK (status IN (0, 1, 2, 3, 4, 5, 6, 7, 8));
+
+ALTER TABLE boxes
+    ALTER COLUMN size_category TYPE smallint USING (
+        CASE size_category::text
+            WHEN 'SMALL' THEN 0
+            WHEN 'MEDIUM' THEN 1
+            WHEN 'LARGE' THEN 2
+            WHEN 'XLARGE' THEN 3
+            WHEN 'CUSTOM' THEN 4
+        END
+    ),
+    ALTER COLUMN status TYPE smallint USING (
+        CASE status::text
+            WHEN 'EMPTY' THEN 0
+            WHEN 'PACKING' THEN 1
+            WHEN 'SEALED' THEN 2
+            WHEN 'LOADED' THEN 3
+            WHEN 'IN_TRANSIT' THEN 4
+            WHEN 'DELIVERED' THEN 5
+            WHEN 'RETURNED' THEN 6
+        END
+    );
+
+ALTER TABLE boxes ADD CONSTRAINT check_box_size_category CHECK (size_category IN (0, 1, 2, 3, 4));
+ALTER TABLE boxes ADD CONSTRAINT check_box_status CHECK (status IN (0, 1, 2, 3, 4, 5, 6));
+
+ALTER TABLE routes
+    ALTER COLUMN vehicle_type TYPE smallint USING (
+        CASE vehicle_type::text
+            WHEN 'MOTORCYCLE' THEN 0
+            WHEN 'VAN' THEN 1
+            WHEN 'TRUCK_SMALL' THEN 2
+            WHEN 'TRUCK_MEDIUM' THEN 3
+            WHEN 'TRUCK_LARGE' THEN 4
+            WHEN 'REFRIGERATED' THEN 5
+        END
+    ),
+    ALTER COLUMN status TYPE smallint USING (
+        CASE status::text
+            WHEN 'DRAFT' THEN 0
+            WHEN 'PLANNED' THEN 1
+            WHEN 'ASSIGNED' THEN 2
+            WHEN 'IN_PROGRESS' THEN 3
+            WHEN 'COMPLETED' THEN 4
+            WHEN 'CANCELLED' THEN 5
+            WHEN 'PARTIAL' THEN 6
+        END
+    );
+
+ALTER TABLE routes ADD CONSTRAINT check_route_status CHECK (status IN (0, 1, 2, 3, 4, 5, 6));
+ALTER TABLE routes ADD CONSTRAINT check_route_vehicle_type CHECK (vehicle_type IN (0, 1, 2, 3, 4, 5));
+
+ALTER TABLE route_nodes
+    ALTER COLUMN status TYPE smallint USING (
+        CASE status::text
+            WHEN 'PENDING' THEN 0
+            WHEN 'EN_ROUTE' THEN 1
+            WHEN 'ARRIVED' THEN 2
+            WHEN 'SERVICING' THEN 3
+            WHEN 'COMPLETED' THEN 4
+            WHEN 'FAILED' THEN 5
+            WHEN 'SKIPPED' THEN 6
+        END
+    ),
+    ALTER COLUMN delivery_result TYPE smallint USING (
+        CASE delivery_result::text
+            WHEN 'SUCCESS' THEN 0
+            WHEN 'PARTIAL' THEN 1
+            WHEN 'RECIPIENT_ABSENT' THEN 2
+            WHEN 'REFUSED' THEN 3
+            WHEN 'WRONG_ADDRESS' THEN 4
+            WHEN 'ACCESS_DENIED' THEN 5
+            WHEN 'OTHER_FAILURE' THEN 6
+        END
+    );
+
+ALTER TABLE route_nodes ADD CONSTRAINT check_route_node_delivery_result CHECK (delivery_result IN (0, 1, 2, 3, 4, 5, 6));
+ALTER TABLE route_nodes ADD CONSTRAINT check_route_node_status CHECK (status IN (0, 1, 2, 3, 4, 5, 6));
+
+CREATE INDEX idx_outlet_active_priority_name_id
+    ON outlets (priority, name, id)
+    WHERE status = 0;
+
+DROP TYPE IF EXISTS outletpriority, outletstatus, orderstatus, orderpriority, boxsize, boxstatus, vehicletype, routestatus, nodestatus, deliveryresult;
+
+COMMIT;
@@ -0,0 +1,21 @@
+-- ============================================
+-- Hourly delivered-box rollup for route nodes
+-- ============================================
+-- Pre-aggregated per outlet and hour of arrival, so dashboards read a
+-- few rows per hour instead of scanning route_nodes. Refreshed with
+-- REFRESH MATERIALIZED VIEW CONCURRENTLY (needs the unique index).
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS route_node_hourly_deliveries AS
+SELECT
+    date_trunc('hour', arrival_time) AS bucket,
+    outlet_id,
+    count(*) AS stops,
+    sum(boxes_delivered) AS boxes_delivered,
+    sum(boxes_returned) AS boxes_returned
+FROM route_nodes
+WHERE arrival_time IS NOT NULL
+GROUP BY 1, 2
+WITH DATA;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_route_node_hourly_bucket_outlet
+    ON route_node_hourly_deliveries (bucket, outlet_id);
@@ -0,0 +1,36 @@
+-- ============================================
+-- Generated service time / delay / duration columns
+-- ============================================
+-- Whole minutes, truncated, computed by PostgreSQL from the timestamps.
+-- route_nodes.service_time_minutes was a plain column written by the
+-- app; it is recreated as a generated column.
+
+BEGIN;
+
+ALTER TABLE route_nodes DROP COLUMN IF EXISTS service_time_minutes;
+
+ALTER TABLE route_nodes
+    ADD COLUMN service_time_minutes integer
+        GENERATED ALWAYS AS (
+            trunc(EXTRACT(EPOCH FROM (departure_time - arrival_time)) / 60)::int
+        ) STORED,
+    ADD COLUMN IF NOT EXISTS delay_minutes integer
+        GENERATED ALWAYS AS (
+            trunc(EXTRACT(EPOCH FROM (arrival_time - planned_arrival_time)) / 60)::int
+        ) STORED;
+
+ALTER TABLE routes
+    ADD COLUMN IF NOT EXISTS actual_duration_minutes integer
+        GENERATED ALWAYS AS (
+            trunc(EXTRACT(EPOCH FROM (actual_end_time - actual_start_time)) / 60)::int
+        ) STORED;
+
+COMMENT ON COLUMN route_nodes.service_time_minutes IS 'Time spent at stop (generated)';
+COMMENT ON COLUMN route_nodes.delay_minutes IS 'Arrival delay versus ETA (generated)';
+COMMENT ON COLUMN routes.actual_duration_minutes IS 'Actual route duration (generated)';
+
+CREATE INDEX IF NOT EXISTS idx_route_node_late_arrivals
+    ON route_nodes (outlet_id, arrival_time)
+    WHERE delay_minutes > 15;
+
+COMMIT;
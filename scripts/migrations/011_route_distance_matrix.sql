@@ -0,0 +1,10 @@
+-- ============================================
+-- Cached quantized distance matrix on routes
+-- ============================================
+-- Row-major uint16 cells, in units of distance_matrix_scale_m metres.
+
+ALTER TABLE routes
+    ADD COLUMN IF NOT EXISTS distance_matrix bytea,
+    ADD COLUMN IF NOT EXISTS distance_matrix_scale_m integer;
+
+COMMENT ON COLUMN routes.distance_matrix IS 'Quantized uint16 distance matrix';
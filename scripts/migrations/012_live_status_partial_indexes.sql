@@ -0,0 +1,19 @@
+-- ============================================
+-- Partial indexes for "active work" subsets
+-- ============================================
+-- Status codes are the SMALLINT codes from migration 008.
+-- orders: PENDING, CONFIRMED, PACKING, PACKED, IN_TRANSIT
+-- route_nodes: everything except COMPLETED, FAILED, SKIPPED
+-- routes: PLANNED, ASSIGNED, IN_PROGRESS
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_order_active
+    ON orders (outlet_id, requested_delivery_date)
+    WHERE status IN (0, 1, 2, 3, 4);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_route_node_live
+    ON route_nodes (route_id, sequence_order)
+    WHERE status NOT IN (4, 5, 6);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_route_live_date
+    ON routes (planned_date)
+    WHERE status IN (1, 2, 3);
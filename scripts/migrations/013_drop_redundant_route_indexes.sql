@@ -0,0 +1,9 @@
+-- ============================================
+-- Drop redundant single-column route indexes
+-- ============================================
+-- idx_route_driver_date (driver_id, planned_date) and
+-- idx_route_vehicle_date (vehicle_id, planned_date) already serve
+-- equality lookups on driver_id / vehicle_id.
+
+DROP INDEX CONCURRENTLY IF EXISTS ix_routes_driver_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_routes_vehicle_id;
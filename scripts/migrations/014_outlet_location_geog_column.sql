@@ -0,0 +1,15 @@
+-- ============================================
+-- Stored geography column for outlets
+-- ============================================
+-- Replaces the geography expression index from migration 001 with a
+-- generated column, so radius searches and KNN ordering read a stored
+-- value instead of casting location for every row.
+
+ALTER TABLE outlets
+    ADD COLUMN IF NOT EXISTS location_geog geography(Point, 4326)
+        GENERATED ALWAYS AS (location::geography(Point, 4326)) STORED;
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_outlet_location_geog;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_outlet_location_geog
+    ON outlets USING GIST (location_geog);
@@ -0,0 +1,20 @@
+-- ============================================
+-- Generated completion / fuel efficiency columns on routes
+-- ============================================
+-- Route responses and dashboard averages read these stored values
+-- instead of dividing per row in Python.
+
+ALTER TABLE routes
+    ADD COLUMN IF NOT EXISTS completion_pct double precision NOT NULL
+        GENERATED ALWAYS AS (
+            CASE WHEN planned_stops = 0 THEN 0
+            ELSE 100.0 * completed_stops / planned_stops END
+        ) STORED,
+    ADD COLUMN IF NOT EXISTS fuel_efficiency double precision
+        GENERATED ALWAYS AS (
+            CASE WHEN fuel_consumed_liters > 0 AND actual_distance_km > 0
+            THEN actual_distance_km / fuel_consumed_liters::double precision END
+        ) STORED;
+
+COMMENT ON COLUMN routes.completion_pct IS 'Completed stops as a percentage of planned (generated)';
+COMMENT ON COLUMN routes.fuel_efficiency IS 'Actual km per litre (generated)';
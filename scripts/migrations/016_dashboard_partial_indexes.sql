@@ -0,0 +1,19 @@
+-- ============================================
+-- Partial indexes for dashboard aggregates
+-- ============================================
+-- Status codes are the SMALLINT codes from migration 008.
+-- orders: DELIVERED = 5, CANCELLED = 7
+-- route_nodes: COMPLETED = 4
+-- routes (status, planned_date) is already covered by idx_route_date_status.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_order_delivered_date
+    ON orders (actual_delivery_date)
+    WHERE status = 5;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_order_cancelled_updated
+    ON orders (updated_at)
+    WHERE status = 7;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_route_node_completed_service
+    ON route_nodes (service_time_minutes)
+    WHERE status = 4;
@@ -0,0 +1,29 @@
+-- ============================================
+-- Fuel readings: NUMERIC -> DOUBLE PRECISION
+-- ============================================
+-- Fuel volumes are sensor readings, not money. routes.fuel_efficiency
+-- (migration 015) reads fuel_consumed_liters, and a column used by a
+-- generated column cannot change type, so it is dropped and re-added.
+
+BEGIN;
+
+ALTER TABLE routes DROP COLUMN IF EXISTS fuel_efficiency;
+
+ALTER TABLE routes
+    ALTER COLUMN fuel_start_liters TYPE double precision USING fuel_start_liters::double precision,
+    ALTER COLUMN fuel_end_liters TYPE double precision USING fuel_end_liters::double precision,
+    ALTER COLUMN fuel_consumed_liters TYPE double precision USING fuel_consumed_liters::double precision;
+
+ALTER TABLE routes
+    ADD COLUMN fuel_efficiency double precision
+        GENERATED ALWAYS AS (
+            CASE WHEN fuel_consumed_liters > 0 AND actual_distance_km > 0
+            THEN actual_distance_km / fuel_consumed_liters END
+        ) STORED;
+
+COMMENT ON COLUMN routes.fuel_efficiency IS 'Actual km per litre (generated)';
+
+ALTER TABLE route_nodes
+    ALTER COLUMN fuel_consumed_liters TYPE double precision USING fuel_consumed_liters::double precision;
+
+COMMIT;
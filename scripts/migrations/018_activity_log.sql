@@ -0,0 +1,110 @@
+-- ============================================
+-- Activity log for the dashboard feed
+-- ============================================
+-- entity_type codes: ORDER = 0, ROUTE = 1, OUTLET = 2
+-- orders: DELIVERED = 5
+-- routes: IN_PROGRESS = 3, COMPLETED = 4
+-- Keep the trigger bodies in sync with app/models/activity_log.py.
+-- Every write is logged; the app prunes rows older than
+-- ACTIVITY_LOG_RETENTION_DAYS (app/services/activity_service.py).
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS activity_log (
+    id BIGSERIAL PRIMARY KEY,
+    entity_type SMALLINT NOT NULL,
+    entity_id INTEGER NOT NULL,
+    action VARCHAR(20) NOT NULL,
+    description VARCHAR(300) NOT NULL,
+    ts TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT timezone('utc', now()),
+    CONSTRAINT check_activity_log_entity_type CHECK (entity_type IN (0, 1, 2))
+);
+
+CREATE INDEX IF NOT EXISTS idx_activity_log_ts ON activity_log (ts DESC);
+
+CREATE OR REPLACE FUNCTION log_order_activity() RETURNS trigger AS $$
+DECLARE
+    act text := CASE
+        WHEN NEW.status = 5 AND (TG_OP = 'INSERT' OR OLD.status IS DISTINCT FROM NEW.status) THEN 'delivered'
+        WHEN TG_OP = 'INSERT' THEN 'created'
+        ELSE 'updated'
+    END;
+BEGIN
+    INSERT INTO activity_log (entity_type, entity_id, action, description)
+    VALUES (0, NEW.id, act, 'Order ' || NEW.order_number || ' ' || act);
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE TRIGGER trg_orders_activity_insert
+    AFTER INSERT ON orders
+    FOR EACH ROW EXECUTE FUNCTION log_order_activity();
+
+CREATE OR REPLACE TRIGGER trg_orders_activity_update
+    AFTER UPDATE ON orders
+    FOR EACH ROW WHEN (OLD.* IS DISTINCT FROM NEW.*)
+    EXECUTE FUNCTION log_order_activity();
+
+CREATE OR REPLACE FUNCTION log_route_activity() RETURNS trigger AS $$
+DECLARE
+    act text := CASE
+        WHEN NEW.status = 4 AND (TG_OP = 'INSERT' OR OLD.status IS DISTINCT FROM NEW.status) THEN 'completed'
+        WHEN NEW.status = 3 AND (TG_OP = 'INSERT' OR OLD.status IS DISTINCT FROM NEW.status) THEN 'started'
+        WHEN TG_OP = 'INSERT' THEN 'created'
+        ELSE 'updated'
+    END;
+BEGIN
+    INSERT INTO activity_log (entity_type, entity_id, action, description)
+    VALUES (1, NEW.id, act, 'Route ' || NEW.route_code || ' ' || act);
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE TRIGGER trg_routes_activity_insert
+    AFTER INSERT ON routes
+    FOR EACH ROW EXECUTE FUNCTION log_route_activity();
+
+CREATE OR REPLACE TRIGGER trg_routes_activity_update
+    AFTER UPDATE ON routes
+    FOR EACH ROW WHEN (OLD.* IS DISTINCT FROM NEW.*)
+    EXECUTE FUNCTION log_route_activity();
+
+CREATE OR REPLACE FUNCTION log_outlet_activity() RETURNS trigger AS $$
+DECLARE
+    act text := CASE WHEN TG_OP = 'INSERT' THEN 'created' ELSE 'updated' END;
+BEGIN
+    INSERT INTO activity_log (entity_type, entity_id, action, description)
+    VALUES (2, NEW.id, act, 'Outlet ' || NEW.name || ' ' || act);
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE TRIGGER trg_outlets_activity_insert
+    AFTER INSERT ON outlets
+    FOR EACH ROW EXECUTE FUNCTION log_outlet_activity();
+
+CREATE OR REPLACE TRIGGER trg_outlets_activity_update
+    AFTER UPDATE ON outlets
+    FOR EACH ROW WHEN (OLD.* IS DISTINCT FROM NEW.*)
+    EXECUTE FUNCTION log_outlet_activity();
+
+-- Seed the feed with each table's most recently touched rows
+INSERT INTO activity_log (entity_type, entity_id, action, description, ts)
+SELECT entity_type, entity_id, action, label || ' ' || action, ts
+FROM (
+    (SELECT 0 AS entity_type, id AS entity_id,
+            CASE WHEN status = 5 THEN 'delivered' ELSE 'updated' END AS action,
+            'Order ' || order_number AS label, updated_at AS ts
+     FROM orders ORDER BY updated_at DESC LIMIT 50)
+    UNION ALL
+    (SELECT 1, id,
+            CASE WHEN status = 4 THEN 'completed' WHEN status = 3 THEN 'started' ELSE 'updated' END,
+            'Route ' || route_code, updated_at
+     FROM routes ORDER BY updated_at DESC LIMIT 50)
+    UNION ALL
+    (SELECT 2, id, 'updated', 'Outlet ' || name, updated_at
+     FROM outlets ORDER BY updated_at DESC LIMIT 50)
+) recent
+WHERE NOT EXISTS (SELECT 1 FROM activity_log);
+
+COMMIT;
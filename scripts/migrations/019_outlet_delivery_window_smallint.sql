@@ -0,0 +1,9 @@
+-- ============================================
+-- Delivery window minutes as SMALLINT
+-- ============================================
+-- Minutes from midnight never exceed 1440, so 2 bytes per column
+-- instead of 4. Rewrites the outlets table; run off-peak.
+
+ALTER TABLE outlets
+    ALTER COLUMN delivery_window_start TYPE smallint,
+    ALTER COLUMN delivery_window_end TYPE smallint;
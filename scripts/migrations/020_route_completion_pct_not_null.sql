@@ -0,0 +1,8 @@
+-- ============================================
+-- completion_pct NOT NULL on databases migrated before 015 declared it
+-- ============================================
+-- planned_stops and completed_stops are NOT NULL, so the generated value
+-- never is; matches the Route model (and create_all). No-op if already set.
+
+ALTER TABLE routes
+    ALTER COLUMN completion_pct SET NOT NULL;
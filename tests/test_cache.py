@@ -0,0 +1,144 @@
+"""
+Tests for the Redis response cache middleware.
+"""
+import time
+
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.core.cache import CacheMiddleware, cache_key, ttl_for_path
+
+
+class MemoryCache:
+    """In-process stand-in with the ResponseCache interface."""
+
+    def __init__(self):
+        self.entries = {}
+
+    async def get(self, key):
+        return self.entries.get(key)
+
+    async def set(self, key, status, headers, body, ttl):
+        now = time.time()
+        self.entries[key] = {
+            "status": status,
+            "headers": headers,
+            "body": body,
+            "generated_at": now,
+            "stale_at": now + ttl,
+        }
+
+    async def invalidate(self, key):
+        self.entries.pop(key, None)
+
+
+PATH = "/api/v1/outlets/1"
+
+
+@pytest.fixture
+def calls():
+    return {"get": 0, "put": 0}
+
+
+@pytest.fixture
+def cache():
+    return MemoryCache()
+
+
+@pytest.fixture
+def client(calls, cache):
+    async def outlet(request):
+        if request.method == "PUT":
+            calls["put"] += 1
+            status = int(request.query_params.get("status", 200))
+            return JSONResponse({"updated": True}, status_code=status)
+        calls["get"] += 1
+        return JSONResponse({"id": 1, "calls": calls["get"]})
+
+    async def no_store(request):
+        calls["get"] += 1
+        return JSONResponse({"mock": True}, headers={"Cache-Control": "no-store"})
+
+    async def failing(request):
+        calls["get"] += 1
+        return JSONResponse({"error": "db"}, status_code=503)
+
+    app = Starlette(routes=[
+        Route(PATH, outlet, methods=["GET", "PUT"]),
+        Route("/api/v1/dashboard/mock", no_store),
+        Route("/api/v1/dashboard/failing", failing),
+        Route("/api/v1/uncached", outlet),
+    ])
+    app.add_middleware(CacheMiddleware, cache=cache)
+    return TestClient(app)
+
+
+def test_ttl_policies():
+    assert ttl_for_path("/api/v1/dashboard/recent-activities") == 10
+    assert ttl_for_path("/api/v1/dashboard/overview") == 30
+    assert ttl_for_path("/api/v1/outlets/42") == 60
+    assert ttl_for_path("/api/v1/outlets") is None
+
+
+def test_cache_key_includes_query_string():
+    assert cache_key(PATH, b"a=1") != cache_key(PATH, b"a=2")
+
+
+def test_miss_then_hit(client, calls):
+    first = client.get(PATH)
+    assert first.headers["x-cache"] == "MISS"
+    second = client.get(PATH)
+    assert second.headers["x-cache"] == "HIT"
+    assert second.json() == first.json()
+    assert calls["get"] == 1
+
+
+def test_expired_entry_is_refreshed(client, cache, calls):
+    client.get(PATH)
+    for entry in cache.entries.values():
+        entry["stale_at"] = time.time() - 1
+    response = client.get(PATH)
+    assert response.headers["x-cache"] == "MISS"
+    assert calls["get"] == 2
+
+
+def test_no_store_responses_are_not_cached(client, cache, calls):
+    client.get("/api/v1/dashboard/mock")
+    client.get("/api/v1/dashboard/mock")
+    assert cache.entries == {}
+    assert calls["get"] == 2
+
+
+def test_error_responses_are_not_cached(client, cache):
+    client.get("/api/v1/dashboard/failing")
+    assert cache.entries == {}
+
+
+def test_uncacheable_path_passes_through(client, cache):
+    response = client.get("/api/v1/uncached")
+    assert "x-cache" not in response.headers
+    assert cache.entries == {}
+
+
+def test_successful_write_invalidates(client, cache, calls):
+    client.get(PATH)
+    client.put(PATH)
+    assert cache.entries == {}
+    assert client.get(PATH).headers["x-cache"] == "MISS"
+    assert calls["get"] == 2
+
+
+def test_failed_write_keeps_entry(client, cache):
+    client.get(PATH)
+    client.put(PATH, params={"status": 409})
+    assert client.get(PATH).headers["x-cache"] == "HIT"
+
+
+def test_non_write_methods_do_not_invalidate(client, cache):
+    client.get(PATH)
+    client.options(PATH)
+    client.head(PATH)
+    assert client.get(PATH).headers["x-cache"] == "HIT"
@@ -0,0 +1,47 @@
+"""
+Tests for distance matrix quantization and Route matrix storage.
+"""
+import numpy as np
+import pytest
+
+from app.models.route import Route
+from app.optim.distance import dequantize_distances, pairwise_haversine, quantize_distances
+
+
+def test_quantize_uses_metre_resolution_for_short_legs():
+    distances = np.array([[0.0, 1.2344], [1.2344, 0.0]])
+    quantized, scale_m = quantize_distances(distances)
+    assert quantized.dtype == np.uint16
+    assert scale_m == 1
+    assert quantized[0, 1] == 1234
+
+
+def test_quantize_scales_up_for_long_legs():
+    distances = np.array([[0.0, 500.0], [500.0, 0.0]])
+    quantized, scale_m = quantize_distances(distances)
+    assert scale_m == 8
+    assert quantized[0, 1] == 62500
+    restored = dequantize_distances(quantized, scale_m)
+    assert restored[0, 1] == pytest.approx(500.0, abs=scale_m / 1000)
+
+
+def test_quantize_empty_matrix():
+    quantized, scale_m = quantize_distances(np.zeros((0, 0)))
+    assert quantized.shape == (0, 0)
+    assert scale_m == 1
+
+
+def test_route_distance_matrix_round_trip():
+    lat = [-1.29, -1.30, -1.25]
+    lng = [36.82, 36.90, 36.75]
+    distances = pairwise_haversine(lat, lng)
+    route = Route()
+    route.set_distance_matrix(distances)
+    assert route.get_distance_matrix().shape == (3, 3)
+    np.testing.assert_allclose(route.get_distance_matrix_km(), distances, atol=0.001)
+
+
+@pytest.mark.parametrize("shape", [(6,), (2, 3), (2, 2, 2)])
+def test_route_rejects_non_square_matrix(shape):
+    with pytest.raises(ValueError):
+        Route().set_distance_matrix(np.ones(shape))
@@ -0,0 +1,87 @@
+"""
+Tests for ETag / If-None-Match revalidation.
+"""
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.core.etag import ETAG_MAX_AGE, ETagMiddleware, compute_etag, etag_matches
+
+
+@pytest.fixture
+def client():
+    async def overview(request):
+        return JSONResponse({"orders": 3})
+
+    async def streamed(request):
+        async def chunks():
+            yield b'{"a":'
+            yield b"1}"
+        return StreamingResponse(chunks(), media_type="application/json")
+
+    async def no_store(request):
+        return JSONResponse({"mock": True}, headers={"Cache-Control": "no-store"})
+
+    async def failing(request):
+        return JSONResponse({"error": "db"}, status_code=503)
+
+    app = Starlette(routes=[
+        Route("/api/v1/dashboard/overview", overview),
+        Route("/api/v1/dashboard/streamed", streamed),
+        Route("/api/v1/dashboard/mock", no_store),
+        Route("/api/v1/dashboard/failing", failing),
+        Route("/api/v1/outlets", overview),
+    ])
+    app.add_middleware(ETagMiddleware, path_prefixes=("/api/v1/dashboard/",))
+    return TestClient(app)
+
+
+def test_etag_matches():
+    etag = compute_etag(b"body")
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches('"other"', etag)
+
+
+def test_adds_etag_and_cache_control(client):
+    response = client.get("/api/v1/dashboard/overview")
+    assert response.status_code == 200
+    assert response.headers["etag"] == compute_etag(response.content)
+    assert response.headers["cache-control"] == f"max-age={ETAG_MAX_AGE}, must-revalidate"
+    assert response.headers["content-length"] == str(len(response.content))
+
+
+def test_matching_if_none_match_returns_304(client):
+    etag = client.get("/api/v1/dashboard/overview").headers["etag"]
+    response = client.get("/api/v1/dashboard/overview", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+def test_stale_if_none_match_returns_body(client):
+    response = client.get("/api/v1/dashboard/overview", headers={"If-None-Match": '"stale"'})
+    assert response.status_code == 200
+    assert response.json() == {"orders": 3}
+
+
+def test_streamed_body_is_hashed_whole(client):
+    response = client.get("/api/v1/dashboard/streamed")
+    assert response.content == b'{"a":1}'
+    assert response.headers["etag"] == compute_etag(b'{"a":1}')
+
+
+def test_existing_cache_control_passes_through(client):
+    response = client.get("/api/v1/dashboard/mock", headers={"If-None-Match": "*"})
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "no-store"
+    assert "etag" not in response.headers
+
+
+def test_error_and_unlisted_paths_pass_through(client):
+    assert "etag" not in client.get("/api/v1/dashboard/failing").headers
+    assert "etag" not in client.get("/api/v1/outlets").headers
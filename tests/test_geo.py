@@ -0,0 +1,51 @@
+"""
+Tests for PostGIS point construction and decoding.
+"""
+import struct
+
+from geoalchemy2.elements import WKBElement
+from geoalchemy2.shape import from_shape, to_shape
+from shapely.geometry import Point
+
+from app.core.config import settings
+from app.core.geo import cached_point_xy, make_point, point_xy
+
+
+def test_make_point_is_ewkb_with_srid():
+    element = make_point(36.82, -1.29)
+    assert element.srid == settings.SRID
+    assert len(element.data) == 25
+    point = to_shape(element)
+    assert (point.x, point.y) == (36.82, -1.29)
+
+
+def test_point_xy_reads_ewkb():
+    assert point_xy(make_point(36.82, -1.29)) == (36.82, -1.29)
+
+
+def test_point_xy_reads_plain_wkb():
+    element = from_shape(Point(10.5, -20.25), srid=settings.SRID)
+    assert point_xy(element) == (10.5, -20.25)
+
+
+def test_point_xy_reads_big_endian_wkb():
+    raw = struct.pack(">BIdd", 0, 1, 1.5, 2.5)
+    assert point_xy(WKBElement(raw)) == (1.5, 2.5)
+
+
+def test_point_xy_none():
+    assert point_xy(None) is None
+
+
+class Holder:
+    def __init__(self, location):
+        self.location = location
+
+
+def test_cached_point_xy_follows_reassignment():
+    holder = Holder(make_point(1.0, 2.0))
+    assert cached_point_xy(holder, "location") == (1.0, 2.0)
+    holder.location = make_point(3.0, 4.0)
+    assert cached_point_xy(holder, "location") == (3.0, 4.0)
+    holder.location = None
+    assert cached_point_xy(holder, "location") is None
@@ -0,0 +1,31 @@
+"""
+Tests for Outlet coordinate accessors.
+"""
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.models import Outlet
+
+
+def _loaded_outlet(latitude, longitude):
+    outlet = Outlet()
+    set_committed_value(outlet, "id", 1)
+    set_committed_value(outlet, "location", Outlet.create_location(latitude, longitude))
+    set_committed_value(outlet, "lat", latitude)
+    set_committed_value(outlet, "lng", longitude)
+    return outlet
+
+
+def test_gps_coords_use_stored_columns():
+    outlet = _loaded_outlet(-1.0, 36.0)
+    assert (outlet.gps_lat, outlet.gps_long) == (-1.0, 36.0)
+
+
+def test_gps_coords_follow_reassigned_location():
+    outlet = _loaded_outlet(-1.0, 36.0)
+    outlet.location = Outlet.create_location(-2.5, 37.5)
+    assert (outlet.gps_lat, outlet.gps_long) == (-2.5, 37.5)
+
+
+def test_gps_coords_for_transient_outlet():
+    outlet = Outlet(location=Outlet.create_location(-3.0, 38.0))
+    assert (outlet.gps_lat, outlet.gps_long) == (-3.0, 38.0)
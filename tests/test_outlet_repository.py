@@ -0,0 +1,60 @@
+"""
+Tests for the find_nearby bounding-box prefilter.
+"""
+import math
+
+import pytest
+
+from app.optim.distance import EARTH_RADIUS_KM, pairwise_haversine
+from app.repositories.outlet_repository import _bbox_half_widths
+
+
+def _destination(latitude, longitude, bearing_deg, distance_km):
+    """Point distance_km from (latitude, longitude) along bearing_deg."""
+    lat1 = math.radians(latitude)
+    lng1 = math.radians(longitude)
+    bearing = math.radians(bearing_deg)
+    angle = distance_km / EARTH_RADIUS_KM
+    lat2 = math.asin(
+        math.sin(lat1) * math.cos(angle)
+        + math.cos(lat1) * math.sin(angle) * math.cos(bearing)
+    )
+    lng2 = lng1 + math.atan2(
+        math.sin(bearing) * math.sin(angle) * math.cos(lat1),
+        math.cos(angle) - math.sin(lat1) * math.sin(lat2)
+    )
+    return math.degrees(lat2), math.degrees(lng2)
+
+
+@pytest.mark.parametrize("latitude, longitude, radius_km", [
+    (-1.29, 36.82, 5.0),
+    (-1.29, 36.82, 250.0),
+    (60.0, 10.0, 100.0),
+    (85.0, 0.0, 200.0),
+    (89.0, 0.0, 100.0),
+    (-70.0, 170.0, 300.0),
+])
+def test_bbox_contains_whole_circle(latitude, longitude, radius_km):
+    deg_lng, deg_lat = _bbox_half_widths(latitude, longitude, radius_km)
+    for bearing in range(0, 360, 5):
+        lat, lng = _destination(latitude, longitude, bearing, radius_km)
+        assert abs(lat - latitude) <= deg_lat
+        assert abs(lng - longitude) <= deg_lng
+
+
+def test_bbox_skipped_across_antimeridian():
+    # ~17 km apart, on opposite sides of the ±180° meridian
+    distance = pairwise_haversine([0.0, 0.0], [179.9, -179.95])[0, 1]
+    assert distance < 50.0
+    assert _bbox_half_widths(0.0, 179.9, 50.0) is None
+    assert _bbox_half_widths(0.0, -179.95, 50.0) is None
+
+
+def test_bbox_skipped_when_circle_reaches_pole():
+    # The pole is ~111 km from latitude 89
+    assert _bbox_half_widths(89.0, 0.0, 150.0) is None
+    assert _bbox_half_widths(-89.5, 120.0, 100.0) is None
+
+
+def test_bbox_skipped_for_hemisphere_radius():
+    assert _bbox_half_widths(0.0, 0.0, 15_000.0) is None
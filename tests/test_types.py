@@ -0,0 +1,65 @@
+"""
+Tests for SmallIntEnum column codes.
+"""
+import enum
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.core.types import SmallIntEnum, enum_check
+from app.models.order import OrderStatus
+from app.models.outlet import OutletPriority
+from app.models.route import RouteStatus
+
+DIALECT = postgresql.dialect()
+
+
+class Colour(enum.Enum):
+    RED = "red"
+    GREEN = "green"
+    BLUE = "blue"
+
+
+@pytest.mark.parametrize("enum_class", [Colour, OutletPriority, OrderStatus, RouteStatus])
+def test_round_trip(enum_class):
+    column_type = SmallIntEnum(enum_class)
+    for member in enum_class:
+        code = column_type.process_bind_param(member, DIALECT)
+        assert code == column_type.code(member)
+        assert column_type.process_result_value(code, DIALECT) is member
+
+
+def test_string_enums_use_declaration_index():
+    column_type = SmallIntEnum(Colour)
+    assert [column_type.code(m) for m in Colour] == [0, 1, 2]
+
+
+def test_int_enums_use_their_value():
+    column_type = SmallIntEnum(OutletPriority)
+    assert column_type.code(OutletPriority.CRITICAL) == 1
+    assert column_type.code(OutletPriority.DEFERRED) == 5
+
+
+def test_stored_codes_match_migrations():
+    # Migrations 008 and 018 hard-code these values
+    assert SmallIntEnum(OrderStatus).code(OrderStatus.DELIVERED) == 5
+    assert SmallIntEnum(RouteStatus).code(RouteStatus.IN_PROGRESS) == 3
+    assert SmallIntEnum(RouteStatus).code(RouteStatus.COMPLETED) == 4
+
+
+def test_bind_accepts_raw_values_and_none():
+    column_type = SmallIntEnum(Colour)
+    assert column_type.process_bind_param("green", DIALECT) == 1
+    assert column_type.process_bind_param(None, DIALECT) is None
+    assert column_type.process_result_value(None, DIALECT) is None
+    assert column_type.process_literal_param(Colour.BLUE, DIALECT) == "2"
+
+
+def test_bind_rejects_unknown_values():
+    with pytest.raises(ValueError):
+        SmallIntEnum(Colour).process_bind_param("purple", DIALECT)
+
+
+def test_check_constraint_lists_every_code():
+    assert SmallIntEnum(Colour).check_sql("colour") == "colour IN (0, 1, 2)"
+    assert str(enum_check("colour", Colour, name="check_colour").sqltext) == "colour IN (0, 1, 2)"
@@ -0,0 +1,34 @@
+"""
+Tests for the Cloudflare Workers request helpers.
+"""
+import json
+
+import pytest
+
+from app.workers_main import STATIC_BODIES, handle_not_found, not_found_body, request_path
+
+
+@pytest.mark.parametrize("url, path", [
+    ("https://api.example.dev", "/"),
+    ("https://api.example.dev/", "/"),
+    ("https://api.example.dev/health", "/health"),
+    ("https://api.example.dev/health/", "/health"),
+    ("https://api.example.dev/api/v1/status?x=1", "/api/v1/status"),
+    ("https://api.example.dev/api/v1/status#top", "/api/v1/status"),
+    ("https://api.example.dev?next=/health", "/"),
+    ("https://api.example.dev#/health", "/"),
+    ("https://api.example.dev//", "/"),
+])
+def test_request_path(url, path):
+    assert request_path(url) == path
+
+
+@pytest.mark.parametrize("path", ["/missing", '/quote"d', "/back\\slash", "/ünï"])
+def test_not_found_body_matches_handler(path):
+    assert json.loads(not_found_body(path)) == handle_not_found(path)
+
+
+def test_static_bodies_are_json():
+    for body in STATIC_BODIES.values():
+        assert isinstance(body, str)
+        json.loads(body)